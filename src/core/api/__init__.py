@@ -6,10 +6,35 @@ from .handlers import (
     CurseForgeAPI,
     APIConfig
 )
+from .models import ModpackSummary
+from .http_client import HttpClient, get_http_client
+from .rate_limit import AdaptiveLimiter
+from .retry import RetryPolicy, CircuitBreaker, CircuitOpenError, get_circuit_breaker, get_retry_policy
+from .async_client import (
+    AsyncHttpClient,
+    AsyncMinecraftAPI,
+    AsyncModrinthAPI,
+    AsyncCurseForgeAPI,
+    gather_limited
+)
 
 __all__ = [
     "MinecraftAPIHandler",
     "ModrinthAPI",
     "CurseForgeAPI",
-    "APIConfig"
+    "APIConfig",
+    "ModpackSummary",
+    "HttpClient",
+    "get_http_client",
+    "AdaptiveLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "get_retry_policy",
+    "AsyncHttpClient",
+    "AsyncMinecraftAPI",
+    "AsyncModrinthAPI",
+    "AsyncCurseForgeAPI",
+    "gather_limited"
 ]
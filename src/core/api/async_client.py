@@ -0,0 +1,654 @@
+"""asyncio client for the Modrinth, CurseForge and Mojang APIs"""
+
+import os
+import json
+import uuid
+import asyncio
+import hashlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+import requests
+
+from ..config import EndpointConfig, get_endpoint_config
+from .handlers import MinecraftAPIHandler, ModrinthAPI, CurseForgeAPI
+from .models import ModpackSummary
+from .http_client import HttpClient, RateLimitedError, get_http_client
+from .retry import CircuitOpenError, RetryPolicy, get_circuit_breaker, get_retry_policy
+from .single_flight import SingleFlight
+
+
+class AsyncHttpClient:
+    """
+    asyncio counterpart of HttpClient
+
+    Same endpoint fallback, per-host AIMD limiters (shared with the blocking
+    client), retry policy and circuit breakers. Every request runs on the
+    event loop with aiohttp (a requirement), so thousands of metadata calls
+    or downloads cost coroutines instead of OS threads. If aiohttp is missing
+    anyway, the same API falls back to the blocking client on worker threads.
+
+    Timeouts are per call (seconds); cancelling the awaiting task cancels the
+    request (in thread mode the worker finishes in the background and its
+    result is discarded).
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    DEFAULT_TIMEOUT = 30.0
+    CONNECT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        endpoints: Optional[EndpointConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100
+    ):
+        self.endpoints = endpoints or get_endpoint_config()
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.max_connections = max_connections
+        self.sync = get_http_client()
+        self._session = None
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Closes the aiohttp session (no-op in thread mode)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+        return self._session
+
+    @staticmethod
+    def _is_host_failure(error: Exception) -> bool:
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def _acquire(self, url: str):
+        limiter = self.sync.limiter_for(url)
+        loop = asyncio.get_running_loop()
+        while True:
+            freed = asyncio.Event()
+            wait = limiter.try_acquire(lambda: loop.call_soon_threadsafe(freed.set))
+            if wait is None:
+                # Window full: woken by the next release, from any thread or loop
+                await freed.wait()
+                continue
+            if wait == 0:
+                return limiter
+            if wait > HttpClient.MAX_RATE_LIMIT_WAIT:
+                raise RateLimitedError(f"Rate limited by {urlparse(url).netloc}, try again later")
+            await asyncio.sleep(wait)
+
+    async def _send(self, method: str, url: str, timeout, **kwargs):
+        """One URL through breaker, limiter and retries; returns an open aiohttp response"""
+        breaker = get_circuit_breaker(url)
+        retryable = method.upper() in RetryPolicy.IDEMPOTENT_METHODS
+        attempt = 0
+        rate_limit_retries = 0
+
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"{urlparse(url).netloc} is failing, request skipped until it recovers")
+            try:
+                limiter = await self._acquire(url)
+            except BaseException:
+                breaker.release_probe()
+                raise
+
+            try:
+                response = await self._get_session().request(method, url, timeout=timeout, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.release()
+                if self._is_host_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release_probe()
+                attempt += 1
+                if retryable and attempt < self.retry_policy.max_attempts:
+                    await asyncio.sleep(self.retry_policy.backoff(attempt))
+                    continue
+                raise
+            except BaseException:
+                # Cancelled while connecting
+                limiter.release()
+                breaker.release_probe()
+                raise
+
+            status = response.status
+            limiter.release(status, response.headers)
+            if RetryPolicy.is_host_failure(status=status):
+                breaker.record_failure()
+            elif status < 400:
+                breaker.record_success()
+            else:
+                breaker.release_probe()
+
+            if status == 429 and rate_limit_retries < HttpClient.MAX_RATE_LIMIT_RETRIES:
+                response.release()
+                rate_limit_retries += 1
+                continue
+            if retryable and status in RetryPolicy.RETRYABLE_STATUS and attempt + 1 < self.retry_policy.max_attempts:
+                response.release()
+                attempt += 1
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                continue
+            return response
+
+    async def _request(self, method: str, path: str, endpoint: Optional[str], timeout, **kwargs):
+        """Resolves the endpoint mirrors and returns the first usable open response"""
+        if endpoint is None:
+            return await self._send(method, path, timeout, **kwargs)
+
+        bases = self.endpoints.get_urls(endpoint)
+        last_error: Optional[BaseException] = None
+        for i, base in enumerate(bases):
+            try:
+                response = await self._send(method, f"{base}{path}", timeout, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError, requests.RequestException) as e:
+                last_error = e
+                continue
+            if response.status >= 500 and i < len(bases) - 1:
+                response.release()
+                continue
+            return response
+        raise last_error or requests.ConnectionError(f"No URLs configured for endpoint '{endpoint}'")
+
+    async def _fetch_json(self, method: str, path: str, endpoint: Optional[str], timeout: float, **kwargs):
+        if not AIOHTTP_AVAILABLE:
+            call = self.sync.get_json if method == "GET" else self._sync_post_json
+            return await asyncio.wait_for(
+                asyncio.to_thread(call, path, endpoint, timeout=timeout, **kwargs), timeout
+            )
+
+        response = await self._request(method, path, endpoint, aiohttp.ClientTimeout(total=timeout), **kwargs)
+        try:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+        finally:
+            response.release()
+
+    def _sync_post_json(self, path: str, endpoint: Optional[str], **kwargs):
+        response = self.sync.post(path, endpoint, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json(self, path: str, endpoint: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+        """
+        GET a JSON document; concurrent identical calls share one request
+
+        Args:
+            path: Path on the endpoint, or an absolute URL when endpoint is None
+            endpoint: Endpoint name from the endpoint configuration
+            timeout: Total seconds for the call
+            **kwargs: headers, params
+
+        Returns:
+            Parsed JSON (raises on HTTP/network errors)
+        """
+        key = SingleFlight.make_key("GET", endpoint, path, kwargs.get("params"), kwargs.get("headers"))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_json("GET", path, endpoint, timeout, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one waiter being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def post_json(self, path: str, endpoint: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+        """POST (json=...) and parse the JSON response"""
+        return await self._fetch_json("POST", path, endpoint, timeout, **kwargs)
+
+    async def download(
+        self,
+        urls: Union[str, List[str]],
+        dest_path: str,
+        sha1: Optional[str] = None,
+        timeout: float = 60.0,
+        headers: Optional[Dict] = None
+    ) -> bool:
+        """
+        Downloads a file, trying each candidate URL in order
+
+        The body is streamed to a staging file, verified against sha1 when
+        given, and moved into place atomically.
+
+        Args:
+            urls: URL or candidate URLs
+            dest_path: Destination path
+            sha1: Expected sha1 (optional)
+            timeout: Seconds without data before the download is considered stalled
+            headers: Extra request headers
+
+        Returns:
+            True if dest_path now holds the file
+        """
+        if isinstance(urls, str):
+            urls = [urls]
+        os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+
+        for url in urls:
+            tmp_path = f"{dest_path}.{uuid.uuid4().hex[:8]}.pycraft-part"
+            try:
+                if AIOHTTP_AVAILABLE:
+                    digest = await self._download_aiohttp(url, tmp_path, timeout, headers)
+                else:
+                    digest = await asyncio.to_thread(self._download_sync, url, tmp_path, timeout, headers)
+                if sha1 and digest != sha1.lower():
+                    raise ValueError(f"sha1 mismatch ({digest} != {sha1})")
+                os.replace(tmp_path, dest_path)
+                return True
+            except asyncio.CancelledError:
+                self._discard(tmp_path)
+                raise
+            except Exception as e:
+                print(f"Error downloading {url}: {type(e).__name__}: {e}")
+                self._discard(tmp_path)
+        return False
+
+    async def _download_aiohttp(self, url: str, tmp_path: str, timeout: float, headers: Optional[Dict]) -> str:
+        client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.CONNECT_TIMEOUT, sock_read=timeout)
+        response = await self._send("GET", url, client_timeout, headers=headers)
+        digest = hashlib.sha1()
+        try:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+        finally:
+            response.release()
+        return digest.hexdigest()
+
+    def _download_sync(self, url: str, tmp_path: str, timeout: float, headers: Optional[Dict]) -> str:
+        digest = hashlib.sha1()
+        response = self.sync.get(url, headers=headers, stream=True, timeout=(self.CONNECT_TIMEOUT, timeout))
+        with response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _discard(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+async def gather_limited(coros, limit: int = 64, return_exceptions: bool = True) -> List:
+    """
+    Runs coroutines concurrently with at most `limit` in flight
+
+    Args:
+        coros: Iterable of coroutines
+        limit: Maximum concurrently running coroutines
+        return_exceptions: Return exceptions as results instead of raising
+
+    Returns:
+        Results in input order
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=return_exceptions)
+
+
+class AsyncMinecraftAPI:
+    """asyncio version of MinecraftAPIHandler"""
+
+    def __init__(self, client: Optional[AsyncHttpClient] = None):
+        self.client = client or AsyncHttpClient()
+        self.sync = MinecraftAPIHandler()
+
+    async def get_all_versions(self) -> Optional[Dict]:
+        """Obtiene todas las versiones disponibles de Minecraft"""
+        try:
+            self.sync.versions_cache = await self.client.get_json("", "mojang_manifest", timeout=10)
+            return self.sync.versions_cache
+        except Exception as e:
+            print(f"Error al obtener versiones: {e}")
+            return None
+
+    async def get_server_jar_url(self, version_id: str) -> Optional[str]:
+        """Obtiene la URL del server.jar para una versión específica"""
+        try:
+            if not self.sync.versions_cache:
+                await self.get_all_versions()
+            version = next((v for v in self.sync.get_release_versions() if v.get("id") == version_id), None)
+            if not version or not version.get("url"):
+                return None
+            details = await self.client.get_json(version["url"], timeout=10)
+            return details.get("downloads", {}).get("server", {}).get("url")
+        except Exception as e:
+            print(f"Error al obtener URL del server: {e}")
+            return None
+
+
+class AsyncModrinthAPI:
+    """asyncio version of ModrinthAPI (results use the same formats)"""
+
+    def __init__(self, client: Optional[AsyncHttpClient] = None):
+        self.client = client or AsyncHttpClient()
+        self.sync = ModrinthAPI()
+
+    async def search_modpacks(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        side_filter: Optional[str] = None
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
+        """
+        Busca modpacks en Modrinth
+
+        The side filter is applied by Modrinth itself (facets), so paging and
+        totals are exact.
+
+        Returns:
+            Tuple de (lista de modpacks normalizados, total de resultados)
+        """
+        facets = [["project_type:modpack"]]
+        if side_filter in ("server", "client"):
+            facets.append([f"{side_filter}_side:required", f"{side_filter}_side:optional"])
+        params = {"query": query, "limit": limit, "offset": offset, "facets": json.dumps(facets)}
+        try:
+            data = await self.client.get_json("/search", "modrinth_api", headers=self.sync.headers, params=params, timeout=10)
+            return self.sync._normalize_modrinth_modpacks(data.get("hits", [])), data.get("total_hits", 0)
+        except Exception as e:
+            print(f"Error al buscar modpacks: {e}")
+            return None, 0
+
+    async def get_modpack_versions(
+        self,
+        project_id: str,
+        loaders: Optional[List[str]] = None,
+        game_versions: Optional[List[str]] = None,
+        include_changelog: bool = False
+    ) -> Optional[List[Dict]]:
+        """Obtiene las versiones disponibles de un modpack (filtradas en el servidor)"""
+        params = {"include_changelog": "true" if include_changelog else "false"}
+        if loaders:
+            params["loaders"] = json.dumps(loaders)
+        if game_versions:
+            params["game_versions"] = json.dumps(game_versions)
+        try:
+            return await self.client.get_json(
+                f"/project/{project_id}/version", "modrinth_api", headers=self.sync.headers, params=params, timeout=10
+            )
+        except Exception as e:
+            print(f"Error al obtener versiones del modpack: {e}")
+            return None
+
+    async def get_project_info(self, project_id: str) -> Optional[Dict]:
+        """Obtiene información detallada de un proyecto"""
+        try:
+            return await self.client.get_json(f"/project/{project_id}", "modrinth_api", headers=self.sync.headers, timeout=10)
+        except Exception as e:
+            print(f"Error al obtener información del proyecto: {e}")
+            return None
+
+    async def get_projects_info(self, project_ids: List[str]) -> Optional[List[Dict]]:
+        """Obtiene información de múltiples proyectos en una sola llamada (batch)"""
+        if not project_ids:
+            return []
+        try:
+            params = {"ids": json.dumps(list(project_ids))}
+            return await self.client.get_json("/projects", "modrinth_api", headers=self.sync.headers, params=params, timeout=15)
+        except Exception as e:
+            print(f"Error al obtener información de proyectos: {e}")
+            return None
+
+    async def get_versions_by_hashes(self, hashes: List[str], algorithm: str = "sha1") -> Optional[Dict[str, Dict]]:
+        """Identifica archivos por hash en una sola llamada (batch)"""
+        if not hashes:
+            return {}
+        try:
+            return await self.client.post_json(
+                "/version_files", "modrinth_api",
+                headers={**self.sync.headers, "Content-Type": "application/json"},
+                json={"hashes": hashes, "algorithm": algorithm}, timeout=30
+            )
+        except Exception as e:
+            print(f"Error al identificar archivos por hash: {e}")
+            return None
+
+    async def get_latest_versions_by_hashes(
+        self,
+        hashes: List[str],
+        loaders: List[str],
+        game_versions: List[str],
+        algorithm: str = "sha1"
+    ) -> Optional[Dict[str, Dict]]:
+        """Obtiene la última versión compatible de cada archivo en una sola llamada"""
+        if not hashes:
+            return {}
+        try:
+            return await self.client.post_json(
+                "/version_files/update", "modrinth_api",
+                headers={**self.sync.headers, "Content-Type": "application/json"},
+                json={"hashes": hashes, "algorithm": algorithm, "loaders": loaders, "game_versions": game_versions},
+                timeout=30
+            )
+        except Exception as e:
+            print(f"Error al buscar actualizaciones por hash: {e}")
+            return None
+
+    async def get_version(self, version_id: str) -> Optional[Dict]:
+        """Obtiene los datos de una versión"""
+        try:
+            return await self.client.get_json(f"/version/{version_id}", "modrinth_api", headers=self.sync.headers, timeout=10)
+        except Exception as e:
+            print(f"Error al obtener la versión: {e}")
+            return None
+
+    async def download_version_file(self, version_id: str, dest_folder: str) -> Optional[str]:
+        """Descarga el archivo (.mrpack) de una versión de modpack"""
+        version_data = await self.get_version(version_id)
+        files = (version_data or {}).get("files", [])
+        if not files:
+            return None
+
+        mrpack_file = next((f for f in files if f.get("filename", "").endswith(".mrpack")), files[0])
+        if not mrpack_file.get("url") or not mrpack_file.get("filename"):
+            return None
+
+        dest_path = os.path.join(dest_folder, os.path.basename(mrpack_file["filename"]))
+        ok = await self.client.download(
+            mrpack_file["url"], dest_path, sha1=mrpack_file.get("hashes", {}).get("sha1"), headers=self.sync.headers
+        )
+        return dest_path if ok else None
+
+
+class AsyncCurseForgeAPI:
+    """asyncio version of CurseForgeAPI (results use the same formats)"""
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[AsyncHttpClient] = None):
+        self.client = client or AsyncHttpClient()
+        self.sync = CurseForgeAPI(api_key)
+
+    async def _get_data(self, path: str, params: Optional[Dict] = None, timeout: float = 10):
+        data = await self.client.get_json(path, "curseforge_proxy", headers=self.sync.headers, params=params, timeout=timeout)
+        return data.get("data")
+
+    async def _post_data(self, path: str, body: Dict):
+        data = await self.client.post_json(
+            path, "curseforge_proxy",
+            headers={**self.sync.headers, "Content-Type": "application/json"}, json=body, timeout=30
+        )
+        return data.get("data", [])
+
+    async def search_modpacks(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        server_pack_filter: bool = False
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
+        """
+        Search modpacks on CurseForge
+
+        With server_pack_filter, offset and limit count only modpacks with a
+        server pack (see _search_with_server_filter).
+        """
+        try:
+            if server_pack_filter:
+                return await self._search_with_server_filter(query, limit, offset)
+            modpacks, total = await self._search_page(query, min(limit, 50), offset)
+            return self.sync._normalize_curseforge_modpacks(modpacks), total
+        except Exception as e:
+            print(f"Error searching modpacks on CurseForge: {e}")
+            return None, 0
+
+    async def _search_page(self, query: str, page_size: int, index: int) -> Tuple[List[Dict], int]:
+        """One raw page of /v1/mods/search; returns (mods, total count)"""
+        params = {
+            "gameId": self.sync.MINECRAFT_GAME_ID,
+            "classId": self.sync.MODPACK_CLASS_ID,
+            "searchFilter": query,
+            "pageSize": page_size,
+            "index": index,
+            "sortField": CurseForgeAPI.SORT_POPULARITY,
+            "sortOrder": "desc"
+        }
+        data = await self.client.get_json(
+            "/v1/mods/search", "curseforge_proxy", headers=self.sync.headers, params=params, timeout=15
+        )
+        modpacks = data.get("data", [])
+        return modpacks, data.get("pagination", {}).get("totalCount", len(modpacks))
+
+    async def _search_with_server_filter(self, query: str, limit: int, offset: int) -> Tuple[List[ModpackSummary], int]:
+        """
+        Pages through search results (50 per request, at most 10 requests,
+        like CurseForgeAPI) until offset + limit modpacks with a server pack
+        are found. The total is estimated from the share of results that have one.
+        """
+        filtered: List[ModpackSummary] = []
+        api_offset = total_api_results = fetched = 0
+        for _ in range(10):
+            modpacks, total_api_results = await self._search_page(query, 50, api_offset)
+            if not modpacks:
+                break
+            fetched += len(modpacks)
+            filtered.extend(self.sync._normalize_curseforge_modpacks([
+                mp for mp in modpacks if any(f.get("serverPackFileId") for f in mp.get("latestFiles", []))
+            ]))
+            if len(filtered) >= offset + limit:
+                break
+            api_offset += 50
+            if api_offset >= total_api_results:
+                break
+
+        estimated_total = max(int(total_api_results * len(filtered) / fetched), len(filtered)) if fetched else 0
+        return filtered[offset:offset + limit], estimated_total
+
+    async def get_modpack_info(self, modpack_id: int) -> Optional[Dict]:
+        """Get modpack information"""
+        try:
+            return await self._get_data(f"/v1/mods/{modpack_id}")
+        except Exception as e:
+            print(f"Error getting modpack info: {e}")
+            return None
+
+    async def get_modpack_files(
+        self,
+        modpack_id: int,
+        game_version: Optional[str] = None,
+        mod_loader: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """Get modpack files/versions (all pages, filtered server-side)"""
+        files = []
+        try:
+            while True:
+                params = {"index": len(files), "pageSize": CurseForgeAPI.FILES_PAGE_SIZE}
+                if game_version:
+                    params["gameVersion"] = game_version
+                if mod_loader in CurseForgeAPI.MOD_LOADER_TYPES:
+                    params["modLoaderType"] = CurseForgeAPI.MOD_LOADER_TYPES[mod_loader]
+                data = await self.client.get_json(
+                    f"/v1/mods/{modpack_id}/files", "curseforge_proxy",
+                    headers=self.sync.headers, params=params, timeout=10
+                )
+                page = data.get("data") or []
+                files.extend(page)
+                if not page or len(files) >= data.get("pagination", {}).get("totalCount", len(files)):
+                    return files
+        except Exception as e:
+            print(f"Error getting modpack files: {e}")
+            return None
+
+    async def get_mod_file_info(self, mod_id: int, file_id: int) -> Optional[Dict]:
+        """Get information about a specific mod file"""
+        try:
+            return await self._get_data(f"/v1/mods/{mod_id}/files/{file_id}")
+        except Exception as e:
+            print(f"Error getting file info: {e}")
+            return None
+
+    async def get_mods_info_batch(self, mod_ids: List[int]) -> Optional[List[Dict]]:
+        """Get information about multiple mods in a single request"""
+        try:
+            return await self._post_data("/v1/mods", {"modIds": mod_ids})
+        except Exception as e:
+            print(f"Error getting mods batch info: {e}")
+            return None
+
+    async def get_files_info_batch(self, file_ids: List[int]) -> Optional[List[Dict]]:
+        """Get information about multiple files (any mod) in a single request"""
+        if not file_ids:
+            return []
+        try:
+            return await self._post_data("/v1/mods/files", {"fileIds": file_ids})
+        except Exception as e:
+            print(f"Error getting files batch info: {e}")
+            return None
+
+    async def download_modpack_file(
+        self,
+        modpack_id: int,
+        file_id: int,
+        dest_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """Download a modpack file (downloadUrl first, then the CDN hosts)"""
+        file_data = await self.get_mod_file_info(modpack_id, file_id)
+        filename = (file_data or {}).get("fileName")
+        if not filename:
+            if log_callback:
+                log_callback("    Error: No file data returned from API\n")
+            return None
+
+        file_id_str = str(file_id)
+        first_part, second_part = file_id_str[:4], file_id_str[4:].lstrip('0') or '0'
+        urls = [file_data.get("downloadUrl")] + [
+            f"https://{host}/files/{first_part}/{second_part}/{quote(filename)}" for host in self.sync.CDN_HOSTS
+        ]
+        sha1 = next((h.get("value") for h in file_data.get("hashes", []) if h.get("algo") == 1), None)
+
+        dest_path = os.path.join(dest_folder, os.path.basename(filename))
+        if log_callback:
+            log_callback(f"    Downloading {os.path.basename(filename)}...\n")
+        ok = await self.client.download(list(dict.fromkeys(u for u in urls if u)), dest_path, sha1=sha1)
+        return dest_path if ok else None
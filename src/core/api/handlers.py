@@ -1,10 +1,15 @@
-import requests
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import json
 import os
+import time
+import threading
 from pathlib import Path
 from urllib.parse import quote
 
+from ..config import DEFAULT_ENDPOINTS
+from .http_client import get_http_client
+from .models import ModpackSummary
+
 try:
     from ..__version__ import __version__ as _PYCRAFT_VERSION
 except Exception:
@@ -15,23 +20,55 @@ except Exception:
 PYCRAFT_USER_AGENT = f"PyCraft/{_PYCRAFT_VERSION} (github.com/OOMrConrado/PyCraft)"
 
 
+class _VersionListCache:
+    """
+    Per-project cache of version lists, filled page by page
+
+    Each key (project + filters) keeps the items fetched so far and whether
+    the list is complete, so reopening the version selector replays cached
+    pages and only fetches what was never requested.
+    """
+
+    TTL = 600.0
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[float, List[Dict], bool]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Tuple[List[Dict], bool]:
+        """Returns (items fetched so far, complete)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or time.monotonic() - entry[0] > self.TTL:
+                self._entries.pop(key, None)
+                return [], False
+            return list(entry[1]), entry[2]
+
+    def store(self, key: Tuple, offset: int, items: List[Dict], complete: bool):
+        """Appends a page fetched at `offset` (ignored if another caller got there first)"""
+        with self._lock:
+            fetched_at, cached, _ = self._entries.get(key, (time.monotonic(), [], False))
+            if len(cached) != offset:
+                return
+            self._entries[key] = (fetched_at, cached + list(items), complete)
+
+
 class MinecraftAPIHandler:
     """Maneja las peticiones a la API de Mojang para obtener versiones de Minecraft"""
 
-    VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+    VERSION_MANIFEST_URL = DEFAULT_ENDPOINTS["mojang_manifest"]
     # Minecraft 1.2.5 (released 2012-03-29) was the first version with an official
     # server.jar in Mojang's manifest. Earlier versions cannot be installed as a server.
     FIRST_SERVER_JAR_DATE = "2012-03-29"
 
     def __init__(self):
         self.versions_cache = None
+        self.http = get_http_client()
 
     def get_all_versions(self) -> Optional[Dict]:
         """Obtiene todas las versiones disponibles de Minecraft"""
         try:
-            response = requests.get(self.VERSION_MANIFEST_URL, timeout=10)
-            response.raise_for_status()
-            self.versions_cache = response.json()
+            self.versions_cache = self.http.get_json("", "mojang_manifest", timeout=10)
             return self.versions_cache
         except Exception as e:
             print(f"Error al obtener versiones: {e}")
@@ -90,9 +127,7 @@ class MinecraftAPIHandler:
                 return None
 
             # Obtener los detalles de la versión
-            response = requests.get(version_url, timeout=10)
-            response.raise_for_status()
-            version_details = response.json()
+            version_details = self.http.get_json(version_url, timeout=10)
 
             # Extraer la URL del server.jar
             downloads = version_details.get("downloads", {})
@@ -112,15 +147,27 @@ class MinecraftAPIHandler:
 class ModrinthAPI:
     """Maneja las peticiones a la API de Modrinth para modpacks"""
 
-    BASE_URL = "https://api.modrinth.com/v2"
+    BASE_URL = DEFAULT_ENDPOINTS["modrinth_api"]
     USER_AGENT = "PyCraft/1.0.0 (github.com/OOMrConrado/PyCraft; conradogomez556@gmail.com)"
+    # Project/version lookups fired by both the version selector and the
+    # install path reuse one response for this long
+    SHARE_SECONDS = 30.0
 
     def __init__(self):
         self.headers = {
             "User-Agent": self.USER_AGENT
         }
+        self.http = get_http_client()
+        self._versions_cache = _VersionListCache()
 
-    def search_modpacks(self, query: str, limit: int = 10, offset: int = 0, side_filter: str = None) -> Tuple[Optional[List[Dict]], int]:
+    def search_modpacks(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        side_filter: str = None,
+        index: str = "relevance"
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
         """
         Busca modpacks en Modrinth
 
@@ -131,62 +178,34 @@ class ModrinthAPI:
             side_filter: Filtro de lado - "server" para mostrar solo modpacks con server pack,
                         "client" para mostrar solo modpacks con soporte cliente,
                         None para no filtrar
+            index: Orden - "relevance", "downloads", "follows", "newest" o "updated"
 
         Returns:
             Tuple de (lista de modpacks, total de resultados)
         """
         try:
-            url = f"{self.BASE_URL}/search"
-
-            if side_filter:
-                # When filtering, we need to request from the beginning and paginate after filtering
-                # Request enough results to cover the requested page after filtering
-                # Estimate ~70% pass rate, so request ~1.5x more than needed
-                request_limit = min((offset + limit) * 2, 100)  # Cap at 100 to avoid huge requests
-                request_offset = 0
-            else:
-                request_limit = limit
-                request_offset = offset
+            url = "/search"
+
+            facets = [["project_type:modpack"]]
+            # Modrinth filters by side itself, so offset and total_hits stay exact
+            # Values: "required", "optional", "unsupported", "unknown"
+            if side_filter in ("server", "client"):
+                facets.append([f"{side_filter}_side:required", f"{side_filter}_side:optional"])
 
             params = {
                 "query": query,
-                "limit": request_limit,
-                "offset": request_offset,
-                "facets": '[["project_type:modpack"]]'
+                "limit": min(limit, 100),  # Modrinth's maximum page size
+                "offset": offset,
+                "facets": json.dumps(facets)
             }
+            if index != "relevance":
+                params["index"] = index
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(url, "modrinth_api", headers=self.headers, params=params, timeout=10)
 
             hits = data.get("hits", [])
             total = data.get("total_hits", 0)
 
-            # Filter by side if specified
-            # Modrinth returns server_side and client_side fields with values:
-            # "required", "optional", "unsupported", "unknown"
-            if side_filter and hits:
-                filtered_hits = []
-                for hit in hits:
-                    if side_filter == "server":
-                        # For server: only show modpacks where server_side is NOT "unsupported"
-                        server_side = hit.get("server_side", "unknown")
-                        if server_side in ("required", "optional"):
-                            filtered_hits.append(hit)
-                    elif side_filter == "client":
-                        # For client: only show modpacks where client_side is NOT "unsupported"
-                        client_side = hit.get("client_side", "unknown")
-                        if client_side in ("required", "optional"):
-                            filtered_hits.append(hit)
-
-                # Apply pagination AFTER filtering
-                hits = filtered_hits[offset:offset + limit]
-
-                # Estimate total filtered results based on ratio
-                if request_limit > 0:
-                    filter_ratio = len(filtered_hits) / request_limit
-                    total = max(int(total * filter_ratio), len(filtered_hits))
-
             # Normalize Modrinth results to consistent format
             normalized = self._normalize_modrinth_modpacks(hits)
             return normalized, total
@@ -195,48 +214,101 @@ class ModrinthAPI:
             print(f"Error al buscar modpacks en Modrinth: {e}")
             return None, 0
 
-    def _normalize_modrinth_modpacks(self, modpacks: list) -> List[Dict]:
+    def _normalize_modrinth_modpacks(self, modpacks: list) -> List[ModpackSummary]:
         """Normalize Modrinth modpacks to consistent format"""
         normalized = []
         for mp in modpacks:
-            normalized.append({
-                "project_id": mp.get("project_id", mp.get("slug", "")),
-                "title": mp.get("title", "Unknown"),
-                "description": mp.get("description", ""),
-                "icon_url": mp.get("icon_url", ""),
-                "downloads": mp.get("downloads", 0),
-                "categories": mp.get("categories", []),
-                "versions": mp.get("versions", []),
-                "slug": mp.get("slug", ""),
-                "author": mp.get("author", "Unknown"),
-                "source": "modrinth",
-                "server_side": mp.get("server_side", "unknown"),
-                "client_side": mp.get("client_side", "unknown"),
-            })
+            server_side = mp.get("server_side", "unknown")
+            normalized.append(ModpackSummary(
+                project_id=mp.get("project_id", mp.get("slug", "")),
+                title=mp.get("title", "Unknown"),
+                source="modrinth",
+                description=mp.get("description", ""),
+                icon_url=mp.get("icon_url", ""),
+                downloads=mp.get("downloads", 0),
+                categories=mp.get("categories", []),
+                versions=mp.get("versions", []),
+                slug=mp.get("slug", ""),
+                author=mp.get("author", "Unknown"),
+                server_side=server_side,
+                client_side=mp.get("client_side", "unknown"),
+                server_pack=server_side in ("required", "optional"),
+                updated=mp.get("date_modified", ""),
+            ))
         return normalized
 
-    def get_modpack_versions(self, project_id: str) -> Optional[List[Dict]]:
+    def get_modpack_versions(
+        self,
+        project_id: str,
+        loaders: Optional[List[str]] = None,
+        game_versions: Optional[List[str]] = None,
+        include_changelog: bool = False
+    ) -> Optional[List[Dict]]:
         """
         Obtiene las versiones disponibles de un modpack
 
+        Los filtros se aplican en el servidor y, sin changelogs, la respuesta
+        es mucho más chica. El resultado queda cacheado por proyecto y filtros.
+
         Args:
             project_id: ID del proyecto en Modrinth
+            loaders: Solo versiones para estos loaders (ej: ["fabric"])
+            game_versions: Solo versiones para estas versiones de Minecraft
+            include_changelog: Incluir el changelog de cada versión
 
         Returns:
-            Lista de versiones disponibles
+            Lista de versiones disponibles (más nuevas primero)
         """
-        try:
-            url = f"{self.BASE_URL}/project/{project_id}/version"
+        key = (project_id, tuple(loaders or ()), tuple(game_versions or ()), include_changelog)
+        cached, complete = self._versions_cache.get(key)
+        if complete:
+            return cached
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            return response.json()
+        try:
+            url = f"/project/{project_id}/version"
+            params = {"include_changelog": "true" if include_changelog else "false"}
+            if loaders:
+                params["loaders"] = json.dumps(loaders)
+            if game_versions:
+                params["game_versions"] = json.dumps(game_versions)
+
+            versions = self.http.get_json(
+                url, "modrinth_api", share_for=self.SHARE_SECONDS, params=params, headers=self.headers, timeout=10
+            )
+            self._versions_cache.store(key, 0, versions, True)
+            return versions
 
         except Exception as e:
             print(f"Error al obtener versiones del modpack: {e}")
             return None
 
+    def iter_modpack_versions(
+        self,
+        project_id: str,
+        loaders: Optional[List[str]] = None,
+        game_versions: Optional[List[str]] = None,
+        page_size: int = 20
+    ) -> Iterator[List[Dict]]:
+        """
+        Recorre las versiones de un modpack página por página
+
+        El endpoint de versiones de Modrinth no pagina: la lista filtrada y
+        sin changelogs llega en una sola respuesta y se entrega en páginas
+        para que la interfaz la consuma igual que la de CurseForge.
+
+        Args:
+            project_id: ID del proyecto en Modrinth
+            loaders: Solo versiones para estos loaders
+            game_versions: Solo versiones para estas versiones de Minecraft
+            page_size: Versiones por página
+
+        Yields:
+            Listas de hasta page_size versiones
+        """
+        versions = self.get_modpack_versions(project_id, loaders, game_versions) or []
+        for i in range(0, len(versions), page_size):
+            yield versions[i:i + page_size]
+
     def get_project_info(self, project_id: str) -> Optional[Dict]:
         """
         Obtiene información detallada de un proyecto
@@ -248,12 +320,11 @@ class ModrinthAPI:
             Información del proyecto
         """
         try:
-            url = f"{self.BASE_URL}/project/{project_id}"
-
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            url = f"/project/{project_id}"
 
-            return response.json()
+            return self.http.get_json(
+                url, "modrinth_api", share_for=self.SHARE_SECONDS, headers=self.headers, timeout=10
+            )
 
         except Exception as e:
             print(f"Error al obtener información del proyecto: {e}")
@@ -273,19 +344,82 @@ class ModrinthAPI:
             return []
 
         try:
-            url = f"{self.BASE_URL}/projects"
+            url = "/projects"
             # Modrinth expects the ids as a JSON array string
             params = {
                 "ids": json.dumps(project_ids)
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+            return self.http.get_json(url, "modrinth_api", headers=self.headers, params=params, timeout=15)
+
+        except Exception as e:
+            print(f"Error al obtener información de proyectos: {e}")
+            return None
+
+    def get_versions_by_hashes(self, hashes: List[str], algorithm: str = "sha1") -> Optional[Dict[str, Dict]]:
+        """
+        Identifica archivos por hash en una sola llamada (batch)
+
+        Args:
+            hashes: Lista de hashes de archivos (jars)
+            algorithm: "sha1" o "sha512"
+
+        Returns:
+            Dict hash -> versión de Modrinth (los hashes desconocidos no aparecen)
+        """
+        if not hashes:
+            return {}
+
+        try:
+            response = self.http.post(
+                "/version_files",
+                "modrinth_api",
+                headers={**self.headers, "Content-Type": "application/json"},
+                json={"hashes": hashes, "algorithm": algorithm},
+                timeout=30
+            )
             response.raise_for_status()
+            return response.json()
 
+        except Exception as e:
+            print(f"Error al identificar archivos por hash: {e}")
+            return None
+
+    def get_latest_versions_by_hashes(
+        self,
+        hashes: List[str],
+        loaders: List[str],
+        game_versions: List[str],
+        algorithm: str = "sha1"
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Obtiene la última versión compatible de cada archivo en una sola llamada
+
+        Args:
+            hashes: Lista de hashes de archivos instalados
+            loaders: Loaders aceptados (ej: ["fabric"])
+            game_versions: Versiones de Minecraft aceptadas (ej: ["1.20.1"])
+            algorithm: "sha1" o "sha512"
+
+        Returns:
+            Dict hash -> última versión compatible (los hashes sin versión compatible no aparecen)
+        """
+        if not hashes:
+            return {}
+
+        try:
+            response = self.http.post(
+                "/version_files/update",
+                "modrinth_api",
+                headers={**self.headers, "Content-Type": "application/json"},
+                json={"hashes": hashes, "algorithm": algorithm, "loaders": loaders, "game_versions": game_versions},
+                timeout=30
+            )
+            response.raise_for_status()
             return response.json()
 
         except Exception as e:
-            print(f"Error al obtener información de proyectos: {e}")
+            print(f"Error al buscar actualizaciones por hash: {e}")
             return None
 
     def extract_project_id_from_url(self, url: str) -> Optional[str]:
@@ -324,10 +458,8 @@ class ModrinthAPI:
         """
         try:
             # Obtener información de la versión
-            url = f"{self.BASE_URL}/version/{version_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            version_data = response.json()
+            url = f"/version/{version_id}"
+            version_data = self.http.get_json(url, "modrinth_api", headers=self.headers, timeout=10)
 
             # Obtener el archivo principal (mrpack)
             files = version_data.get("files", [])
@@ -354,7 +486,7 @@ class ModrinthAPI:
             # Descargar archivo (sanitize filename to prevent path traversal)
             safe_filename = os.path.basename(filename)
             dest_path = os.path.join(dest_folder, safe_filename)
-            response = requests.get(download_url, headers=self.headers, stream=True, timeout=30)
+            response = self.http.get(download_url, headers=self.headers, stream=True, timeout=30)
             response.raise_for_status()
 
             with open(dest_path, 'wb') as f:
@@ -372,9 +504,21 @@ class CurseForgeAPI:
     """Handles requests to the CurseForge API for modpacks via proxy"""
 
     # Use proxy URL to keep API key secure
-    PROXY_URL = "https://pycraft-curseforge-proxy.conradogomez556.workers.dev"
+    PROXY_URL = DEFAULT_ENDPOINTS["curseforge_proxy"]
+    # CDN hosts serving files under /files/<id[:4]>/<id[4:]>/<name>
+    CDN_HOSTS = ("edge.forgecdn.net", "mediafilez.forgecdn.net")
+    # Mod/file lookups (e.g. server pack ID then download of the same file)
+    # reuse one response for this long
+    SHARE_SECONDS = 30.0
     MINECRAFT_GAME_ID = 432
     MODPACK_CLASS_ID = 4471
+    # Search sortField values
+    SORT_POPULARITY = 2
+    SORT_LAST_UPDATED = 3
+    # modLoaderType / latestFilesIndexes[].modLoader values
+    MOD_LOADER_TYPES = {"forge": 1, "fabric": 4, "quilt": 5, "neoforge": 6}
+    # Largest page the files endpoint returns
+    FILES_PAGE_SIZE = 50
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -388,6 +532,8 @@ class CurseForgeAPI:
             "Accept": "application/json",
             "User-Agent": PYCRAFT_USER_AGENT,
         }
+        self.http = get_http_client()
+        self._files_cache = _VersionListCache()
 
     def set_api_key(self, api_key: str):
         """Legacy method - API key is handled by proxy now"""
@@ -402,8 +548,9 @@ class CurseForgeAPI:
         query: str,
         limit: int = 20,
         offset: int = 0,
-        server_pack_filter: bool = False
-    ) -> Tuple[Optional[List[Dict]], int]:
+        server_pack_filter: bool = False,
+        sort_field: int = SORT_POPULARITY
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
         """
         Search modpacks on CurseForge
 
@@ -412,17 +559,18 @@ class CurseForgeAPI:
             limit: Maximum number of results per page
             offset: Number of results to skip (for pagination)
             server_pack_filter: If True, only return modpacks that have server packs
+            sort_field: SORT_POPULARITY or SORT_LAST_UPDATED (descending)
 
         Returns:
             Tuple of (list of modpacks in normalized format, total results count)
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods/search"
+            url = "/v1/mods/search"
 
             if server_pack_filter:
                 # When filtering, we need to accumulate enough filtered results
                 # Fetch multiple pages if needed to get offset + limit filtered results
-                return self._search_modpacks_with_server_filter(url, query, limit, offset)
+                return self._search_modpacks_with_server_filter(url, query, limit, offset, sort_field)
 
             # Normal search without filter
             params = {
@@ -431,13 +579,11 @@ class CurseForgeAPI:
                 "searchFilter": query,
                 "pageSize": min(limit, 50),
                 "index": offset,
-                "sortField": 2,  # Popularity
+                "sortField": sort_field,
                 "sortOrder": "desc"
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(url, "curseforge_proxy", headers=self.headers, params=params, timeout=15)
 
             modpacks = data.get("data", [])
             pagination = data.get("pagination", {})
@@ -455,8 +601,9 @@ class CurseForgeAPI:
         url: str,
         query: str,
         limit: int,
-        offset: int
-    ) -> Tuple[Optional[List[Dict]], int]:
+        offset: int,
+        sort_field: int = SORT_POPULARITY
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
         """
         Search modpacks with server pack filter.
         Fetches enough results to fill the requested page.
@@ -475,13 +622,11 @@ class CurseForgeAPI:
                 "searchFilter": query,
                 "pageSize": 50,
                 "index": api_offset,
-                "sortField": 2,
+                "sortField": sort_field,
                 "sortOrder": "desc"
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(url, "curseforge_proxy", headers=self.headers, params=params, timeout=15)
 
             modpacks = data.get("data", [])
             pagination = data.get("pagination", {})
@@ -521,7 +666,7 @@ class CurseForgeAPI:
 
         return result_page, estimated_total
 
-    def _normalize_curseforge_modpacks(self, modpacks: list) -> List[Dict]:
+    def _normalize_curseforge_modpacks(self, modpacks: list) -> List[ModpackSummary]:
         """Normalize CurseForge modpacks to Modrinth-like format"""
         LOADER_MAP = {1: "forge", 4: "fabric", 5: "quilt", 6: "neoforge"}
         normalized = []
@@ -545,20 +690,21 @@ class CurseForgeAPI:
 
             categories.extend(list(loaders))
 
-            normalized.append({
-                "project_id": str(mp.get("id", "")),
-                "title": mp.get("name", "Unknown"),
-                "description": mp.get("summary", ""),
-                "icon_url": mp.get("logo", {}).get("thumbnailUrl", "") if mp.get("logo") else "",
-                "downloads": mp.get("downloadCount", 0),
-                "categories": categories,
-                "versions": sorted(versions, reverse=True) if versions else [],
-                "slug": mp.get("slug", ""),
-                "author": mp.get("authors", [{}])[0].get("name", "Unknown") if mp.get("authors") else "Unknown",
-                "source": "curseforge",
-                "_curseforge_id": mp.get("id"),
-                "_curseforge_data": mp
-            })
+            # Only the summary is kept: the raw payload is loaded again for the opened pack
+            normalized.append(ModpackSummary(
+                project_id=str(mp.get("id", "")),
+                title=mp.get("name", "Unknown"),
+                source="curseforge",
+                description=mp.get("summary", ""),
+                icon_url=mp.get("logo", {}).get("thumbnailUrl", "") if mp.get("logo") else "",
+                downloads=mp.get("downloadCount", 0),
+                categories=categories,
+                versions=sorted(versions, reverse=True) if versions else [],
+                slug=mp.get("slug", ""),
+                author=mp.get("authors", [{}])[0].get("name", "Unknown") if mp.get("authors") else "Unknown",
+                server_pack=any(f.get("serverPackFileId") for f in mp.get("latestFiles", [])),
+                updated=mp.get("dateModified", ""),
+            ))
 
         return normalized
 
@@ -573,9 +719,9 @@ class CurseForgeAPI:
             True if modpack has at least one file with server pack
         """
         try:
-            files = self.get_modpack_files(modpack_id)
-            if files:
-                for file in files:
+            # Stops at the first page that has one
+            for page in self.iter_modpack_files(modpack_id):
+                for file in page:
                     # serverPackFileId indicates a server pack exists for this file
                     if file.get("serverPackFileId"):
                         return True
@@ -594,11 +740,11 @@ class CurseForgeAPI:
             Modpack information
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods/{modpack_id}"
+            url = f"/v1/mods/{modpack_id}"
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(
+                url, "curseforge_proxy", share_for=self.SHARE_SECONDS, headers=self.headers, timeout=10
+            )
 
             return data.get("data")
 
@@ -606,28 +752,94 @@ class CurseForgeAPI:
             print(f"Error getting modpack info: {e}")
             return None
 
-    def get_modpack_files(self, modpack_id: int) -> Optional[List[Dict]]:
+    def get_modpack_files(
+        self,
+        modpack_id: int,
+        game_version: Optional[str] = None,
+        mod_loader: Optional[str] = None
+    ) -> Optional[List[Dict]]:
         """
         Get modpack files/versions
 
         Args:
             modpack_id: Modpack ID
+            game_version: Only files for this Minecraft version
+            mod_loader: Only files for this loader ("forge", "fabric", ...)
 
         Returns:
-            List of available files
+            List of available files (newest first), None on error
         """
+        files = []
         try:
-            url = f"{self.PROXY_URL}/v1/mods/{modpack_id}/files"
+            for page in self._iter_files_pages(modpack_id, game_version, mod_loader):
+                files.extend(page)
+            return files
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        except Exception as e:
+            print(f"Error getting modpack files: {e}")
+            return None
 
-            return data.get("data", [])
+    def iter_modpack_files(
+        self,
+        modpack_id: int,
+        game_version: Optional[str] = None,
+        mod_loader: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Iterate over modpack files one page at a time
+
+        Pages come from the per-project cache first; the API is only asked
+        for pages never fetched, so stopping early saves the remaining ones.
 
+        Args:
+            modpack_id: Modpack ID
+            game_version: Only files for this Minecraft version
+            mod_loader: Only files for this loader ("forge", "fabric", ...)
+
+        Yields:
+            Lists of up to FILES_PAGE_SIZE files (newest first)
+        """
+        try:
+            yield from self._iter_files_pages(modpack_id, game_version, mod_loader)
         except Exception as e:
             print(f"Error getting modpack files: {e}")
-            return None
+
+    def _iter_files_pages(
+        self,
+        modpack_id: int,
+        game_version: Optional[str],
+        mod_loader: Optional[str]
+    ) -> Iterator[List[Dict]]:
+        """Pages of /files (raises on request errors)"""
+        key = (modpack_id, game_version, mod_loader)
+        cached, complete = self._files_cache.get(key)
+        for i in range(0, len(cached), self.FILES_PAGE_SIZE):
+            yield cached[i:i + self.FILES_PAGE_SIZE]
+        if complete:
+            return
+
+        url = f"/v1/mods/{modpack_id}/files"
+        index = len(cached)
+        while True:
+            params = {"index": index, "pageSize": self.FILES_PAGE_SIZE}
+            if game_version:
+                params["gameVersion"] = game_version
+            if mod_loader in self.MOD_LOADER_TYPES:
+                params["modLoaderType"] = self.MOD_LOADER_TYPES[mod_loader]
+
+            data = self.http.get_json(
+                url, "curseforge_proxy", share_for=self.SHARE_SECONDS, params=params, headers=self.headers, timeout=10
+            )
+            page = data.get("data", [])
+            total = data.get("pagination", {}).get("totalCount", index + len(page))
+            complete = not page or index + len(page) >= total
+
+            self._files_cache.store(key, index, page, complete)
+            index += len(page)
+            if page:
+                yield page
+            if complete:
+                return
 
     def get_server_pack_file_id(self, modpack_id: int, file_id: int) -> Optional[int]:
         """
@@ -641,11 +853,11 @@ class CurseForgeAPI:
             Server pack file ID if available, None otherwise
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods/{modpack_id}/files/{file_id}"
+            url = f"/v1/mods/{modpack_id}/files/{file_id}"
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(
+                url, "curseforge_proxy", share_for=self.SHARE_SECONDS, headers=self.headers, timeout=10
+            )
 
             file_data = data.get("data", {})
             return file_data.get("serverPackFileId")
@@ -669,10 +881,10 @@ class CurseForgeAPI:
         """
         try:
             # Get file information
-            url = f"{self.PROXY_URL}/v1/mods/{modpack_id}/files/{file_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            file_data = response.json().get("data")
+            url = f"/v1/mods/{modpack_id}/files/{file_id}"
+            file_data = self.http.get_json(
+                url, "curseforge_proxy", share_for=self.SHARE_SECONDS, headers=self.headers, timeout=10
+            ).get("data")
 
             if not file_data:
                 if log_callback:
@@ -687,27 +899,28 @@ class CurseForgeAPI:
                     log_callback("    Error: No filename in file data\n")
                 return None
 
-            # If no direct download URL, try to construct it using CurseForge CDN pattern
-            used_fallback = False
-            if not download_url:
+            # Candidate URLs: the direct downloadUrl (often null for third-party
+            # distribution) followed by the CurseForge CDN hosts
+            download_urls = [download_url] if download_url else []
+            file_id_str = str(file_id)
+            if len(file_id_str) >= 4:
+                # Split as: first 4 digits / remaining digits
+                first_part = file_id_str[:4]
+                second_part = file_id_str[4:].lstrip('0') or '0'
+                # URL encode the filename to handle special characters (spaces, etc.)
+                encoded_filename = quote(filename)
+                for host in self.CDN_HOSTS:
+                    constructed_url = f"https://{host}/files/{first_part}/{second_part}/{encoded_filename}"
+                    if constructed_url not in download_urls:
+                        download_urls.append(constructed_url)
+
+            if not download_urls:
                 if log_callback:
-                    log_callback("    Using CDN fallback method...\n")
-                used_fallback = True
-
-                # Split file_id for CDN URL pattern
-                file_id_str = str(file_id)
-                if len(file_id_str) >= 4:
-                    # Split as: first 4 digits / remaining digits
-                    first_part = file_id_str[:4]
-                    second_part = file_id_str[4:]
-                    # URL encode the filename to handle special characters (spaces, etc.)
-                    encoded_filename = quote(filename)
-                    constructed_url = f"https://edge.forgecdn.net/files/{first_part}/{second_part}/{encoded_filename}"
-                    download_url = constructed_url
-                else:
-                    if log_callback:
-                        log_callback(f"    Error: File ID {file_id} is too short to construct CDN URL\n")
-                    return None
+                    log_callback(f"    Error: File ID {file_id} is too short to construct CDN URL\n")
+                return None
+
+            if not download_url and log_callback:
+                log_callback("    Using CDN fallback method...\n")
 
             # Download file
             safe_filename = os.path.basename(filename)
@@ -716,25 +929,18 @@ class CurseForgeAPI:
             if log_callback:
                 log_callback(f"    Downloading {safe_filename}...\n")
 
-            response = requests.get(download_url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            last_progress = 0
-
-            with open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        # Report progress every 10%
-                        if total_size > 0 and log_callback:
-                            progress = int((downloaded / total_size) * 100)
-                            if progress >= last_progress + 10:
-                                log_callback(f"    Progress: {progress}%\n")
-                                last_progress = progress
+            last_error = None
+            for candidate_url in download_urls:
+                try:
+                    self._stream_to_file(candidate_url, dest_path, log_callback)
+                    last_error = None
+                    break
+                except Exception as e:
+                    last_error = e
+                    if log_callback and candidate_url != download_urls[-1]:
+                        log_callback(f"    {type(e).__name__} from {candidate_url.split('/')[2]}, trying next mirror...\n")
+            if last_error:
+                raise last_error
 
             if log_callback:
                 log_callback(f"    Download complete\n")
@@ -746,6 +952,28 @@ class CurseForgeAPI:
                 log_callback(f"    Error downloading: {type(e).__name__}: {e}\n")
             return None
 
+    def _stream_to_file(self, download_url: str, dest_path: str, log_callback=None):
+        """Streams a URL to dest_path, reporting progress every 10%"""
+        response = self.http.get(download_url, stream=True, timeout=(10, 60))
+        response.raise_for_status()
+
+        total_size = int(response.headers.get('content-length', 0))
+        downloaded = 0
+        last_progress = 0
+
+        with open(dest_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+
+                    # Report progress every 10%
+                    if total_size > 0 and log_callback:
+                        progress = int((downloaded / total_size) * 100)
+                        if progress >= last_progress + 10:
+                            log_callback(f"    Progress: {progress}%\n")
+                            last_progress = progress
+
     def get_mod_file_info(self, mod_id: int, file_id: int) -> Optional[Dict]:
         """
         Get information about a specific mod file
@@ -758,11 +986,11 @@ class CurseForgeAPI:
             File information
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods/{mod_id}/files/{file_id}"
+            url = f"/v1/mods/{mod_id}/files/{file_id}"
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(
+                url, "curseforge_proxy", share_for=self.SHARE_SECONDS, headers=self.headers, timeout=10
+            )
 
             return data.get("data")
 
@@ -781,11 +1009,9 @@ class CurseForgeAPI:
             Mod information including slug for URL construction
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods/{mod_id}"
+            url = f"/v1/mods/{mod_id}"
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(url, "curseforge_proxy", headers=self.headers, timeout=10)
 
             return data.get("data")
 
@@ -804,10 +1030,11 @@ class CurseForgeAPI:
             List of mod information
         """
         try:
-            url = f"{self.PROXY_URL}/v1/mods"
+            url = "/v1/mods"
 
-            response = requests.post(
+            response = self.http.post(
                 url,
+                "curseforge_proxy",
                 headers={**self.headers, "Content-Type": "application/json"},
                 json={"modIds": mod_ids},
                 timeout=30
@@ -821,6 +1048,38 @@ class CurseForgeAPI:
             print(f"Error getting mods batch info: {e}")
             return None
 
+    def get_files_info_batch(self, file_ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Get information about multiple files (any mod) in a single request
+
+        Args:
+            file_ids: List of file IDs
+
+        Returns:
+            List of file information (fileName, fileLength, hashes, downloadUrl, ...)
+        """
+        if not file_ids:
+            return []
+
+        try:
+            url = "/v1/mods/files"
+
+            response = self.http.post(
+                url,
+                "curseforge_proxy",
+                headers={**self.headers, "Content-Type": "application/json"},
+                json={"fileIds": file_ids},
+                timeout=30
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            return data.get("data", [])
+
+        except Exception as e:
+            print(f"Error getting files batch info: {e}")
+            return None
+
 
 # Clase auxiliar para gestionar configuración de API keys
 class APIConfig:
@@ -0,0 +1,212 @@
+"""Shared HTTP layer for API handlers"""
+
+import threading
+import requests
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from ..config import EndpointConfig, get_endpoint_config
+from .rate_limit import AdaptiveLimiter, parse_rate_limit_headers
+from .retry import CircuitOpenError, RetryPolicy, get_circuit_breaker, get_retry_policy
+from .single_flight import SingleFlight
+
+
+class RateLimitedError(requests.RequestException):
+    """The host asked us to wait longer than HttpClient.MAX_RATE_LIMIT_WAIT"""
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP sessions with ordered base-URL fallback.
+
+    Requests addressed to a named endpoint ("modrinth_api", "curseforge_proxy",
+    ...) are tried against each configured mirror in order. Connection errors
+    and 5xx responses move on to the next mirror; the last response or error
+    is returned/raised to the caller unchanged.
+
+    Concurrency per host is bounded by an AdaptiveLimiter fed with each
+    response's rate-limit headers, so parallel callers stay just under the
+    upstream limits. 429s are retried after Retry-After when the wait is short.
+
+    Every host also has a circuit breaker (see retry.py): once it keeps
+    failing, requests to it raise CircuitOpenError immediately (so endpoint
+    mirrors take over at once) until a single probe succeeds.
+    """
+
+    # 429s waiting longer than this are returned to the caller instead
+    MAX_RATE_LIMIT_WAIT = 30.0
+    MAX_RATE_LIMIT_RETRIES = 2
+
+    def __init__(self, endpoints: Optional[EndpointConfig] = None, retry_policy: Optional[RetryPolicy] = None):
+        self.endpoints = endpoints or get_endpoint_config()
+        self.retry_policy = retry_policy or get_retry_policy()
+        self._local = threading.local()
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def _session(self) -> requests.Session:
+        """One session per thread (requests.Session is not fully thread-safe)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def limiter_for(self, url: str) -> AdaptiveLimiter:
+        """Returns the concurrency limiter of a URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = AdaptiveLimiter()
+                self._limiters[host] = limiter
+            return limiter
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends one request through the host's circuit breaker and limiter
+
+        Idempotent requests are retried on connection errors and transient
+        5xx responses with the shared backoff policy; 429s are retried after
+        Retry-After when the wait is short.
+        """
+        host = urlparse(url).netloc
+        limiter = self.limiter_for(url)
+        breaker = get_circuit_breaker(url)
+        retryable = method.upper() in RetryPolicy.IDEMPOTENT_METHODS
+        attempt = 0
+        rate_limit_retries = 0
+
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"{host} is failing, request skipped until it recovers")
+            if not limiter.acquire(max_wait=self.MAX_RATE_LIMIT_WAIT):
+                breaker.release_probe()
+                raise RateLimitedError(f"Rate limited by {host}, try again later")
+
+            try:
+                response = self._session().request(method, url, **kwargs)
+            except requests.RequestException as e:
+                limiter.release()
+                if RetryPolicy.is_host_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release_probe()
+                attempt += 1
+                if retryable and attempt < self.retry_policy.max_attempts:
+                    self.retry_policy.sleep(attempt)
+                    continue
+                raise
+
+            status = response.status_code
+            limiter.release(status, response.headers)
+            if RetryPolicy.is_host_failure(status=status):
+                breaker.record_failure()
+            elif status < 400:
+                breaker.record_success()
+            else:
+                breaker.release_probe()
+
+            if status == 429 and rate_limit_retries < self.MAX_RATE_LIMIT_RETRIES:
+                _, reset, retry_after = parse_rate_limit_headers(response.headers)
+                wait = retry_after if retry_after is not None else reset
+                if wait is None or wait <= self.MAX_RATE_LIMIT_WAIT:
+                    # The limiter now blocks this host until Retry-After has passed
+                    rate_limit_retries += 1
+                    response.close()
+                    continue
+            elif retryable and status in RetryPolicy.RETRYABLE_STATUS and attempt + 1 < self.retry_policy.max_attempts:
+                attempt += 1
+                response.close()
+                self.retry_policy.sleep(attempt)
+                continue
+
+            return response
+
+    def request(self, method: str, path: str, endpoint: Optional[str] = None, **kwargs) -> requests.Response:
+        """
+        Sends a request
+
+        Args:
+            method: HTTP method
+            path: Path appended to the endpoint base URL, or an absolute URL
+                  when endpoint is None
+            endpoint: Endpoint name from the endpoint configuration
+            **kwargs: Passed to requests (headers, params, json, timeout, stream, ...)
+
+        Returns:
+            requests.Response (raise_for_status() is left to the caller)
+        """
+        if endpoint is None:
+            return self._send(method, path, **kwargs)
+
+        bases = self.endpoints.get_urls(endpoint)
+        last_error: Optional[Exception] = None
+
+        for i, base in enumerate(bases):
+            is_last = i == len(bases) - 1
+            try:
+                response = self._send(method, f"{base}{path}", **kwargs)
+            except requests.RequestException as e:
+                last_error = e
+                continue
+            if response.status_code >= 500 and not is_last:
+                response.close()
+                continue
+            return response
+
+        raise last_error or requests.ConnectionError(f"No URLs configured for endpoint '{endpoint}'")
+
+    def _get_coalesced(self, parse, kind: str, path: str, endpoint: Optional[str], share_for: float, kwargs):
+        key = SingleFlight.make_key(kind, endpoint, path, kwargs.get("params"), kwargs.get("headers"))
+
+        def fetch():
+            response = self.request("GET", path, endpoint, **kwargs)
+            response.raise_for_status()
+            return parse(response)
+
+        return self._single_flight.do(key, fetch, share_for)
+
+    def get_json(self, path: str, endpoint: Optional[str] = None, share_for: float = 0.0, **kwargs):
+        """
+        GET + raise_for_status() + JSON parse, coalesced across threads
+
+        Concurrent calls with the same endpoint, path, params and headers share
+        one round trip and one parsed object (treat it as read-only).
+
+        Args:
+            path: Path or absolute URL (see request())
+            endpoint: Endpoint name
+            share_for: Seconds the parsed result is also reused after completion
+            **kwargs: Passed to requests
+
+        Returns:
+            Parsed JSON (raises requests/JSON errors)
+        """
+        return self._get_coalesced(lambda r: r.json(), "json", path, endpoint, share_for, kwargs)
+
+    def get_content(self, path: str, endpoint: Optional[str] = None, share_for: float = 0.0, **kwargs) -> bytes:
+        """Same as get_json() for raw bodies (icons, small files)"""
+        return self._get_coalesced(lambda r: r.content, "content", path, endpoint, share_for, kwargs)
+
+    def get(self, path: str, endpoint: Optional[str] = None, **kwargs) -> requests.Response:
+        """GET shortcut for request()"""
+        return self.request("GET", path, endpoint, **kwargs)
+
+    def post(self, path: str, endpoint: Optional[str] = None, **kwargs) -> requests.Response:
+        """POST shortcut for request()"""
+        return self.request("POST", path, endpoint, **kwargs)
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Returns the process-wide HTTP client"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
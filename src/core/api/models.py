@@ -0,0 +1,101 @@
+"""Compact result types shared by the API handlers"""
+
+from typing import Any, Dict, List, Optional
+
+
+class ModpackSummary:
+    """
+    One modpack search result, normalized across Modrinth and CurseForge
+
+    Only the fields the result lists need are kept (no raw API payload), in
+    slots instead of a per-instance dict. The full project data is fetched on
+    demand with ModpackManager.get_modpack_details() for the pack the user
+    opens, and cached on the instance.
+
+    The read API of the former result dicts is kept (get(), ["key"], "key" in),
+    so code written against dicts keeps working.
+    """
+
+    __slots__ = (
+        "project_id", "title", "description", "icon_url", "downloads",
+        "categories", "versions", "slug", "author", "source",
+        "server_side", "client_side", "server_pack", "updated",
+        "alternates", "details",
+    )
+
+    def __init__(
+        self,
+        project_id: str,
+        title: str,
+        source: str,
+        description: str = "",
+        icon_url: str = "",
+        downloads: int = 0,
+        categories: Optional[List[str]] = None,
+        versions: Optional[List[str]] = None,
+        slug: str = "",
+        author: str = "Unknown",
+        server_side: str = "unknown",
+        client_side: str = "unknown",
+        server_pack: bool = False,
+        updated: str = "",
+        alternates: Optional[List["ModpackSummary"]] = None
+    ):
+        self.project_id = project_id
+        self.title = title
+        self.source = source
+        self.description = description
+        self.icon_url = icon_url
+        self.downloads = downloads
+        self.categories = categories or []
+        self.versions = versions or []
+        self.slug = slug
+        self.author = author
+        self.server_side = server_side
+        self.client_side = client_side
+        self.server_pack = server_pack
+        self.updated = updated
+        self.alternates = alternates or []
+        # Full project payload, filled by get_modpack_details()
+        self.details: Optional[Dict] = None
+
+    @property
+    def _curseforge_id(self) -> Optional[int]:
+        """Numeric CurseForge project ID (None for Modrinth packs)"""
+        if self.source != "curseforge":
+            return None
+        try:
+            return int(self.project_id)
+        except (TypeError, ValueError):
+            return None
+
+    # Dict-style read access
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if isinstance(key, str) else default
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return isinstance(key, str) and hasattr(self, key)
+
+    def with_alternates(self, alternates: List["ModpackSummary"]) -> "ModpackSummary":
+        """Returns a copy with another alternates list (the details cache is shared)"""
+        copy = ModpackSummary.__new__(ModpackSummary)
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        copy.alternates = alternates
+        return copy
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the summary fields (without details/alternates)"""
+        data = {name: getattr(self, name) for name in self.__slots__ if name not in ("details", "alternates")}
+        if self.source == "curseforge":
+            data["_curseforge_id"] = self._curseforge_id
+        return data
+
+    def __repr__(self) -> str:
+        return f"ModpackSummary({self.source}:{self.project_id} {self.title!r})"
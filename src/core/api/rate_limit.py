@@ -0,0 +1,184 @@
+"""Per-host adaptive concurrency driven by rate-limit response headers"""
+
+import time
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Optional, Tuple
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+
+    Returns:
+        Seconds to wait, or None if missing/invalid
+    """
+    if not value:
+        return None
+    seconds = _parse_number(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(headers) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Reads the rate-limit headers PyCraft's upstreams send
+
+    Modrinth:          X-Ratelimit-Remaining / X-Ratelimit-Reset (seconds)
+    CurseForge proxy:  X-RateLimit-Remaining-Minute (UTC-minute window)
+    Both:              Retry-After on 429
+
+    Args:
+        headers: Case-insensitive response headers
+
+    Returns:
+        Tuple of (remaining requests, seconds until the window resets, retry-after seconds)
+    """
+    remaining = _parse_number(headers.get("X-Ratelimit-Remaining"))
+    reset = _parse_number(headers.get("X-Ratelimit-Reset"))
+
+    if remaining is None:
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining-Minute"))
+        if remaining is not None:
+            # The proxy counts per calendar minute (UTC)
+            reset = 60 - (time.time() % 60)
+
+    return remaining, reset, parse_retry_after(headers.get("Retry-After"))
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency window for one host
+
+    Every successful response grows the window by 1/limit (about +1 per
+    round trip). A 429/503, a nearly exhausted rate-limit budget or a server
+    error halves it. When the budget is low, requests are additionally spaced
+    so the remaining quota lasts until the window resets, and Retry-After /
+    an exhausted budget blocks new requests until the server allows them.
+    """
+
+    INITIAL_LIMIT = 4.0
+    MIN_LIMIT = 1.0
+    MAX_LIMIT = 32.0
+    DECREASE_FACTOR = 0.5
+    DECREASE_COOLDOWN = 1.0  # At most one halving per second (one per "RTT")
+    DEFAULT_RETRY_AFTER = 1.0
+
+    def __init__(self):
+        self.limit = self.INITIAL_LIMIT
+        self.in_flight = 0
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        self._pace_interval = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._waiters: List[Callable[[], None]] = []  # try_acquire() callers waiting for a free slot
+
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Blocks until a request may be sent to this host
+
+        Args:
+            max_wait: Give up instead of waiting for a block longer than this
+
+        Returns:
+            True once a slot is held, False if the host is blocked beyond max_wait
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = max(self._blocked_until, self._next_slot) - now
+                if max_wait is not None and wait > max_wait:
+                    return False
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self.in_flight += 1
+            if self._pace_interval:
+                self._next_slot = now + self._pace_interval
+            return True
+
+    def try_acquire(self, on_release: Optional[Callable[[], None]] = None) -> Optional[float]:
+        """
+        Non-blocking acquire for asyncio callers
+
+        Args:
+            on_release: Called once (from the releasing thread) when a slot
+                        frees up, if the window is full now
+
+        Returns:
+            0.0 if a slot is now held, seconds to wait if the host is blocked
+            or paced, or None if the window is full (retry after on_release)
+        """
+        with self._cond:
+            now = time.monotonic()
+            wait = max(self._blocked_until, self._next_slot) - now
+            if wait > 0:
+                return wait
+            if self.in_flight >= int(self.limit):
+                if on_release:
+                    self._waiters.append(on_release)
+                return None
+            self.in_flight += 1
+            if self._pace_interval:
+                self._next_slot = now + self._pace_interval
+            return 0.0
+
+    def _decrease(self, now: float):
+        if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+            self.limit = max(self.MIN_LIMIT, self.limit * self.DECREASE_FACTOR)
+            self._last_decrease = now
+
+    def release(self, status: Optional[int] = None, headers=None):
+        """
+        Frees the slot and adapts the window to the response
+
+        Args:
+            status: HTTP status code (None for connection errors)
+            headers: Response headers
+        """
+        remaining, reset, retry_after = parse_rate_limit_headers(headers) if headers is not None else (None, None, None)
+
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if status == 429 or (status == 503 and retry_after is not None):
+                self._decrease(now)
+                delay = retry_after if retry_after is not None else (reset or self.DEFAULT_RETRY_AFTER)
+                self._blocked_until = max(self._blocked_until, now + delay)
+            elif remaining is not None and remaining <= 0 and reset is not None:
+                self._decrease(now)
+                self._blocked_until = max(self._blocked_until, now + reset)
+            elif remaining is not None and reset is not None and remaining < self.limit * 2:
+                # Budget nearly spent: shrink and pace the rest over the window
+                self._decrease(now)
+                self._pace_interval = reset / max(remaining, 1.0)
+            elif status is not None and status >= 500:
+                self._decrease(now)
+            elif status is not None:
+                self.limit = min(self.MAX_LIMIT, self.limit + 1.0 / self.limit)
+                self._pace_interval = 0.0
+
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+
+        for wake in waiters:
+            try:
+                wake()
+            except RuntimeError:
+                pass  # The waiter's event loop is already closed
@@ -0,0 +1,154 @@
+"""Shared retry policy: exponential backoff with full jitter and per-host circuit breakers"""
+
+import time
+import random
+import threading
+import requests
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class CircuitOpenError(requests.RequestException):
+    """The host's circuit breaker is open: the request was not sent"""
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed request
+
+    Delays use "full jitter": a random value between 0 and
+    min(max_delay, base_delay * 2^attempt). Parallel workers hitting the same
+    degraded host therefore spread out instead of retrying in lockstep.
+    """
+
+    RETRYABLE_STATUS = (408, 425, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 20.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before retry number `attempt` (1 = first retry)
+
+        Args:
+            attempt: Retry number, starting at 1
+
+        Returns:
+            Seconds to sleep
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** max(0, attempt - 1)))
+        return random.uniform(0, cap)
+
+    def sleep(self, attempt: int):
+        time.sleep(self.backoff(attempt))
+
+    @staticmethod
+    def is_host_failure(error: Optional[Exception] = None, status: Optional[int] = None) -> bool:
+        """True for failures that say something about the host's health (not 4xx)"""
+        if status is not None:
+            return status >= 500
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code >= 500
+        return isinstance(error, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+
+    closed     Requests flow; consecutive host failures are counted
+    open       After failure_threshold failures, requests fail fast for
+               recovery_timeout seconds
+    half_open  One probe request is let through; success closes the circuit,
+               failure re-opens it (with the timeout doubled up to a cap)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 15.0, max_recovery_timeout: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.base_recovery_timeout = recovery_timeout
+        self.recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Returns True if a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: a single probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.recovery_timeout = self.base_recovery_timeout
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.recovery_timeout = min(self.max_recovery_timeout, self.recovery_timeout * 2)
+                self._open()
+                return
+            self.failures += 1
+            if self.state == self.CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def release_probe(self):
+        """Ends a probe that was neither a success nor a host failure (e.g. a 404)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self.failures = 0
+            self._probe_in_flight = False
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_default_policy = RetryPolicy()
+
+
+def get_circuit_breaker(url_or_host: str) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit breaker of a host
+
+    Args:
+        url_or_host: URL or bare host name
+    """
+    host = (urlparse(url_or_host).netloc if "://" in url_or_host else url_or_host).lower()
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[host] = breaker
+        return breaker
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Returns the default retry policy"""
+    return _default_policy
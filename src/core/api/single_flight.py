@@ -0,0 +1,98 @@
+"""Request coalescing: concurrent identical calls share one execution"""
+
+import time
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "expires_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.expires_at = 0.0
+
+
+class SingleFlight:
+    """
+    Runs a function once per key while callers overlap
+
+    The first caller for a key executes the function; callers arriving while
+    it runs wait and receive the same result (or exception). With share_for,
+    a finished result is also handed to callers arriving shortly after, which
+    covers back-to-back lookups of the same resource.
+
+    Results are shared objects: callers must treat them as read-only.
+    """
+
+    # Finished entries are swept once the table grows past this size
+    PRUNE_THRESHOLD = 256
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def _prune(self, now: float):
+        expired = [k for k, c in self._calls.items() if c.done.is_set() and c.expires_at < now]
+        for k in expired:
+            del self._calls[k]
+
+    def do(self, key: Hashable, fn: Callable[[], Any], share_for: float = 0.0) -> Any:
+        """
+        Executes fn, or joins an identical call already in flight
+
+        Args:
+            key: Request signature
+            fn: Function producing the result
+            share_for: Seconds a finished result stays shared (0 = in-flight only)
+
+        Returns:
+            The result of fn (raises its exception)
+        """
+        with self._lock:
+            now = time.monotonic()
+            call = self._calls.get(key)
+            if call and call.done.is_set() and call.expires_at < now:
+                del self._calls[key]
+                call = None
+            leader = call is None
+            if leader:
+                if len(self._calls) >= self.PRUNE_THRESHOLD:
+                    self._prune(now)
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            call.expires_at = time.monotonic() + share_for
+            with self._lock:
+                # Failed calls and in-flight-only keys are forgotten right away
+                if (call.error or not share_for) and self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+        if call.error:
+            raise call.error
+        return call.result
+
+    @staticmethod
+    def make_key(*parts: Any, **kwargs: Any) -> Tuple:
+        """Builds a hashable signature from positional parts and (nested) keyword values"""
+        def freeze(value):
+            if isinstance(value, dict):
+                return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+            if isinstance(value, (list, tuple, set)):
+                return tuple(freeze(v) for v in value)
+            return value
+        return tuple(freeze(p) for p in parts) + freeze(kwargs)
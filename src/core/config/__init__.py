@@ -1,3 +1,7 @@
 """
 Config Package - Configuración de la aplicación
 """
+
+from .endpoints import EndpointConfig, get_endpoint_config, DEFAULT_ENDPOINTS
+
+__all__ = ["EndpointConfig", "get_endpoint_config", "DEFAULT_ENDPOINTS"]
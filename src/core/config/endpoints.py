@@ -0,0 +1,130 @@
+"""Configurable service endpoints with ordered mirror fallback"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Upstream defaults. API classes keep their historical class constants
+# (ModrinthAPI.BASE_URL, ...) pointing at these values.
+DEFAULT_ENDPOINTS: Dict[str, str] = {
+    "mojang_manifest": "https://launchermeta.mojang.com/mc/game/version_manifest.json",
+    "modrinth_api": "https://api.modrinth.com/v2",
+    "curseforge_proxy": "https://pycraft-curseforge-proxy.conradogomez556.workers.dev",
+    "forge_maven": "https://maven.minecraftforge.net/net/minecraftforge/forge",
+    "forge_promotions": "https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json",
+    "fabric_meta": "https://meta.fabricmc.net/v2",
+    "adoptium_api": "https://api.adoptium.net/v3",
+}
+
+# Endpoints without an upstream default (only used when configured)
+OPTIONAL_ENDPOINTS = ("artifact_mirror",)
+
+
+class EndpointConfig:
+    """
+    Loads endpoint overrides from ~/.pycraft/endpoints.json
+
+    File format:
+        {
+          "endpoints": {
+            "modrinth_api": ["http://10.0.0.5:8080/v2"],
+            "artifact_mirror": ["http://10.0.0.5:8765"]
+          },
+          "include_defaults": true
+        }
+
+    Configured URLs are tried in order; with include_defaults (the default) the
+    upstream URL is appended as the last fallback.
+    """
+
+    def __init__(self, config_file: Optional[Path] = None):
+        self.config_file = config_file or (Path.home() / ".pycraft" / "endpoints.json")
+        self._lock = threading.Lock()
+        self._overrides: Dict[str, List[str]] = {}
+        self._include_defaults = True
+        self.reload()
+
+    def reload(self):
+        """Re-reads the configuration file"""
+        overrides: Dict[str, List[str]] = {}
+        include_defaults = True
+        try:
+            if self.config_file.exists():
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                include_defaults = bool(data.get("include_defaults", True))
+                for name, urls in data.get("endpoints", {}).items():
+                    if isinstance(urls, str):
+                        urls = [urls]
+                    overrides[name] = [u.rstrip("/") for u in urls if isinstance(u, str) and u]
+        except Exception as e:
+            print(f"Error loading endpoint configuration: {e}")
+
+        with self._lock:
+            self._overrides = overrides
+            self._include_defaults = include_defaults
+
+    def get_urls(self, name: str) -> List[str]:
+        """
+        Returns the ordered list of base URLs for an endpoint
+
+        Args:
+            name: Endpoint name (see DEFAULT_ENDPOINTS / OPTIONAL_ENDPOINTS)
+
+        Returns:
+            List of URLs, most preferred first (empty for unset optional endpoints)
+        """
+        with self._lock:
+            urls = list(self._overrides.get(name, []))
+            include_defaults = self._include_defaults
+
+        default = DEFAULT_ENDPOINTS.get(name)
+        if default and (include_defaults or not urls) and default not in urls:
+            urls.append(default)
+        return urls
+
+    def get_url(self, name: str) -> Optional[str]:
+        """Returns the preferred URL for an endpoint"""
+        urls = self.get_urls(name)
+        return urls[0] if urls else None
+
+    def set_urls(self, name: str, urls: List[str]) -> bool:
+        """
+        Saves the override list for an endpoint
+
+        Args:
+            name: Endpoint name
+            urls: Ordered URLs (empty list removes the override)
+
+        Returns:
+            True if saved successfully
+        """
+        with self._lock:
+            if urls:
+                self._overrides[name] = [u.rstrip("/") for u in urls]
+            else:
+                self._overrides.pop(name, None)
+            data = {"endpoints": self._overrides, "include_defaults": self._include_defaults}
+
+        try:
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error saving endpoint configuration: {e}")
+            return False
+
+
+_shared_config: Optional[EndpointConfig] = None
+_shared_lock = threading.Lock()
+
+
+def get_endpoint_config() -> EndpointConfig:
+    """Returns the process-wide endpoint configuration"""
+    global _shared_config
+    with _shared_lock:
+        if _shared_config is None:
+            _shared_config = EndpointConfig()
+        return _shared_config
@@ -3,5 +3,7 @@ Download Package - Manejo de descargas de archivos
 """
 
 from .downloader import ServerDownloader
+from .artifacts import ArtifactDownloader
+from .mirror_server import MirrorServer
 
-__all__ = ["ServerDownloader"]
+__all__ = ["ServerDownloader", "ArtifactDownloader", "MirrorServer"]
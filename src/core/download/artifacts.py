@@ -0,0 +1,453 @@
+"""Artifact resolution: local cache -> mirror folders -> network"""
+
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+import requests
+from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..api.retry import CircuitOpenError, RetryPolicy, get_circuit_breaker
+from ..config import get_endpoint_config
+from ..storage import ArtifactCache, place_file, protect_file
+
+
+class HostStats:
+    """
+    Download throughput history per host, used to rank candidate URLs
+
+    Throughput is an exponentially weighted moving average of bytes/second
+    (including time to first byte, so slow-to-answer hosts rank lower too).
+    Failures divide the score until the host succeeds again. History is kept
+    in ~/.pycraft/cache/download_hosts.json so rankings survive restarts.
+    """
+
+    ALPHA = 0.3
+    DEFAULT_THROUGHPUT = 1024 * 1024  # Unknown hosts rank as 1 MiB/s
+    MAX_FAILURES = 8
+    SAVE_INTERVAL = 10.0
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or (Path.home() / ".pycraft" / "cache" / "download_hosts.json")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._last_save = time.monotonic()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for host, entry in json.load(f).items():
+                    # Old failures count half: hosts get a second chance after a restart
+                    self._stats[host] = {
+                        "bps": float(entry.get("bps", self.DEFAULT_THROUGHPUT)),
+                        "failures": float(entry.get("failures", 0)) // 2,
+                    }
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def score(self, url: str) -> float:
+        """Expected throughput of a URL's host (higher is better)"""
+        with self._lock:
+            entry = self._stats.get(self.host_of(url))
+        if not entry:
+            return self.DEFAULT_THROUGHPUT
+        return entry["bps"] / (1 + entry["failures"])
+
+    def rank(self, urls: List[str]) -> List[str]:
+        """Returns the unique URLs, best host first (ties keep manifest order)"""
+        unique = list(dict.fromkeys(u for u in urls if u))
+        return sorted(unique, key=self.score, reverse=True)
+
+    def record_success(self, url: str, num_bytes: int, seconds: float):
+        bps = num_bytes / max(seconds, 0.001)
+        with self._lock:
+            entry = self._stats.get(self.host_of(url))
+            if entry:
+                entry["bps"] = self.ALPHA * bps + (1 - self.ALPHA) * entry["bps"]
+                entry["failures"] = 0
+            else:
+                self._stats[self.host_of(url)] = {"bps": bps, "failures": 0}
+        self.save()
+
+    def record_failure(self, url: str):
+        with self._lock:
+            entry = self._stats.setdefault(self.host_of(url), {"bps": self.DEFAULT_THROUGHPUT, "failures": 0})
+            entry["failures"] = min(entry["failures"] + 1, self.MAX_FAILURES)
+        self.save()
+
+    def save(self, force: bool = False):
+        """Writes the history to disk (at most every SAVE_INTERVAL seconds)"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < self.SAVE_INTERVAL:
+                return
+            self._last_save = now
+            data = json.dumps(self._stats)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            tmp_path.write_text(data, encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+_shared_host_stats: Optional[HostStats] = None
+_shared_lock = threading.Lock()
+
+
+def get_host_stats() -> HostStats:
+    """Returns the process-wide host throughput history"""
+    global _shared_host_stats
+    with _shared_lock:
+        if _shared_host_stats is None:
+            _shared_host_stats = HostStats()
+        return _shared_host_stats
+
+
+class ArtifactDownloader:
+    """
+    Fetches mod/loader artifacts into server folders.
+
+    Each artifact is described by a job dict:
+        dest      Destination path
+        urls      Candidate download URLs (may be empty for cache-only lookups)
+        sha1      Expected sha1 (optional, verified when present)
+        size      Expected size in bytes (optional)
+        key       Alias key for sources without hashes (e.g. "curseforge:<fileID>")
+        filename  Original file name (used for loose-file mirror lookups)
+        race      Overrides the downloader's race setting for this job
+        local     False to skip the cache and mirror folders (repairs)
+
+    Resolution order is the local artifact cache, then each mirror folder, then
+    any HTTP artifact mirrors ("artifact_mirror" endpoint, e.g. a LAN
+    MirrorServer), and only then the upstream URLs.
+
+    Upstream URLs are tried fastest host first (see HostStats). A download
+    that errors, fails verification or stalls for STALL_TIMEOUT seconds
+    fails over to the next URL; hosts whose circuit breaker is open are
+    skipped without a request. With race enabled, the two best hosts are
+    opened concurrently and whichever delivers the first bytes is kept,
+    which cuts tail latency on packs with hundreds of small files.
+
+    Network downloads are verified and added to the cache, so the next
+    install of the same pack is pure local disk I/O.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    CONNECT_TIMEOUT = 10
+    STALL_TIMEOUT = 20  # Seconds without receiving a byte before failing over
+
+    def __init__(
+        self,
+        cache: Optional[ArtifactCache] = None,
+        mirror_dirs: Optional[List[str]] = None,
+        max_workers: int = 8,
+        user_agent: str = "PyCraft/1.0",
+        race: bool = False,
+        host_stats: Optional[HostStats] = None
+    ):
+        self.cache = cache or ArtifactCache()
+        self.mirrors = [ArtifactCache(d, read_only=True) for d in (mirror_dirs or [])]
+        self.max_workers = max_workers
+        self._local = threading.local()
+        self.user_agent = user_agent
+        self.race = race
+        self.host_stats = host_stats or get_host_stats()
+        self._race_pool: Optional[ThreadPoolExecutor] = None
+        self._race_pool_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        """One keep-alive session per worker thread"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": self.user_agent})
+            self._local.session = session
+        return session
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """
+        Resolves an alias key in the cache or any mirror
+
+        Args:
+            key: Alias key
+
+        Returns:
+            Entry dict with sha1, filename and path, or None
+        """
+        for store in [self.cache] + self.mirrors:
+            entry = store.lookup(key)
+            if entry:
+                return entry
+        return None
+
+    def _find_local(self, job: Dict) -> Optional[str]:
+        """Returns a local path holding the artifact, or None"""
+        sha1 = job.get("sha1")
+        key = job.get("key")
+        size = job.get("size")
+        for store in [self.cache] + self.mirrors:
+            path = store.get(sha1, size)
+            if not path and key:
+                entry = store.lookup(key, size)
+                path = entry["path"] if entry else None
+            if path:
+                return path
+        for store in self.mirrors:
+            path = store.find_file(job.get("filename") or os.path.basename(job["dest"]), sha1, size)
+            if path:
+                return path
+        return None
+
+    def _http_mirror_urls(self, job: Dict) -> List[str]:
+        """Builds candidate URLs on the configured HTTP artifact mirrors"""
+        mirrors = get_endpoint_config().get_urls("artifact_mirror")
+        if not mirrors:
+            return []
+
+        sha1 = job.get("sha1")
+        urls = []
+        for mirror in mirrors:
+            mirror_sha1 = sha1
+            if not mirror_sha1 and job.get("key"):
+                # Resolve the alias on the mirror (same keys/ layout as the cache)
+                try:
+                    response = self._session().get(
+                        f"{mirror}/keys/{ArtifactCache.key_filename(job['key'])}", timeout=5
+                    )
+                    if response.status_code == 200:
+                        mirror_sha1 = response.json().get("sha1")
+                except (requests.RequestException, ValueError):
+                    continue
+            if mirror_sha1:
+                mirror_sha1 = mirror_sha1.lower()
+                urls.append(f"{mirror}/{mirror_sha1[:2]}/{mirror_sha1}")
+        return urls
+
+    def _open(self, url: str) -> Tuple[requests.Response, bytes, object, float]:
+        """Opens a URL and waits for its first chunk"""
+        breaker = get_circuit_breaker(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{HostStats.host_of(url)} is failing, skipped")
+
+        started = time.monotonic()
+        response = None
+        try:
+            response = self._session().get(
+                url, stream=True, timeout=(self.CONNECT_TIMEOUT, self.STALL_TIMEOUT), allow_redirects=True
+            )
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=self.CHUNK_SIZE)
+            first = next(chunks, b"")
+        except Exception as e:
+            if response is not None:
+                response.close()
+            if RetryPolicy.is_host_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
+            raise
+        breaker.record_success()
+        return response, first, chunks, started
+
+    def _get_race_pool(self) -> ThreadPoolExecutor:
+        with self._race_pool_lock:
+            if self._race_pool is None:
+                self._race_pool = ThreadPoolExecutor(
+                    max_workers=max(2, self.max_workers * 2), thread_name_prefix="artifact-race"
+                )
+            return self._race_pool
+
+    def _race(self, urls: List[str]) -> Optional[Tuple[str, tuple]]:
+        """
+        Opens several URLs at once and keeps the first one to deliver bytes
+
+        Losers are closed as soon as they answer, so the extra traffic is at
+        most one chunk per losing host.
+
+        Returns:
+            Tuple of (url, opened response) for the winner, or None if all failed
+        """
+        lock = threading.Lock()
+        done = threading.Event()
+        state = {"winner": None, "pending": len(urls)}
+
+        def on_done(future, url):
+            try:
+                opened = future.result()
+            except Exception:
+                self.host_stats.record_failure(url)
+                opened = None
+            with lock:
+                state["pending"] -= 1
+                if opened and state["winner"] is None:
+                    state["winner"] = (url, opened)
+                    done.set()
+                    return
+                if state["pending"] == 0:
+                    done.set()
+            if opened:
+                opened[0].close()
+
+        pool = self._get_race_pool()
+        for url in urls:
+            pool.submit(self._open, url).add_done_callback(lambda f, u=url: on_done(f, u))
+        done.wait()
+        return state["winner"]
+
+    def _receive(self, url: str, opened: tuple, job: Dict) -> bool:
+        """Streams an opened response to a staging file, verifies it and moves it to dest"""
+        response, first, chunks, started = opened
+        dest = job["dest"]
+        tmp_path = f"{dest}.{uuid.uuid4().hex[:8]}.pycraft-part"
+        digest = hashlib.sha1()
+        try:
+            with response, open(tmp_path, 'wb') as f:
+                if first:
+                    f.write(first)
+                    digest.update(first)
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+
+            sha1 = digest.hexdigest()
+            expected = job.get("sha1")
+            if expected and sha1 != expected.lower():
+                raise ValueError(f"sha1 mismatch ({sha1} != {expected})")
+            size = os.path.getsize(tmp_path)
+            if job.get("size") is not None and size != job["size"]:
+                raise ValueError("size mismatch")
+
+            self.host_stats.record_success(url, size, time.monotonic() - started)
+            keys = [job["key"]] if job.get("key") else []
+            self.cache.put(tmp_path, sha1, keys, job.get("filename") or os.path.basename(dest))
+            os.replace(tmp_path, dest)
+            job["sha1"] = sha1
+            return True
+        except Exception as e:
+            self.host_stats.record_failure(url)
+            job["error"] = f"{type(e).__name__}: {e}"
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def _download(self, url: str, job: Dict) -> bool:
+        """Downloads one URL into job["dest"]"""
+        try:
+            opened = self._open(url)
+        except Exception as e:
+            self.host_stats.record_failure(url)
+            job["error"] = f"{type(e).__name__}: {e}"
+            return False
+        return self._receive(url, opened, job)
+
+    def _download_any(self, urls: List[str], job: Dict) -> bool:
+        """Tries candidate URLs best host first, racing the top two if enabled"""
+        candidates = self.host_stats.rank(urls)
+        race = job.get("race", self.race)
+
+        if race and len({HostStats.host_of(u) for u in candidates[:2]}) == 2:
+            winner = self._race(candidates[:2])
+            if winner:
+                url, opened = winner
+                if self._receive(url, opened, job):
+                    return True
+                candidates.remove(url)
+            else:
+                # Both failed to open; only the remaining hosts are left
+                candidates = candidates[2:]
+                job["error"] = "all raced mirrors failed"
+
+        for url in candidates:
+            if self._download(url, job):
+                return True
+        return False
+
+    def fetch(self, job: Dict) -> Optional[str]:
+        """
+        Resolves one artifact into job["dest"]
+
+        Args:
+            job: Artifact job dict (see class docstring)
+
+        Returns:
+            "cache", "mirror" or "network" depending on where it came from,
+            or None if it could not be resolved (job["error"] has the reason)
+        """
+        os.makedirs(os.path.dirname(job["dest"]) or ".", exist_ok=True)
+
+        local = self._find_local(job) if job.get("local", True) else None
+        from_cache = bool(local) and local.startswith(str(self.cache.root))
+        if from_cache:
+            # Entries cached before they were protected on put()
+            protect_file(local)
+        if local and place_file(local, job["dest"]):
+            if from_cache:
+                return "cache"
+            # Keep mirror hits locally so later installs don't need the mirror
+            keys = [job["key"]] if job.get("key") else []
+            self.cache.put(local, job.get("sha1"), keys, job.get("filename") or os.path.basename(job["dest"]))
+            return "mirror"
+
+        for url in self._http_mirror_urls(job):
+            if self._download(url, job):
+                return "mirror"
+
+        if self._download_any(job.get("urls") or [], job):
+            return "network"
+
+        job.setdefault("error", "not in cache or mirrors" if not job.get("urls") else "download failed")
+        return None
+
+    def fetch_many(
+        self,
+        jobs: List[Dict],
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolves many artifacts concurrently
+
+        Args:
+            jobs: Artifact job dicts
+            log_callback: Function to report progress (one line per artifact)
+
+        Returns:
+            Dict mapping dest -> source ("cache"/"mirror"/"network") or None on failure
+        """
+        results: Dict[str, Optional[str]] = {}
+        if not jobs:
+            return results
+
+        total = len(jobs)
+        workers = max(1, min(self.max_workers, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.fetch, job): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                job = futures[future]
+                try:
+                    source = future.result()
+                except Exception as e:
+                    job["error"] = str(e)
+                    source = None
+                results[job["dest"]] = source
+
+                if log_callback:
+                    name = os.path.basename(job["dest"])
+                    if source:
+                        log_callback(f"  [{done}/{total}] {name} [OK]{'' if source == 'network' else f' ({source})'}\n")
+                    else:
+                        log_callback(f"  [{done}/{total}] {name} [ERROR: {job.get('error')}]\n")
+
+        self.host_stats.save(force=True)
+        return results
@@ -2,12 +2,16 @@ import requests
 import os
 from typing import Optional, Callable
 
+from ..api.retry import RetryPolicy, get_circuit_breaker, get_retry_policy
+from ..storage import make_private
+
 
 class ServerDownloader:
     """Handles Minecraft server.jar download"""
 
-    def __init__(self):
+    def __init__(self, retry_policy: Optional[RetryPolicy] = None):
         self.download_progress = 0
+        self.retry_policy = retry_policy or get_retry_policy()
         # Create persistent session for better performance
         self.session = requests.Session()
         self.session.headers.update({
@@ -50,12 +54,19 @@ class ServerDownloader:
         file_name = "server.jar"
         file_path = os.path.join(destination_folder, file_name)
 
-        # Attempt download with retries
+        # Attempt download with retries (jittered backoff, fail fast while the host is down)
+        breaker = get_circuit_breaker(url)
         for attempt in range(max_retries):
+            if attempt > 0:
+                delay = self.retry_policy.backoff(attempt)
+                print(f"\nRetrying download in {delay:.1f}s (attempt {attempt + 1}/{max_retries})...")
+                time.sleep(delay)
+
+            if not breaker.allow():
+                print("Download host is failing, skipping until it recovers")
+                return None
+
             try:
-                if attempt > 0:
-                    print(f"\nRetrying download (attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(2)  # Wait before retrying
 
                 # Perform download with persistent session
                 response = self.session.get(url, stream=True, timeout=60)
@@ -69,6 +80,9 @@ class ServerDownloader:
                 # Use 1 MB chunk size for much faster download
                 chunk_size = 1024 * 1024  # 1 MB
 
+                # server.jar may be hard-linked to other servers after a dedup pass
+                make_private(file_path)
+
                 # Write file in large blocks with optimized buffer
                 with open(file_path, 'wb', buffering=chunk_size * 2) as file:
                     for chunk in response.iter_content(chunk_size=chunk_size):
@@ -89,12 +103,15 @@ class ServerDownloader:
                     actual_size = os.path.getsize(file_path)
                     if actual_size < total_size * 0.95:  # Allow 5% margin
                         print(f"Incomplete download: {actual_size}/{total_size} bytes")
+                        breaker.record_failure()
                         if attempt < max_retries - 1:
                             continue  # Retry
                         else:
                             print("Incomplete download after all retries")
                             return None
 
+                breaker.record_success()
+
                 # Ensure progress reaches 100%
                 if progress_callback:
                     progress_callback(100)
@@ -104,6 +121,7 @@ class ServerDownloader:
 
             except requests.Timeout:
                 print(f"\nTimeout during download (attempt {attempt + 1}/{max_retries})")
+                breaker.record_failure()
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -112,6 +130,10 @@ class ServerDownloader:
 
             except requests.RequestException as e:
                 print(f"\nNetwork error: {str(e)}")
+                if RetryPolicy.is_host_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release_probe()
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -120,10 +142,12 @@ class ServerDownloader:
 
             except PermissionError as e:
                 print(f"\nPermission error writing file: {e}")
+                breaker.release_probe()
                 return None  # Don't retry permission errors
 
             except Exception as e:
                 print(f"\nUnexpected error downloading: {str(e)} ({type(e).__name__})")
+                breaker.release_probe()
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -0,0 +1,120 @@
+"""LAN mirror: serves the local artifact cache over HTTP"""
+
+import re
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+from ..storage import ArtifactCache
+
+
+class MirrorServer:
+    """
+    Read-only HTTP server for an ArtifactCache
+
+    Other PyCraft instances point their "artifact_mirror" endpoint at it
+    (e.g. http://192.168.1.10:8765) and resolve artifacts from this machine
+    before going to the internet. Only the cache layout is exposed:
+
+        GET /<sha1[:2]>/<sha1>       artifact content
+        GET /keys/<key>.json         alias entry
+    """
+
+    ARTIFACT_PATH = re.compile(r'^/([0-9a-f]{2})/([0-9a-f]{40})$')
+    KEY_PATH = re.compile(r'^/keys/([A-Za-z0-9._-]+\.json)$')
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        cache: Optional[ArtifactCache] = None,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        log_callback: Optional[Callable[[str], None]] = None
+    ):
+        self.cache = cache or ArtifactCache()
+        self.host = host
+        self.port = port
+        self.log_callback = log_callback
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _resolve(self, path: str):
+        """Maps a request path to a file inside the cache, or None"""
+        path = path.split("?", 1)[0]
+        match = self.ARTIFACT_PATH.match(path)
+        if match and match.group(2).startswith(match.group(1)):
+            return self.cache.get(match.group(2))
+        match = self.KEY_PATH.match(path)
+        if match:
+            key_path = self.cache.root / "keys" / match.group(1)
+            return str(key_path) if key_path.is_file() else None
+        return None
+
+    def _make_handler(self):
+        mirror = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, include_body: bool):
+                file_path = mirror._resolve(self.path)
+                if not file_path:
+                    self.send_error(404)
+                    return
+                try:
+                    with open(file_path, 'rb') as f:
+                        f.seek(0, 2)
+                        size = f.tell()
+                        f.seek(0)
+                        self.send_response(200)
+                        content_type = "application/json" if file_path.endswith(".json") else "application/octet-stream"
+                        self.send_header("Content-Type", content_type)
+                        self.send_header("Content-Length", str(size))
+                        self.end_headers()
+                        if include_body:
+                            shutil.copyfileobj(f, self.wfile, mirror.CHUNK_SIZE)
+                except (OSError, ConnectionError):
+                    pass
+
+            def do_GET(self):
+                self._send(True)
+
+            def do_HEAD(self):
+                self._send(False)
+
+            def log_message(self, format, *args):
+                if mirror.log_callback:
+                    mirror.log_callback(f"[Mirror] {self.address_string()} {format % args}\n")
+
+        return Handler
+
+    def start(self) -> bool:
+        """
+        Starts serving in a background thread
+
+        Returns:
+            True if the server is listening
+        """
+        if self._server:
+            return True
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        except OSError as e:
+            if self.log_callback:
+                self.log_callback(f"✗ Could not start mirror on {self.host}:{self.port}: {e}\n")
+            self._server = None
+            return False
+
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        if self.log_callback:
+            self.log_callback(f"[OK] Mirror serving {self.cache.root} on {self.host}:{self.port}\n")
+        return True
+
+    def stop(self):
+        """Stops the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
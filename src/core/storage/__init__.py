@@ -0,0 +1,23 @@
+"""
+Storage Package - Hashing, deduplicación, verificación, caché de artefactos y catálogo local
+"""
+
+from .hashing import hash_file, hash_files
+from .dedup import ServerDeduplicator, make_private, protect_file
+from .verify import verify_files, expected_from_modrinth_index
+from .artifact_cache import ArtifactCache, place_file
+from .modpack_catalog import ModpackCatalog, FTS5_AVAILABLE
+
+__all__ = [
+    "hash_file",
+    "hash_files",
+    "ServerDeduplicator",
+    "make_private",
+    "protect_file",
+    "verify_files",
+    "expected_from_modrinth_index",
+    "ArtifactCache",
+    "place_file",
+    "ModpackCatalog",
+    "FTS5_AVAILABLE",
+]
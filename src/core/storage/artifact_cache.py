@@ -0,0 +1,222 @@
+"""Content-addressed cache of downloaded artifacts (mods, loader jars, packs)"""
+
+import os
+import re
+import json
+import uuid
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .hashing import hash_file
+from .dedup import protect_file
+
+
+def place_file(source: str, dest: str) -> bool:
+    """
+    Puts a copy of source at dest, hard-linking when possible
+
+    The file is staged next to dest and moved in with os.replace, so an existing
+    (possibly hard-linked) dest is swapped out instead of written through.
+
+    Args:
+        source: Existing file
+        dest: Destination path
+
+    Returns:
+        True if dest now has the content of source
+    """
+    # Unique staging name: several workers may place the same artifact at once
+    tmp_path = f"{dest}.{uuid.uuid4().hex[:8]}.pycraft-part"
+    try:
+        os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, dest)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+class ArtifactCache:
+    """
+    Stores artifacts by sha1 under ~/.pycraft/cache/artifacts
+
+    Layout:
+        <root>/<sha1[:2]>/<sha1>      artifact content
+        <root>/keys/<key>.json        alias -> {sha1, filename}, used for sources
+                                      whose manifests carry no hash (CurseForge
+                                      file IDs, loader installer URLs)
+
+    The same layout is used for read-only mirror folders (a copied cache, a
+    network share or the LAN mirror), so any PyCraft cache can act as a mirror.
+
+    Entries are hard-linked into server folders, so they are made read-only
+    (protect_file) like deduplicated files: an in-place write to an installed
+    mod fails instead of corrupting the cache for every later install.
+    """
+
+    DEFAULT_ROOT = Path.home() / ".pycraft" / "cache" / "artifacts"
+
+    def __init__(self, root: Optional[str] = None, read_only: bool = False):
+        self.root = Path(root) if root else self.DEFAULT_ROOT
+        self.read_only = read_only
+
+    @staticmethod
+    def key_filename(key: str) -> str:
+        """Returns the file name an alias key is stored under (also used by HTTP mirrors)"""
+        return re.sub(r'[^A-Za-z0-9._-]', '_', key) + ".json"
+
+    def path_for(self, sha1: str) -> Path:
+        """Returns where an artifact with this sha1 lives in the cache"""
+        sha1 = sha1.lower()
+        return self.root / sha1[:2] / sha1
+
+    def get(self, sha1: Optional[str], size: Optional[int] = None) -> Optional[str]:
+        """
+        Looks up an artifact by sha1
+
+        Args:
+            sha1: Expected sha1 hex digest
+            size: Expected size in bytes; an entry of another size is corrupt
+                  and removed (cheap check instead of re-hashing every hit)
+
+        Returns:
+            Path to the cached file, or None on a miss
+        """
+        if not sha1:
+            return None
+        path = self.path_for(sha1)
+        try:
+            actual_size = path.stat().st_size
+        except OSError:
+            return None
+        if size is not None and actual_size != size:
+            if not self.read_only:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            return None
+        return str(path)
+
+    def evict_if_corrupt(self, sha1: Optional[str]) -> bool:
+        """
+        Re-hashes a cached artifact and removes it if its content doesn't match
+
+        get() trusts the file name; this is for repairs, where a corrupt
+        install may share its inode (hard link) with the cache entry.
+
+        Returns:
+            True if a corrupt entry was removed
+        """
+        path = self.get(sha1)
+        if not path or self.read_only:
+            return False
+        if (hash_file(path) or "").lower() == sha1.lower():
+            return False
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            return False
+
+    def lookup(self, key: str, size: Optional[int] = None) -> Optional[Dict]:
+        """
+        Resolves an alias key to its artifact entry
+
+        Args:
+            key: Alias such as "curseforge:4712345" or "url:https://..."
+            size: Expected size in bytes (see get())
+
+        Returns:
+            Dict with sha1, filename and path, or None if unknown/evicted
+        """
+        try:
+            with open(self.root / "keys" / self.key_filename(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        path = self.get(entry.get("sha1"), size)
+        if not path:
+            return None
+        entry["path"] = path
+        return entry
+
+    def find_file(self, filename: str, sha1: Optional[str] = None, size: Optional[int] = None) -> Optional[str]:
+        """
+        Finds a loose file by name (plain mirror folders full of jars)
+
+        Args:
+            filename: File name to look for in the root and its mods/ folder
+            sha1: If given, the file must match this hash
+            size: If given, the file must have this size
+
+        Returns:
+            Path to the file, or None
+        """
+        if not filename:
+            return None
+        filename = os.path.basename(filename)
+        for candidate in (self.root / filename, self.root / "mods" / filename):
+            if candidate.is_file():
+                if size is not None and candidate.stat().st_size != size:
+                    continue
+                if sha1 and (hash_file(str(candidate)) or "").lower() != sha1.lower():
+                    continue
+                return str(candidate)
+        return None
+
+    def put(
+        self,
+        path: str,
+        sha1: Optional[str] = None,
+        keys: Iterable[str] = (),
+        filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Adds a file to the cache (hard link when possible, copy otherwise)
+
+        Args:
+            path: File to add
+            sha1: Known sha1 of the file (computed if omitted)
+            keys: Alias keys to register for this artifact
+            filename: Original file name stored with the aliases
+
+        Returns:
+            sha1 of the stored artifact, or None on failure
+        """
+        if self.read_only:
+            return None
+
+        sha1 = (sha1 or hash_file(path) or "").lower()
+        if not sha1:
+            return None
+
+        target = self.path_for(sha1)
+        if not target.is_file() and not place_file(path, str(target)):
+            return None
+        protect_file(str(target))
+
+        keys = list(keys)
+        if keys:
+            keys_dir = self.root / "keys"
+            try:
+                keys_dir.mkdir(parents=True, exist_ok=True)
+                entry = json.dumps({"sha1": sha1, "filename": filename or os.path.basename(path)})
+                for key in keys:
+                    key_path = keys_dir / self.key_filename(key)
+                    tmp_path = key_path.with_name(f"{key_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+                    tmp_path.write_text(entry, encoding='utf-8')
+                    os.replace(tmp_path, key_path)
+            except OSError:
+                pass
+
+        return sha1
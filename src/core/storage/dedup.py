@@ -0,0 +1,269 @@
+"""Hard-link / reflink deduplication across server folders"""
+
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .hashing import hash_files, DEFAULT_HASH_WORKERS
+
+# Linux FICLONE ioctl (btrfs, XFS with reflink=1, bcachefs, ...)
+_FICLONE = 0x40049409
+
+
+def make_private(path: str) -> None:
+    """
+    Detaches a file from any hard links before it is rewritten in place.
+
+    Deduplicated files share one inode between servers, so opening one of them
+    with 'wb' would silently change every server that links to it. Unlinking
+    first leaves the other links intact and lets the writer create a fresh file.
+    A file that is no longer shared but still read-only (protect_file() while
+    it was) gets its owner write bit back instead.
+
+    Args:
+        path: File that is about to be overwritten
+    """
+    try:
+        info = os.stat(path)
+        if info.st_nlink > 1:
+            os.unlink(path)
+        elif not info.st_mode & stat.S_IWUSR:
+            os.chmod(path, info.st_mode | stat.S_IWUSR)
+    except OSError:
+        pass
+
+
+def protect_file(path: str) -> None:
+    """
+    Marks a shared inode read-only so in-place writes fail loudly
+
+    Used for every file hard-linked into several places (deduplicated server
+    files, artifact cache entries); writers detach first with make_private().
+    On Windows a read-only flag also blocks deleting the file, which would
+    break mod updates, so there we rely on make_private() alone.
+    """
+    if os.name == 'nt':
+        return
+    try:
+        mode = os.stat(path).st_mode
+        os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+    except OSError:
+        pass
+
+
+class ServerDeduplicator:
+    """Replaces identical files across server folders with shared copies"""
+
+    # Only these locations are safe to share: they hold immutable artifacts that
+    # PyCraft and the loaders replace wholesale instead of editing in place.
+    SHARED_SUBFOLDERS = ("mods", "libraries")
+    # Root-level files with these extensions (server.jar, loader jars)
+    ROOT_EXTENSIONS = (".jar",)
+
+    # Files that identify a folder as a PyCraft-managed server
+    SERVER_MARKERS = (
+        "server.jar", "eula.txt", "server.properties",
+        "modrinth.index.json", "manifest.json", "modpack_info.json",
+    )
+
+    def __init__(self, max_workers: int = DEFAULT_HASH_WORKERS, use_reflinks: bool = True):
+        self.max_workers = max_workers
+        self.use_reflinks = use_reflinks and sys.platform.startswith("linux")
+
+    @classmethod
+    def find_server_folders(cls, root_folders: List[str]) -> List[str]:
+        """
+        Finds server folders directly inside the given root folders
+
+        Args:
+            root_folders: Folders that contain one server per subfolder
+                          (a root that is itself a server is included too)
+
+        Returns:
+            List of server folder paths
+        """
+        found = []
+        for root in root_folders:
+            candidates = [root]
+            try:
+                candidates += [e.path for e in os.scandir(root) if e.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+            for folder in candidates:
+                if any(os.path.exists(os.path.join(folder, m)) for m in cls.SERVER_MARKERS):
+                    found.append(os.path.abspath(folder))
+        return sorted(set(found))
+
+    def _collect_files(self, server_folder: str) -> List[Tuple[str, os.stat_result]]:
+        """Lists shareable regular files of one server with their stat info"""
+        files = []
+        try:
+            for entry in os.scandir(server_folder):
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(self.ROOT_EXTENSIONS):
+                    files.append((entry.path, entry.stat(follow_symlinks=False)))
+        except OSError:
+            return files
+
+        for sub in self.SHARED_SUBFOLDERS:
+            base = os.path.join(server_folder, sub)
+            for dirpath, _dirnames, filenames in os.walk(base):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.lstat(path)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode):
+                        files.append((path, st))
+        return files
+
+    def _reflink(self, source: str, target: str) -> bool:
+        """Replaces target with a copy-on-write clone of source (Linux only)"""
+        if not self.use_reflinks:
+            return False
+        import fcntl
+
+        tmp_path = f"{target}.pycraft-dedup"
+        try:
+            with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            os.replace(tmp_path, target)
+            return True
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def _hardlink(self, source: str, target: str) -> bool:
+        """Atomically replaces target with a hard link to source"""
+        tmp_path = f"{target}.pycraft-dedup"
+        try:
+            os.link(source, tmp_path)
+            os.replace(tmp_path, target)
+            return True
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def deduplicate(
+        self,
+        server_folders: List[str],
+        dry_run: bool = False,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """
+        Hashes shareable files of all servers and links identical ones together
+
+        Files are first grouped by size, so only size collisions are hashed.
+        Each group of identical files keeps one inode; the rest become reflinks
+        when the filesystem supports them (fully independent copy-on-write
+        copies) or hard links otherwise. Hard-linked inodes are made read-only.
+
+        Args:
+            server_folders: Server folders to scan
+            dry_run: Only report what would be reclaimed
+            log_callback: Function to report progress
+
+        Returns:
+            Dict with keys: servers, files_scanned, files_hashed, duplicate_groups,
+            files_linked, reflinked, hardlinked, bytes_reclaimed, errors
+        """
+        report = {
+            "servers": len(server_folders),
+            "files_scanned": 0,
+            "files_hashed": 0,
+            "duplicate_groups": 0,
+            "files_linked": 0,
+            "reflinked": 0,
+            "hardlinked": 0,
+            "bytes_reclaimed": 0,
+            "errors": [],
+        }
+
+        if log_callback:
+            log_callback(f"Scanning {len(server_folders)} server folder(s)...\n")
+
+        workers = max(1, min(self.max_workers, len(server_folders) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_server = list(executor.map(self._collect_files, server_folders))
+
+        # One representative path per inode; existing hard links are already shared
+        inodes: Dict[Tuple[int, int], List[str]] = {}
+        stats: Dict[Tuple[int, int], os.stat_result] = {}
+        for files in per_server:
+            for path, st in files:
+                key = (st.st_dev, st.st_ino)
+                inodes.setdefault(key, []).append(path)
+                stats[key] = st
+        report["files_scanned"] = sum(len(p) for p in inodes.values())
+
+        # Only inodes sharing (device, size) with another inode can be duplicates
+        by_size: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        for key, st in stats.items():
+            if st.st_size > 0:
+                by_size.setdefault((st.st_dev, st.st_size), []).append(key)
+        candidates = [key for keys in by_size.values() if len(keys) > 1 for key in keys]
+
+        digests = hash_files([inodes[key][0] for key in candidates], "sha256", self.max_workers)
+        report["files_hashed"] = len(digests)
+
+        groups: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
+        for key in candidates:
+            digest = digests.get(inodes[key][0])
+            if digest:
+                groups.setdefault((key[0], digest), []).append(key)
+
+        for (_dev, _digest), keys in groups.items():
+            if len(keys) < 2:
+                continue
+            report["duplicate_groups"] += 1
+
+            # Keep the inode that already has the most links to minimise work
+            keys.sort(key=lambda k: (-stats[k].st_nlink, inodes[k][0]))
+            canonical = inodes[keys[0]][0]
+            hardlinked_any = False
+
+            for key in keys[1:]:
+                paths = inodes[key]
+                # Space only comes back once every link to the inode is replaced
+                fully_replaced = stats[key].st_nlink <= len(paths)
+
+                for path in paths:
+                    if dry_run:
+                        report["files_linked"] += 1
+                        continue
+                    if self._reflink(canonical, path):
+                        report["reflinked"] += 1
+                    elif self._hardlink(canonical, path):
+                        report["hardlinked"] += 1
+                        hardlinked_any = True
+                    else:
+                        report["errors"].append(path)
+                        fully_replaced = False
+                        continue
+                    report["files_linked"] += 1
+
+                if fully_replaced:
+                    report["bytes_reclaimed"] += stats[key].st_size
+
+            if hardlinked_any:
+                protect_file(canonical)
+
+        if log_callback:
+            action = "Would reclaim" if dry_run else "Reclaimed"
+            log_callback(
+                f"[OK] {report['files_linked']} duplicate file(s) in "
+                f"{report['duplicate_groups']} group(s). {action} "
+                f"{report['bytes_reclaimed'] / (1024 * 1024):.1f} MB\n"
+            )
+            if report["errors"]:
+                log_callback(f"⚠ {len(report['errors'])} file(s) could not be linked\n")
+
+        return report
@@ -0,0 +1,68 @@
+"""Content hashing helpers shared by dedup, verification and the artifact cache"""
+
+import os
+import mmap
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+# Files smaller than this are read in one go; larger ones are memory-mapped so
+# hashlib can consume the whole file without copying it through Python buffers.
+MMAP_THRESHOLD = 256 * 1024
+
+# hashlib releases the GIL while digesting large buffers, so threads scale
+# well here even though the work is CPU-bound.
+DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+def hash_file(path: str, algorithm: str = "sha1") -> Optional[str]:
+    """
+    Computes the hex digest of a file
+
+    Args:
+        path: Path to the file
+        algorithm: hashlib algorithm name ("sha1", "sha512", ...)
+
+    Returns:
+        Hex digest, or None if the file could not be read
+    """
+    try:
+        digest = hashlib.new(algorithm)
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return digest.hexdigest()
+            if size < MMAP_THRESHOLD:
+                digest.update(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+        return digest.hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def hash_files(
+    paths: Iterable[str],
+    algorithm: str = "sha1",
+    max_workers: int = DEFAULT_HASH_WORKERS
+) -> Dict[str, Optional[str]]:
+    """
+    Hashes many files concurrently
+
+    Args:
+        paths: Files to hash
+        algorithm: hashlib algorithm name
+        max_workers: Maximum number of hashing threads
+
+    Returns:
+        Dict mapping path -> hex digest (None for unreadable files)
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+
+    workers = max(1, min(max_workers, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda p: hash_file(p, algorithm), paths)
+        return dict(zip(paths, digests))
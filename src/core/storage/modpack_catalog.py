@@ -0,0 +1,288 @@
+"""Local full-text catalog of modpack metadata (SQLite FTS5)"""
+
+import re
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..api.models import ModpackSummary
+
+
+def _fts5_available() -> bool:
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+
+class ModpackCatalog:
+    """
+    Offline index of modpacks seen on Modrinth and CurseForge
+
+    Entries use the normalized search-result format of ModrinthAPI /
+    CurseForgeAPI and are keyed by (source, project_id). Text search goes
+    through an FTS5 index over title, slug, author, description and
+    categories (prefix matching, so partially typed words match); ranking
+    is bm25 with the title weighted highest, then downloads. Without FTS5 in
+    the local SQLite build, a LIKE scan is used instead.
+
+    Stored under ~/.pycraft/cache/modpack_catalog.db. One connection is shared
+    by all threads behind a lock; queries take milliseconds.
+    """
+
+    DEFAULT_PATH = Path.home() / ".pycraft" / "cache" / "modpack_catalog.db"
+    SCHEMA_VERSION = 1
+    # bm25 column weights: title, slug, author, description, categories
+    BM25_WEIGHTS = (10.0, 8.0, 2.0, 1.0, 2.0)
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS modpacks_fts;
+                    DROP TABLE IF EXISTS modpacks;
+                    DROP TABLE IF EXISTS sync_state;
+                """)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS modpacks (
+                    id INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    project_id TEXT NOT NULL,
+                    slug TEXT,
+                    title TEXT,
+                    author TEXT,
+                    description TEXT,
+                    icon_url TEXT,
+                    categories TEXT,
+                    loaders TEXT,
+                    versions TEXT,
+                    downloads INTEGER DEFAULT 0,
+                    server_side TEXT,
+                    client_side TEXT,
+                    server_pack INTEGER DEFAULT 0,
+                    updated TEXT,
+                    seen_at REAL,
+                    UNIQUE (source, project_id)
+                );
+                CREATE INDEX IF NOT EXISTS modpacks_downloads ON modpacks (source, downloads DESC);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    source TEXT PRIMARY KEY,
+                    last_sync REAL,
+                    newest_update TEXT
+                );
+            """)
+            if FTS5_AVAILABLE:
+                self._conn.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS modpacks_fts USING fts5(
+                        title, slug, author, description, categories,
+                        content='modpacks', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS modpacks_ai AFTER INSERT ON modpacks BEGIN
+                        INSERT INTO modpacks_fts (rowid, title, slug, author, description, categories)
+                        VALUES (new.id, new.title, new.slug, new.author, new.description, new.categories);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS modpacks_ad AFTER DELETE ON modpacks BEGIN
+                        INSERT INTO modpacks_fts (modpacks_fts, rowid, title, slug, author, description, categories)
+                        VALUES ('delete', old.id, old.title, old.slug, old.author, old.description, old.categories);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS modpacks_au AFTER UPDATE ON modpacks BEGIN
+                        INSERT INTO modpacks_fts (modpacks_fts, rowid, title, slug, author, description, categories)
+                        VALUES ('delete', old.id, old.title, old.slug, old.author, old.description, old.categories);
+                        INSERT INTO modpacks_fts (rowid, title, slug, author, description, categories)
+                        VALUES (new.id, new.title, new.slug, new.author, new.description, new.categories);
+                    END;
+                """)
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    # ==================== WRITE ====================
+
+    LOADERS = ("forge", "neoforge", "fabric", "quilt")
+
+    def upsert(self, modpacks: Iterable[Dict]) -> int:
+        """
+        Inserts or refreshes normalized search results
+
+        Args:
+            modpacks: Results from ModrinthAPI/CurseForgeAPI.search_modpacks
+
+        Returns:
+            Number of rows written
+        """
+        now = time.time()
+        rows = []
+        for mp in modpacks:
+            if not mp.get("project_id"):
+                continue
+            categories = [str(c).lower() for c in mp.get("categories", [])]
+            rows.append((
+                mp.get("source", "modrinth"),
+                str(mp["project_id"]),
+                mp.get("slug", ""),
+                mp.get("title", ""),
+                mp.get("author", ""),
+                mp.get("description", ""),
+                mp.get("icon_url", ""),
+                " ".join(categories),
+                json.dumps([c for c in categories if c in self.LOADERS]),
+                json.dumps(mp.get("versions", [])),
+                int(mp.get("downloads", 0) or 0),
+                mp.get("server_side", "unknown"),
+                mp.get("client_side", "unknown"),
+                int(bool(mp.get("server_pack", False))),
+                mp.get("updated", ""),
+                now,
+            ))
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO modpacks (source, project_id, slug, title, author, description, icon_url,
+                                      categories, loaders, versions, downloads, server_side, client_side,
+                                      server_pack, updated, seen_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, project_id) DO UPDATE SET
+                    slug = excluded.slug, title = excluded.title, author = excluded.author,
+                    description = excluded.description, icon_url = excluded.icon_url,
+                    categories = excluded.categories, loaders = excluded.loaders,
+                    versions = excluded.versions, downloads = excluded.downloads,
+                    server_side = excluded.server_side, client_side = excluded.client_side,
+                    server_pack = excluded.server_pack,
+                    updated = CASE WHEN excluded.updated != '' THEN excluded.updated ELSE modpacks.updated END,
+                    seen_at = excluded.seen_at
+            """, rows)
+        return len(rows)
+
+    def get_sync_state(self, source: str) -> Tuple[float, str]:
+        """Returns (last sync time, newest "updated" value seen) for a provider"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_sync, newest_update FROM sync_state WHERE source = ?", (source,)
+            ).fetchone()
+        return (row["last_sync"] or 0.0, row["newest_update"] or "") if row else (0.0, "")
+
+    def set_sync_state(self, source: str, newest_update: str):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO sync_state (source, last_sync, newest_update) VALUES (?, ?, ?)
+                ON CONFLICT (source) DO UPDATE SET last_sync = excluded.last_sync,
+                    newest_update = MAX(sync_state.newest_update, excluded.newest_update)
+            """, (source, time.time(), newest_update))
+
+    # ==================== READ ====================
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """Turns typed text into an FTS5 query: every word must match as a prefix"""
+        words = re.findall(r'\w+', query.lower())
+        return " ".join(f'"{w}"*' for w in words)
+
+    def count(self, source: Optional[str] = None) -> int:
+        with self._lock:
+            if source:
+                return self._conn.execute("SELECT COUNT(*) FROM modpacks WHERE source = ?", (source,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM modpacks").fetchone()[0]
+
+    def search(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        side_filter: Optional[str] = None
+    ) -> Tuple[List[ModpackSummary], int]:
+        """
+        Searches the local catalog
+
+        Args:
+            query: Typed text ("" lists the most downloaded packs)
+            source: "modrinth", "curseforge" or None for both
+            limit: Maximum number of results
+            offset: Number of results to skip
+            side_filter: "server" for packs with server support, "client" for client support
+
+        Returns:
+            Tuple of (normalized modpacks, total matches)
+        """
+        where, params = [], []
+        if source:
+            where.append("m.source = ?")
+            params.append(source)
+        if side_filter == "server":
+            where.append("m.server_pack = 1")
+        elif side_filter == "client":
+            where.append("(m.source = 'curseforge' OR m.client_side IN ('required', 'optional'))")
+
+        expression = self._match_expression(query)
+        if expression and FTS5_AVAILABLE:
+            base = "FROM modpacks_fts f JOIN modpacks m ON m.id = f.rowid"
+            where.insert(0, "modpacks_fts MATCH ?")
+            params.insert(0, expression)
+            weights = ", ".join(str(w) for w in self.BM25_WEIGHTS)
+            order = f"bm25(modpacks_fts, {weights}), m.downloads DESC"
+        elif expression:
+            base = "FROM modpacks m"
+            for word in re.findall(r'\w+', query.lower()):
+                where.append("(m.title LIKE ? OR m.slug LIKE ? OR m.description LIKE ?)")
+                params.extend([f"%{word}%"] * 3)
+            order = "m.downloads DESC"
+        else:
+            base = "FROM modpacks m"
+            order = "m.downloads DESC"
+
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        try:
+            with self._lock:
+                total = self._conn.execute(f"SELECT COUNT(*) {base} {clause}", params).fetchone()[0]
+                rows = self._conn.execute(
+                    f"SELECT m.* {base} {clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                    params + [limit, offset]
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching modpack catalog: {e}")
+            return [], 0
+
+        return [self._row_to_modpack(row) for row in rows], total
+
+    @staticmethod
+    def _row_to_modpack(row: sqlite3.Row) -> ModpackSummary:
+        return ModpackSummary(
+            project_id=row["project_id"],
+            title=row["title"],
+            source=row["source"],
+            description=row["description"],
+            icon_url=row["icon_url"],
+            downloads=row["downloads"],
+            categories=row["categories"].split() if row["categories"] else [],
+            versions=json.loads(row["versions"] or "[]"),
+            slug=row["slug"],
+            author=row["author"],
+            server_side=row["server_side"],
+            client_side=row["client_side"],
+            server_pack=bool(row["server_pack"]),
+            updated=row["updated"],
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,103 @@
+"""Integrity verification of installed files against expected hashes"""
+
+import os
+from typing import Dict, Iterable, List, Optional
+
+from .hashing import hash_files, DEFAULT_HASH_WORKERS
+
+
+def verify_files(
+    base_folder: str,
+    expected: Dict[str, Dict],
+    scan_folders: Iterable[str] = ("mods",),
+    algorithm: str = "sha1",
+    max_workers: int = DEFAULT_HASH_WORKERS
+) -> Dict[str, List[str]]:
+    """
+    Checks files under base_folder against a manifest-derived expectation
+
+    Size mismatches are reported as corrupt without hashing; everything else
+    is hashed concurrently (memory-mapped reads for large files).
+
+    Args:
+        base_folder: Server folder
+        expected: Dict mapping relative path (forward slashes) ->
+                  {algorithm: hex digest, "size": int (optional)}
+        scan_folders: Folders (relative to base_folder) searched for unlisted files
+        algorithm: Hash algorithm whose digest is stored in expected
+        max_workers: Maximum number of hashing threads
+
+    Returns:
+        Dict with lists of relative paths: ok, missing, corrupt, extra
+    """
+    report = {"ok": [], "missing": [], "corrupt": [], "extra": []}
+    to_hash: Dict[str, str] = {}
+
+    for rel_path, info in expected.items():
+        full_path = os.path.join(base_folder, *rel_path.split("/"))
+        try:
+            size = os.path.getsize(full_path)
+        except OSError:
+            report["missing"].append(rel_path)
+            continue
+
+        expected_size = info.get("size")
+        if expected_size is not None and size != expected_size:
+            report["corrupt"].append(rel_path)
+        elif info.get(algorithm):
+            to_hash[full_path] = rel_path
+        else:
+            # Nothing to compare against - presence is all we can check
+            report["ok"].append(rel_path)
+
+    digests = hash_files(to_hash.keys(), algorithm, max_workers)
+    for full_path, rel_path in to_hash.items():
+        digest = digests.get(full_path)
+        if digest and digest.lower() == expected[rel_path][algorithm].lower():
+            report["ok"].append(rel_path)
+        else:
+            report["corrupt"].append(rel_path)
+
+    expected_lower = {p.lower() for p in expected}
+    for folder in scan_folders:
+        root = os.path.join(base_folder, folder)
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                rel_path = os.path.relpath(os.path.join(dirpath, name), base_folder).replace(os.sep, "/")
+                if rel_path.lower() not in expected_lower:
+                    report["extra"].append(rel_path)
+
+    for key in report:
+        report[key].sort()
+    return report
+
+
+def expected_from_modrinth_index(manifest: Dict, prefixes: Optional[Iterable[str]] = ("mods/",)) -> Dict[str, Dict]:
+    """
+    Builds the verify_files() expectation from a modrinth.index.json
+
+    Args:
+        manifest: Parsed modrinth.index.json
+        prefixes: Only include files whose path starts with one of these
+                  (None includes every server-side file)
+
+    Returns:
+        Dict mapping relative path -> {sha1, sha512, size, downloads}
+    """
+    expected = {}
+    for file_info in manifest.get("files", []):
+        path = (file_info.get("path") or "").replace("\\", "/")
+        if not path or ".." in path.split("/"):
+            continue
+        if prefixes is not None and not any(path.startswith(p) for p in prefixes):
+            continue
+        if file_info.get("env", {}).get("server") == "unsupported":
+            continue
+        hashes = file_info.get("hashes", {})
+        expected[path] = {
+            "sha1": hashes.get("sha1"),
+            "sha512": hashes.get("sha512"),
+            "size": file_info.get("fileSize"),
+            "downloads": file_info.get("downloads", []),
+        }
+    return expected
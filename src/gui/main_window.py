@@ -76,7 +76,7 @@ class NonPropagatingTextEdit(QTextEdit):
 
 import qtawesome as qta
 
-from ..core.api import MinecraftAPIHandler, APIConfig
+from ..core.api import MinecraftAPIHandler, APIConfig, get_http_client
 from ..core.download import ServerDownloader
 from ..managers.server import ServerManager
 from ..managers.modpack import ModpackManager
@@ -440,9 +440,9 @@ class PyCraftGUI(QMainWindow):
     java_progress_signal = Signal(int, int)  # value, maximum
     java_console_signal = Signal(str, str)  # text, color
     java_complete_signal = Signal(bool)  # success
-    modpack_results_signal = Signal(object)  # modpack search results
+    modpack_results_signal = Signal(int, object)  # search id, modpack search results (replace the shown ones)
     mp_icon_signal = Signal(str, object)  # project_id, QPixmap
-    mp_pagination_signal = Signal(int)  # total results
+    mp_pagination_signal = Signal(int, int)  # search id, total results
     client_mp_results_signal = Signal(object)  # client modpack search results
     client_mp_pagination_signal = Signal(int)  # client total results
     version_loaded_signal = Signal(object, object)  # versions list, callback function
@@ -451,6 +451,7 @@ class PyCraftGUI(QMainWindow):
     modpack_server_stopped_signal = Signal(bool)  # success (True = normal stop, False = crash)
     vanilla_server_started_signal = Signal(bool)  # success
     modpack_server_started_signal = Signal(bool)  # success
+    server_ready_signal = Signal(str)  # log target ("v_run"/"m_run") of the server that finished starting
     # Modal signals (thread-safe)
     vanilla_install_success_signal = Signal(str, str)  # version, folder
     server_modpack_install_success_signal = Signal(str, str, str)  # name, mc_version, loader
@@ -509,6 +510,7 @@ class PyCraftGUI(QMainWindow):
         self.mp_current_page = 1
         self.mp_total_results = 0
         self.mp_search_query = ""
+        self.mp_search_id = 0  # Results of older searches are dropped when they arrive late
         self.mp_icon_cache = {}  # Cache for modpack icons
 
         # Client modpack browsing state
@@ -542,6 +544,7 @@ class PyCraftGUI(QMainWindow):
         self.modpack_server_manager: Optional[ServerManager] = None
         self.modpack_server_path = None
         self.is_modpack_configured = False
+        self.mp_verify_folder = None  # Run folder with a modpack manifest (enables "Verify Files")
 
         self.vanilla_ram = 2048
         self.modpack_ram = 4096
@@ -581,7 +584,7 @@ class PyCraftGUI(QMainWindow):
         self.log_signal.connect(self._on_log)
         self.progress_signal.connect(self._on_progress)
         self.status_signal.connect(self._on_status)
-        self.modpack_results_signal.connect(self._show_mp_results)
+        self.modpack_results_signal.connect(self._replace_mp_results)
         self.mp_icon_signal.connect(self._on_mp_icon_loaded)
         self.mp_pagination_signal.connect(self._update_mp_pagination)
         self.client_mp_results_signal.connect(self._show_client_mp_results)
@@ -592,6 +595,7 @@ class PyCraftGUI(QMainWindow):
         self.modpack_server_stopped_signal.connect(self._on_modpack_server_stopped)
         self.vanilla_server_started_signal.connect(self._on_vanilla_server_started)
         self.modpack_server_started_signal.connect(self._on_modpack_server_started)
+        self.server_ready_signal.connect(self._show_server_ready_notification)
         # Modal signals - use lambdas with QTimer to avoid blocking
         self.vanilla_install_success_signal.connect(
             lambda v, f: QTimer.singleShot(100, lambda: self._show_vanilla_install_success(v, f))
@@ -611,10 +615,6 @@ class PyCraftGUI(QMainWindow):
         if target in targets and targets[target]:
             self._log(targets[target], msg, level)
 
-        # Detect when server is ready (shows "Done" message)
-        if target in ("v_run", "m_run") and "Done" in msg and "For help, type" in msg:
-            self._show_server_ready_notification(target)
-
     def _on_progress(self, value: int):
         """Handle progress signal"""
         if hasattr(self, "active_progress") and self.active_progress:
@@ -631,13 +631,18 @@ class PyCraftGUI(QMainWindow):
     def _show_server_ready_notification(self, target: str):
         """Show notification when server is ready"""
         server_type = "Vanilla" if target == "v_run" else "Modpack"
+        manager = self.server_manager if target == "v_run" else self.modpack_server_manager
+        startup = manager.startup_seconds if manager else None
 
         # Create a non-blocking message box
         msg = QMessageBox(self)
         msg.setWindowTitle("Server Ready")
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setText(f"{server_type} server is ready!")
-        msg.setInformativeText("Players can now connect.")
+        if startup is not None:
+            msg.setInformativeText(f"Started in {startup:.1f}s. Players can now connect.")
+        else:
+            msg.setInformativeText("Players can now connect.")
         msg.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg.setDefaultButton(QMessageBox.StandardButton.Ok)
 
@@ -1675,6 +1680,15 @@ class PyCraftGUI(QMainWindow):
         curseforge_btn.clicked.connect(lambda: self._select_mp_provider("curseforge"))
         providers_h.addWidget(curseforge_btn)
 
+        all_providers_btn = self._create_provider_button(
+            "Both",
+            "Search both platforms at once",
+            "#5b9bd5",
+            "fa5s.layer-group"
+        )
+        all_providers_btn.clicked.connect(lambda: self._select_mp_provider("all"))
+        providers_h.addWidget(all_providers_btn)
+
         provider_page_layout.addWidget(providers_container)
 
         # Recommendation message
@@ -1886,7 +1900,7 @@ class PyCraftGUI(QMainWindow):
     def _select_mp_provider(self, provider: str):
         """Handle provider selection for server modpack install"""
         self.mp_selected_provider = provider
-        provider_display = "Modrinth" if provider == "modrinth" else "CurseForge"
+        provider_display = {"modrinth": "Modrinth", "curseforge": "CurseForge"}.get(provider, "Modrinth + CurseForge")
         self.mp_provider_label.setText(f"Searching on: {provider_display}")
 
         # Clear previous results
@@ -1904,6 +1918,9 @@ class PyCraftGUI(QMainWindow):
         # Load popular modpacks automatically
         self._search_modpacks(page=1, popular=True)
 
+        # Refresh the offline catalog in the background (no-op if synced recently)
+        self.modpack_manager.start_catalog_sync()
+
     def _build_modpack_run(self) -> QWidget:
         """Build modpack run page"""
         page = QWidget()
@@ -1991,6 +2008,13 @@ class PyCraftGUI(QMainWindow):
         self.mp_config.clicked.connect(self._config_mp)
         ctrl_layout.addWidget(self.mp_config)
 
+        # Verify installed files against the modpack manifest (and repair them)
+        self.mp_verify = self._styled_button("Verify Files", self.colors['bg_input'], self.colors['text'], 130)
+        self.mp_verify.setEnabled(False)
+        self.mp_verify.setToolTip("Check the files listed in the modpack manifest and re-download missing or corrupt ones")
+        self.mp_verify.clicked.connect(self._verify_mp)
+        ctrl_layout.addWidget(self.mp_verify)
+
         # Install Server button (shown when server is missing but mods exist)
         self.mp_install_server = self._styled_button("Install Server", self.colors['blue'], "#ffffff", 140)
         self.mp_install_server.setEnabled(False)
@@ -2410,8 +2434,9 @@ class PyCraftGUI(QMainWindow):
         console_id = id(console)
         self._log_call_count[console_id] = self._log_call_count.get(console_id, 0) + 1
 
-        # Only trim lines every 100 log calls per console
-        if self._log_call_count[console_id] % 100 == 0:
+        # Only trim lines every 100 log calls per console, or after a batch of
+        # server output (one call can carry hundreds of lines)
+        if self._log_call_count[console_id] % 100 == 0 or msg.count("\n") > 20:
             doc = console.document()
             line_count = doc.blockCount()
             if line_count > max_lines:
@@ -2852,6 +2877,8 @@ class PyCraftGUI(QMainWindow):
 
         # Configure online-mode=false automatically for LAN/Hamachi play
         self.server_manager.set_online_mode(False)
+        # RCON gives scripts and tools request/response access to the console
+        self.server_manager.enable_rcon()
 
         self._log(self.vanilla_run_console, "\n=== STARTING SERVER ===\n", "info")
         self.run_start.setEnabled(False)
@@ -2866,12 +2893,13 @@ class PyCraftGUI(QMainWindow):
             # Emit signal to update UI from main thread
             self.vanilla_server_stopped_signal.emit(self._vanilla_server_started_successfully)
 
+        def on_server_ready():
+            """Called once when the parsed server log reports startup finished"""
+            self._vanilla_server_started_successfully = True
+            self.server_ready_signal.emit("v_run")
+
         def log_callback(line: str):
-            """Monitor server output"""
-            # Check for successful start
-            if "Done" in line and "!" in line:
-                self._vanilla_server_started_successfully = True
-            # Forward to UI
+            """Forward server output to UI"""
             self.log_signal.emit(line, "normal", "v_run")
 
         def start():
@@ -2879,7 +2907,8 @@ class PyCraftGUI(QMainWindow):
                 ram_mb=self.vanilla_ram,
                 log_callback=log_callback,
                 detached=True,
-                on_stopped=on_server_stopped
+                on_stopped=on_server_stopped,
+                on_ready=on_server_ready
             )
             # Emit signal to update UI from main thread
             self.vanilla_server_started_signal.emit(success)
@@ -3456,7 +3485,8 @@ class PyCraftGUI(QMainWindow):
         """Handle text changes with debounce for real-time search"""
         # Clear results if text is too short
         if len(text.strip()) < 3:
-            # Clear previous results
+            # Clear previous results (and ignore searches still running)
+            self.mp_search_id += 1
             while self.mp_results_layout.count():
                 child = self.mp_results_layout.takeAt(0)
                 if child.widget():
@@ -3486,6 +3516,8 @@ class PyCraftGUI(QMainWindow):
         self.mp_search_query = query if not popular else ""
         self.mp_current_page = page
         self.mp_is_popular_search = popular
+        self.mp_search_id += 1
+        search_id = self.mp_search_id
 
         # Clear previous results
         while self.mp_results_layout.count():
@@ -3497,6 +3529,29 @@ class PyCraftGUI(QMainWindow):
             try:
                 offset = (page - 1) * 10
                 search_query = "" if popular else query
+
+                # The local catalog answers in milliseconds (and offline); the
+                # online search below replaces these results when it arrives
+                local_results, local_total = self.modpack_manager.search_catalog(
+                    search_query, self.mp_selected_provider, limit=10, offset=offset, side_filter="server"
+                )
+                if local_results:
+                    self.mp_pagination_signal.emit(search_id, local_total)
+                    self.modpack_results_signal.emit(search_id, local_results)
+
+                if self.mp_selected_provider == "all":
+                    # Show the first provider's results right away, re-rank when the other answers
+                    def on_partial(partial, partial_total):
+                        self.mp_pagination_signal.emit(search_id, partial_total)
+                        self.modpack_results_signal.emit(search_id, partial)
+
+                    results, total = self.modpack_manager.search_modpacks_federated(
+                        search_query, limit=10, offset=offset, side_filter="server", on_partial=on_partial
+                    )
+                    if not results and not local_results:
+                        self.mp_pagination_signal.emit(search_id, 0)
+                    return
+
                 # Filter for server-compatible modpacks only
                 results, total = self.modpack_manager.search_modpacks(
                     search_query,
@@ -3505,13 +3560,12 @@ class PyCraftGUI(QMainWindow):
                     offset=offset,
                     side_filter="server"
                 )
-                self.modpack_results = results
-
                 if results:
-                    self.mp_pagination_signal.emit(total)
-                    self.modpack_results_signal.emit(results)
-                else:
-                    self.mp_pagination_signal.emit(0)
+                    self.mp_pagination_signal.emit(search_id, total)
+                    self.modpack_results_signal.emit(search_id, results)
+                elif not local_results:
+                    # Keep the offline results if the provider is unreachable
+                    self.mp_pagination_signal.emit(search_id, 0)
 
             except Exception as e:
                 self.log_signal.emit(f"Error: {e}\n", "error", "m_install")
@@ -3526,8 +3580,10 @@ class PyCraftGUI(QMainWindow):
             is_popular = getattr(self, 'mp_is_popular_search', False)
             self._search_modpacks(page, popular=is_popular)
 
-    def _update_mp_pagination(self, total: int):
+    def _update_mp_pagination(self, search_id: int, total: int):
         """Update pagination UI"""
+        if search_id != self.mp_search_id:
+            return  # Answer to an older search
         self.mp_total_results = total
         total_pages = (total + 9) // 10
 
@@ -3574,6 +3630,14 @@ class PyCraftGUI(QMainWindow):
         for mp in results:
             self._create_mp_item(mp)
 
+    def _replace_mp_results(self, search_id: int, results: list):
+        """Replaces the shown results (offline results first, then online/re-ranked ones)"""
+        if search_id != self.mp_search_id:
+            return  # Answer to an older search
+        self.modpack_results = results
+        self._clear_layout(self.mp_results_layout)
+        self._show_mp_results(results)
+
     def _format_downloads(self, count: int) -> str:
         """Format download count (e.g., 1.2M, 50K)"""
         if count >= 1_000_000:
@@ -3689,6 +3753,14 @@ class PyCraftGUI(QMainWindow):
         dl_label.setStyleSheet(f"color: {self.colors['text_muted']}; font-size: 11px; border: none;")
         meta_layout.addWidget(dl_label)
 
+        # Platform (federated search mixes both)
+        if self.mp_selected_provider == "all":
+            platforms = [mp.get("source", "modrinth")] + [a.get("source") for a in mp.get("alternates", [])]
+            platform_text = " + ".join("CurseForge" if p == "curseforge" else "Modrinth" for p in platforms)
+            platform_label = QLabel(platform_text)
+            platform_label.setStyleSheet(f"color: {self.colors['text_secondary']}; font-size: 11px; border: none;")
+            meta_layout.addWidget(platform_label)
+
         meta_layout.addStretch()
 
         # Link to provider
@@ -3737,11 +3809,11 @@ class PyCraftGUI(QMainWindow):
 
         def load():
             try:
-                import requests
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
+                # Coalesced: re-renders of the same card share one download
+                content = get_http_client().get_content(url, timeout=5)
+                if content:
                     pixmap = QPixmap()
-                    pixmap.loadFromData(response.content)
+                    pixmap.loadFromData(content)
                     if not pixmap.isNull():
                         scaled = pixmap.scaled(56, 56, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                         self.mp_icon_cache[project_id] = scaled
@@ -3790,6 +3862,13 @@ class PyCraftGUI(QMainWindow):
         title.setStyleSheet(f"color: {self.colors['text']}; font-size: 16px; font-weight: bold; border: none;")
         layout.addWidget(title)
 
+        # Project details (search results only carry a summary; loaded below)
+        details_label = QLabel("")
+        details_label.setStyleSheet(f"color: {self.colors['text_muted']}; font-size: 11px; border: none;")
+        details_label.setWordWrap(True)
+        details_label.setVisible(False)
+        layout.addWidget(details_label)
+
         # Loading label
         loading = QLabel("Loading versions...")
         loading.setStyleSheet(f"color: {self.colors['text_muted']}; font-size: 13px; border: none;")
@@ -3848,88 +3927,115 @@ class PyCraftGUI(QMainWindow):
             selected_info.setVisible(True)
             confirm_btn.setEnabled(True)
 
-        def load_versions():
-            try:
-                source = mp.get("source", "modrinth")
-                if source == "curseforge":
-                    # Use CurseForge API
-                    curseforge_id = mp.get("_curseforge_id")
-                    if not curseforge_id:
-                        curseforge_id = int(project_id)
+        def normalize_curseforge_file(f):
+            """Normalizes a CurseForge file to the Modrinth-like format, None without server pack"""
+            # IMPORTANT: For server modpacks, only show versions that have a server pack
+            server_pack_file_id = f.get("serverPackFileId")
+            if not server_pack_file_id:
+                return None
 
-                    if self.modpack_manager.curseforge_api is None:
-                        from ..core.api import CurseForgeAPI
-                        self.modpack_manager.curseforge_api = CurseForgeAPI()
+            # Get loader from file name or gameVersions
+            loader = "unknown"
+            file_name = f.get("fileName", "").lower()
+            game_versions_raw = f.get("gameVersions", [])
+
+            # Separate MC versions from loaders
+            mc_versions = []
+            for gv in game_versions_raw:
+                gv_lower = gv.lower()
+                if gv_lower in ("forge", "neoforge", "fabric", "quilt"):
+                    loader = gv_lower
+                elif gv and gv[0].isdigit():
+                    mc_versions.append(gv)
+
+            # Also check file name for loader
+            if loader == "unknown":
+                if "forge" in file_name and "neoforge" not in file_name:
+                    loader = "forge"
+                elif "neoforge" in file_name:
+                    loader = "neoforge"
+                elif "fabric" in file_name:
+                    loader = "fabric"
+                elif "quilt" in file_name:
+                    loader = "quilt"
+
+            return {
+                "id": str(f.get("id", "")),
+                "name": f.get("displayName", f.get("fileName", "Unknown")),
+                "version_number": f.get("displayName", ""),
+                "loaders": [loader],
+                "game_versions": mc_versions if mc_versions else game_versions_raw,
+                "downloads": f.get("downloadCount", 0),
+                "source": "curseforge",
+                "_curseforge_file": f,
+                "_server_pack_file_id": server_pack_file_id  # Store for later use
+            }
 
-                    files = self.modpack_manager.curseforge_api.get_modpack_files(curseforge_id)
-                    if files:
-                        # Normalize CurseForge files to Modrinth-like format
-                        # IMPORTANT: For server modpacks, only show versions that have a server pack
-                        versions = []
-                        for f in files:
-                            # Skip versions without server pack (for server installation)
-                            server_pack_file_id = f.get("serverPackFileId")
-                            if not server_pack_file_id:
-                                continue  # Skip this version - no server pack available
-
-                            # Get loader from file name or gameVersions
-                            loader = "unknown"
-                            file_name = f.get("fileName", "").lower()
-                            game_versions_raw = f.get("gameVersions", [])
-
-                            # Separate MC versions from loaders
-                            mc_versions = []
-                            for gv in game_versions_raw:
-                                gv_lower = gv.lower()
-                                if gv_lower in ("forge", "neoforge", "fabric", "quilt"):
-                                    loader = gv_lower
-                                elif gv and gv[0].isdigit():
-                                    mc_versions.append(gv)
-
-                            # Also check file name for loader
-                            if loader == "unknown":
-                                if "forge" in file_name and "neoforge" not in file_name:
-                                    loader = "forge"
-                                elif "neoforge" in file_name:
-                                    loader = "neoforge"
-                                elif "fabric" in file_name:
-                                    loader = "fabric"
-                                elif "quilt" in file_name:
-                                    loader = "quilt"
-
-                            versions.append({
-                                "id": str(f.get("id", "")),
-                                "name": f.get("displayName", f.get("fileName", "Unknown")),
-                                "version_number": f.get("displayName", ""),
-                                "loaders": [loader],
-                                "game_versions": mc_versions if mc_versions else game_versions_raw,
-                                "downloads": f.get("downloadCount", 0),
-                                "source": "curseforge",
-                                "_curseforge_file": f,
-                                "_server_pack_file_id": server_pack_file_id  # Store for later use
-                            })
-
-                        if not versions:
-                            self.version_loaded_signal.emit(None, lambda v: loading.setText("No server pack versions available"))
-                        else:
-                            self.version_loaded_signal.emit(versions, show_versions)
-                    else:
-                        self.version_loaded_signal.emit(None, lambda v: loading.setText("No versions found"))
-                else:
-                    # Use Modrinth API
-                    versions = self.modpack_manager.modrinth_api.get_modpack_versions(project_id)
-                    if versions:
-                        self.version_loaded_signal.emit(versions, show_versions)
+        def version_stream():
+            """Yields selector entries, fetching API pages only as they are consumed"""
+            source = mp.get("source", "modrinth")
+            if source == "curseforge":
+                curseforge_id = mp.get("_curseforge_id")
+                if not curseforge_id:
+                    curseforge_id = int(project_id)
+
+                if self.modpack_manager.curseforge_api is None:
+                    from ..core.api import CurseForgeAPI
+                    self.modpack_manager.curseforge_api = CurseForgeAPI()
+
+                for page in self.modpack_manager.curseforge_api.iter_modpack_files(curseforge_id):
+                    for f in page:
+                        version = normalize_curseforge_file(f)
+                        if version:
+                            yield version
+            else:
+                for page in self.modpack_manager.modrinth_api.iter_modpack_versions(project_id):
+                    yield from page
+
+        # Versions are shown VERSIONS_PAGE at a time; "Show more" pulls the next batch
+        VERSIONS_PAGE = 20
+        stream = version_stream()
+        pending = []  # Entry read ahead to know whether more exist
+        shown = [0]
+
+        more_btn = self._styled_button("Show more", self.colors['bg_input'], self.colors['text'], 120)
+        more_btn.setVisible(False)
+        versions_layout.addWidget(more_btn, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        def load_versions():
+            try:
+                batch = pending[:]
+                pending.clear()
+                for version in stream:
+                    if len(batch) < VERSIONS_PAGE:
+                        batch.append(version)
                     else:
-                        self.version_loaded_signal.emit(None, lambda v: loading.setText("No versions found"))
+                        pending.append(version)
+                        break
+                has_more = bool(pending)
+                self.version_loaded_signal.emit(batch, lambda v: show_versions(v, has_more))
             except Exception as e:
                 self.version_loaded_signal.emit(None, lambda v: loading.setText(f"Error: {e}"))
 
-        def show_versions(versions):
+        def load_more():
+            more_btn.setEnabled(False)
+            more_btn.setText("Loading...")
+            threading.Thread(target=load_versions, daemon=True).start()
+
+        more_btn.clicked.connect(load_more)
+
+        def show_versions(versions, has_more):
+            if not versions and shown[0] == 0:
+                if mp.get("source", "modrinth") == "curseforge":
+                    loading.setText("No server pack versions available")
+                else:
+                    loading.setText("No versions found")
+                return
+
             loading.setVisible(False)
             versions_scroll.setVisible(True)
 
-            for i, v in enumerate(versions[:20]):  # Show max 20 versions
+            for v in versions:
                 v_frame = QFrame()
                 v_frame.setStyleSheet(f"""
                     QFrame {{
@@ -3954,7 +4060,7 @@ class PyCraftGUI(QMainWindow):
                 v_info_layout.setSpacing(2)
 
                 v_name = v.get("name", v.get("version_number", "Unknown"))
-                if i == 0:
+                if shown[0] == 0:
                     v_name += " (Latest)"
                 name_label = QLabel(v_name)
                 name_label.setStyleSheet(f"color: {self.colors['text']}; font-size: 13px; font-weight: 600; border: none;")
@@ -3992,7 +4098,12 @@ class PyCraftGUI(QMainWindow):
                 # Make frame clickable
                 v_frame.mousePressEvent = lambda e, ver=v: on_version_selected(ver)
 
-                versions_layout.addWidget(v_frame)
+                versions_layout.insertWidget(versions_layout.count() - 1, v_frame)
+                shown[0] += 1
+
+            more_btn.setText("Show more")
+            more_btn.setEnabled(True)
+            more_btn.setVisible(has_more)
 
         def on_confirm():
             if dialog.selected_version:
@@ -4006,8 +4117,29 @@ class PyCraftGUI(QMainWindow):
 
         confirm_btn.clicked.connect(on_confirm)
 
-        # Load versions in thread
+        def show_details(details):
+            if not details:
+                return
+            if mp.get("source", "modrinth") == "curseforge":
+                authors = ", ".join(a.get("name", "") for a in details.get("authors") or [] if a.get("name"))
+                parts = [f"By {authors}" if authors else "", details.get("summary", "")]
+                updated = details.get("dateModified", "")
+            else:
+                license_id = (details.get("license") or {}).get("id", "")
+                parts = [f"License: {license_id}" if license_id else "", f"{details.get('followers', 0)} followers"]
+                updated = details.get("updated", "")
+            if updated:
+                parts.append(f"Updated {updated[:10]}")
+            details_label.setText(" • ".join(p for p in parts if p))
+            details_label.setVisible(True)
+
+        def load_details():
+            details = self.modpack_manager.get_modpack_details(mp)
+            self.version_loaded_signal.emit(details, show_details)
+
+        # Load versions and project details in threads
         threading.Thread(target=load_versions, daemon=True).start()
+        threading.Thread(target=load_details, daemon=True).start()
 
         dialog.exec()
 
@@ -4409,6 +4541,12 @@ class PyCraftGUI(QMainWindow):
             self.mp_cmd_btn.setEnabled(False)
             self._log(self.modpack_run_console, "Loading server folder...\n", "info")
 
+            has_manifest = any(
+                os.path.exists(os.path.join(folder, name)) for name in ("modrinth.index.json", "manifest.json")
+            )
+            self.mp_verify_folder = folder if has_manifest else None
+            self.mp_verify.setEnabled(has_manifest)
+
             if self._has_server(folder):
                 self.modpack_server_path = folder
                 self.mp_run_folder_label.setText(f"Folder: {folder}")
@@ -4908,6 +5046,8 @@ class PyCraftGUI(QMainWindow):
 
         # Configure online-mode=false automatically for LAN/Hamachi play
         self.modpack_server_manager.set_online_mode(False)
+        # RCON gives scripts and tools request/response access to the console
+        self.modpack_server_manager.enable_rcon()
 
         # Detect server type (forge/fabric) for proper startup
         server_type = self.modpack_server_manager.detect_server_type()
@@ -4927,18 +5067,19 @@ class PyCraftGUI(QMainWindow):
             # Emit signal to update UI from main thread
             self.modpack_server_stopped_signal.emit(self._server_started_successfully)
 
+        def on_ready():
+            """Called once when the parsed server log reports startup finished"""
+            self._server_started_successfully = True
+            self.server_ready_signal.emit("m_run")
+
         def log_callback(line: str):
             """Forward server output to UI"""
-            # Check for successful start
-            if "Done" in line and "!" in line:
-                self._server_started_successfully = True
-
-            # Forward to UI
             self.log_signal.emit(line, "normal", "m_run")
 
         # Disable start, enable stop
         self.mp_start.setEnabled(False)
         self.mp_config.setEnabled(False)
+        self.mp_verify.setEnabled(False)
         self.mp_stop.setEnabled(True)
 
         def start():
@@ -4950,7 +5091,8 @@ class PyCraftGUI(QMainWindow):
                     java_executable=java_exe,
                     log_callback=log_callback,
                     detached=True,
-                    on_stopped=on_stopped
+                    on_stopped=on_stopped,
+                    on_ready=on_ready
                 )
             else:
                 # Fallback to generic start_server for unknown types
@@ -4958,7 +5100,8 @@ class PyCraftGUI(QMainWindow):
                     ram_mb=self.modpack_ram,
                     log_callback=log_callback,
                     detached=True,
-                    on_stopped=on_stopped
+                    on_stopped=on_stopped,
+                    on_ready=on_ready
                 )
 
             # Emit signal to update UI from main thread
@@ -5068,6 +5211,7 @@ class PyCraftGUI(QMainWindow):
         """Reset UI state when server stops normally"""
         self.mp_start.setEnabled(True)
         self.mp_config.setEnabled(True)
+        self.mp_verify.setEnabled(bool(self.mp_verify_folder))
         self.mp_stop.setEnabled(False)
         self.mp_cmd_btn.setEnabled(False)
 
@@ -5075,6 +5219,7 @@ class PyCraftGUI(QMainWindow):
         """Handle modpack server stopped (called from main thread via signal)"""
         # Re-enable UI elements
         self.mp_start.setEnabled(True)
+        self.mp_verify.setEnabled(bool(self.mp_verify_folder))
 
         # Enable config only if server.properties exists (may have been generated on first run)
         if self.modpack_server_path:
@@ -5094,6 +5239,55 @@ class PyCraftGUI(QMainWindow):
             # Show crash dialog after a brief delay to ensure UI is updated
             QTimer.singleShot(100, lambda: self.server_crashed_signal.emit(self.modpack_server_path))
 
+    def _verify_mp(self):
+        """Verify the server's files against its modpack manifest, then offer to repair them"""
+        folder = self.mp_verify_folder
+        if not folder:
+            return
+        if self.modpack_server_manager and self.modpack_server_manager.is_server_running():
+            self._log(self.modpack_run_console, "\nStop the server before verifying its files\n", "warning")
+            return
+
+        def on_done(report):
+            self.mp_verify.setEnabled(True)
+            self.mp_start.setEnabled(self.is_modpack_configured)
+            if not report:
+                return
+            if "repaired" in report:
+                if report["failed"]:
+                    self._log(self.modpack_run_console, f"{len(report['failed'])} file(s) could not be repaired\n", "error")
+                return
+            bad = len(report["missing"]) + len(report["corrupt"])
+            if not bad:
+                self._log(self.modpack_run_console, "All manifest files are intact\n", "success")
+                return
+            reply = QMessageBox.question(
+                self, "Repair Server Files",
+                f"{bad} file(s) are missing or corrupt.\n\nDo you want to download them again?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                run(repair=True)
+
+        def run(repair: bool):
+            self.mp_verify.setEnabled(False)
+            self.mp_start.setEnabled(False)
+            self._log(self.modpack_run_console, "\nRepairing server files...\n" if repair else "\nVerifying server files...\n", "info")
+
+            def verify():
+                try:
+                    report = self.modpack_manager.verify_server_files(
+                        folder, repair=repair, log_callback=lambda m: self.log_signal.emit(m, "normal", "m_run")
+                    )
+                except Exception as e:
+                    self.log_signal.emit(f"Error: {e}\n", "error", "m_run")
+                    report = None
+                self.version_loaded_signal.emit(report, on_done)
+
+            threading.Thread(target=verify, daemon=True).start()
+
+        run(repair=False)
+
     def _stop_mp(self):
         if not self.modpack_server_manager:
             return
@@ -5120,6 +5314,7 @@ class PyCraftGUI(QMainWindow):
                     self._log(self.modpack_run_console, "Server stopped - Ready to restart\n", "success")
                     self.mp_start.setEnabled(True)
                     self.mp_config.setEnabled(True)
+                    self.mp_verify.setEnabled(bool(self.mp_verify_folder))
                     self.mp_stop.setEnabled(False)
                     self.mp_cmd_btn.setEnabled(False)
 
@@ -7,6 +7,9 @@ import shutil
 from typing import Optional, Tuple, Callable, List
 from pathlib import Path
 
+from ...core.api.retry import RetryPolicy, get_circuit_breaker, get_retry_policy
+from ...core.config import DEFAULT_ENDPOINTS, get_endpoint_config
+
 # Windows-specific imports for PATH management
 if platform.system() == "Windows":
     try:
@@ -22,7 +25,7 @@ class JavaManager:
     """Manages Java detection, download, and installation"""
 
     # Adoptium API URLs
-    ADOPTIUM_API_BASE = "https://api.adoptium.net/v3"
+    ADOPTIUM_API_BASE = DEFAULT_ENDPOINTS["adoptium_api"]
 
     # Java versions required by Minecraft
     # Format: "base_version": (min_version, max_version or None for no limit)
@@ -239,12 +242,22 @@ class JavaManager:
         """
         import time
 
+        retry_policy = get_retry_policy()
+        breaker = get_circuit_breaker(url)
+
         for attempt in range(max_retries):
+            if attempt > 0:
+                delay = retry_policy.backoff(attempt)
+                if log_callback:
+                    log_callback(f"\n⚠ Reintentando descarga en {delay:.1f}s (intento {attempt + 1}/{max_retries})...\n")
+                time.sleep(delay)
+
+            if not breaker.allow():
+                if log_callback:
+                    log_callback("✗ Download host is failing, skipping it until it recovers\n")
+                return False
+
             try:
-                if attempt > 0:
-                    if log_callback:
-                        log_callback(f"\n⚠ Reintentando descarga (intento {attempt + 1}/{max_retries})...\n")
-                    time.sleep(2)  # Wait before retrying
 
                 # Make request with timeout
                 response = requests.get(url, stream=True, timeout=timeout)
@@ -278,8 +291,11 @@ class JavaManager:
                     if actual_size < total_size * 0.95:  # Allow 5% margin
                         if log_callback:
                             log_callback(f"⚠ Incomplete download: {actual_size}/{total_size} bytes\n")
+                        breaker.record_failure()
                         continue  # Retry
 
+                breaker.record_success()
+
                 if log_callback:
                     log_callback("✓ Download completed\n")
 
@@ -289,6 +305,7 @@ class JavaManager:
                 if log_callback:
                     log_callback(f"\n⏱️ Download timeout (attempt {attempt + 1}/{max_retries})\n")
                     log_callback("  This may be due to a slow connection. The file may be large (>50MB).\n")
+                breaker.record_failure()
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -300,6 +317,10 @@ class JavaManager:
                 if log_callback:
                     log_callback(f"\n✗ Network error: {str(e)}\n")
                     log_callback(f"  HTTP status code: {getattr(e.response, 'status_code', 'N/A')}\n")
+                if RetryPolicy.is_host_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release_probe()
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -308,12 +329,14 @@ class JavaManager:
                     return False
 
             except IOError as e:
+                breaker.release_probe()
                 if log_callback:
                     log_callback(f"\n✗ Error writing file: {str(e)}\n")
                     log_callback(f"  Check that you have disk space and write permissions.\n")
                 return False
 
             except Exception as e:
+                breaker.release_probe()
                 if log_callback:
                     log_callback(f"\n✗ Unexpected error: {str(e)}\n")
                     log_callback(f"  Type: {type(e).__name__}\n")
@@ -349,9 +372,9 @@ class JavaManager:
                     log_callback("Error: Unsupported operating system or architecture\n")
                 return None
 
-            # Build API URL
-            api_url = (
-                f"{self.ADOPTIUM_API_BASE}/binary/latest/{java_version}/ga/"
+            # Build API path (tried against each configured Adoptium mirror)
+            api_path = (
+                f"/binary/latest/{java_version}/ga/"
                 f"{os_type}/{arch_type}/jre/hotspot/normal/eclipse"
             )
 
@@ -363,7 +386,12 @@ class JavaManager:
             download_path = self.java_installs_dir / f"java-{java_version}{file_extension}"
 
             # Download with automatic retries (longer timeout for large file)
-            if not self._download_with_retry(api_url, download_path, log_callback, max_retries=3, timeout=300):
+            downloaded = False
+            for base in get_endpoint_config().get_urls("adoptium_api"):
+                if self._download_with_retry(f"{base}{api_path}", download_path, log_callback, max_retries=3, timeout=300):
+                    downloaded = True
+                    break
+            if not downloaded:
                 if log_callback:
                     log_callback("\n✗ Could not complete Java download\n")
                     log_callback("Check your internet connection and try again.\n")
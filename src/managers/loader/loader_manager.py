@@ -1,21 +1,26 @@
-import requests
 import subprocess
 import os
 from typing import Optional, Callable, List, Dict
 from pathlib import Path
 import json
 
+from ...core.api import get_http_client
+from ...core.config import DEFAULT_ENDPOINTS, get_endpoint_config
+from ...core.download import ArtifactDownloader
+
 
 class LoaderManager:
     """Gestiona la instalación de loaders (Forge/Fabric) para servidores"""
 
     # URLs de las APIs
-    FORGE_MAVEN_URL = "https://maven.minecraftforge.net/net/minecraftforge/forge"
-    FORGE_PROMO_URL = "https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json"
-    FABRIC_META_URL = "https://meta.fabricmc.net/v2"
+    FORGE_MAVEN_URL = DEFAULT_ENDPOINTS["forge_maven"]
+    FORGE_PROMO_URL = DEFAULT_ENDPOINTS["forge_promotions"]
+    FABRIC_META_URL = DEFAULT_ENDPOINTS["fabric_meta"]
 
     def __init__(self):
-        pass
+        # Installer/launcher jars are cached by version so repeated installs stay local
+        self.artifact_downloader = ArtifactDownloader()
+        self.http = get_http_client()
 
     # ==================== FORGE ====================
 
@@ -30,7 +35,7 @@ class LoaderManager:
             Lista de versiones de Forge disponibles
         """
         try:
-            response = requests.get(self.FORGE_PROMO_URL, timeout=10)
+            response = self.http.get("", "forge_promotions", timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -60,7 +65,7 @@ class LoaderManager:
             Versión de Forge (ej: "47.2.0") o None
         """
         try:
-            response = requests.get(self.FORGE_PROMO_URL, timeout=10)
+            response = self.http.get("", "forge_promotions", timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -124,16 +129,15 @@ class LoaderManager:
                 log_callback("Downloading Forge installer...\n")
 
             # Descargar instalador
-            installer_url = f"{self.FORGE_MAVEN_URL}/{full_version}/forge-{full_version}-installer.jar"
+            installer_urls = [
+                f"{base}/{full_version}/forge-{full_version}-installer.jar"
+                for base in get_endpoint_config().get_urls("forge_maven")
+            ]
             installer_path = os.path.join(server_folder, "forge-installer.jar")
 
-            response = requests.get(installer_url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            with open(installer_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            job = {"dest": installer_path, "urls": installer_urls, "key": f"forge-installer:{full_version}"}
+            if not self.artifact_downloader.fetch(job):
+                raise Exception(job.get("error", "download failed"))
 
             if log_callback:
                 log_callback("Download complete\n")
@@ -209,8 +213,7 @@ class LoaderManager:
             Lista de versiones del loader
         """
         try:
-            url = f"{self.FABRIC_META_URL}/versions/loader"
-            response = requests.get(url, timeout=10)
+            response = self.http.get("/versions/loader", "fabric_meta", timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -228,8 +231,7 @@ class LoaderManager:
             Versión del loader
         """
         try:
-            url = f"{self.FABRIC_META_URL}/versions/loader"
-            response = requests.get(url, timeout=10)
+            response = self.http.get("/versions/loader", "fabric_meta", timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -288,20 +290,20 @@ class LoaderManager:
                 log_callback("\nDownloading Fabric server...\n")
 
             # Descargar Fabric Server Launcher
-            launcher_url = (
-                f"{self.FABRIC_META_URL}/versions/loader/"
-                f"{minecraft_version}/{loader_version}/1.0.0/server/jar"
-            )
+            launcher_urls = [
+                f"{base}/versions/loader/{minecraft_version}/{loader_version}/1.0.0/server/jar"
+                for base in get_endpoint_config().get_urls("fabric_meta")
+            ]
 
             launcher_path = os.path.join(server_folder, "fabric-server-launch.jar")
 
-            response = requests.get(launcher_url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            with open(launcher_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            job = {
+                "dest": launcher_path,
+                "urls": launcher_urls,
+                "key": f"fabric-launcher:{minecraft_version}:{loader_version}"
+            }
+            if not self.artifact_downloader.fetch(job):
+                raise Exception(job.get("error", "download failed"))
 
             if log_callback:
                 log_callback("Download complete\n")
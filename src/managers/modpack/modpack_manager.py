@@ -1,13 +1,25 @@
 import os
+import re
 import json
 import sys
+import math
+import time
 import zipfile
 import shutil
-import requests
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Dict, List, Tuple, Set
 from pathlib import Path
-
-from ...core.api import ModrinthAPI, CurseForgeAPI
+from urllib.parse import quote
+
+from ...core.api import (
+    ModrinthAPI, CurseForgeAPI, ModpackSummary, AsyncHttpClient, AsyncModrinthAPI, AsyncCurseForgeAPI
+)
+from ...core.download import ArtifactDownloader
+from ...core.storage import (
+    make_private, verify_files, expected_from_modrinth_index, hash_file, hash_files, ModpackCatalog
+)
 from ..loader import LoaderManager
 from ..java import JavaManager
 
@@ -15,12 +27,38 @@ from ..java import JavaManager
 class ModpackManager:
     """Manages the download and installation of complete modpacks"""
 
+    # Maximum file IDs per CurseForge batch request
+    CURSEFORGE_BATCH_SIZE = 500
+    # Maximum hashes per Modrinth version_files request / project IDs per projects request
+    MODRINTH_HASH_BATCH_SIZE = 500
+    MODRINTH_PROJECT_BATCH_SIZE = 100
+    # Jars Modrinth doesn't know are looked up again after this long
+    UNKNOWN_MOD_RECHECK_SECONDS = 7 * 24 * 3600
+    # Federated search: weight of the provider's own ranking vs. download count
+    SEARCH_RELEVANCE_WEIGHT = 0.6
+    SEARCH_PROVIDERS = ("modrinth", "curseforge")
+    # Largest page each provider's search API returns per request
+    SEARCH_PAGE_SIZE = {"modrinth": 100, "curseforge": 50}
+    # Fetched provider results are reused for the next pages of a search this long
+    SEARCH_CACHE_SECONDS = 300
+    # Local catalog: re-sync after this long; pages fetched on first sync / per incremental sync
+    CATALOG_SYNC_INTERVAL = 6 * 3600
+    CATALOG_SEED_PAGES = 5
+    CATALOG_UPDATE_PAGES = 10
+
     def __init__(self):
         self.modrinth_api = ModrinthAPI()
         self.curseforge_api = None  # Initialized if API key is available
         self.loader_manager = LoaderManager()
         self.java_manager = JavaManager()
+        # Race the two best mirrors per mod: packs are hundreds of small files
+        self.artifact_downloader = ArtifactDownloader(race=True)
         self._known_issues_cache = None
+        self._catalog = None
+        self._catalog_sync_lock = threading.Lock()
+        # Federated search: results fetched so far per provider, for the last (query, side_filter)
+        self._federated_cache: Tuple[Optional[Tuple], float, Dict[str, Dict]] = (None, 0.0, {})
+        self._federated_cache_lock = threading.Lock()
 
     def set_curseforge_api_key(self, api_key: str):
         """Configures the CurseForge API key"""
@@ -103,7 +141,7 @@ class ModpackManager:
 
         Args:
             server_folder: Path to the server folder
-            metadata: Dict mapping filename -> {client: str, server: str}
+            metadata: Dict mapping filename -> {client, server, sha1, size, mtime, modrinth}
 
         Returns:
             True if saved successfully
@@ -112,8 +150,8 @@ class ModpackManager:
             metadata_file = Path(server_folder) / "pycraft_mod_metadata.json"
             with open(metadata_file, 'w', encoding='utf-8') as f:
                 json.dump({
-                    "version": 1,
-                    "description": "Mod environment metadata from Modrinth mrpack. DO NOT EDIT.",
+                    "version": 2,
+                    "description": "Mod environment and identification metadata (Modrinth). DO NOT EDIT.",
                     "mods": metadata
                 }, f, indent=2)
             return True
@@ -140,6 +178,394 @@ class ModpackManager:
             pass
         return {}
 
+    # ==================== MOD IDENTIFICATION ====================
+
+    def identify_mods(
+        self,
+        server_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        refresh: bool = False
+    ) -> Dict[str, Dict]:
+        """
+        Identifies the jars in mods/ on Modrinth by sha1, in bulk.
+
+        Hashes are cached in pycraft_mod_metadata.json with the file size and
+        mtime, so unchanged jars are not re-hashed. Identified jars are not
+        looked up again, and jars Modrinth doesn't know are re-checked only
+        after UNKNOWN_MOD_RECHECK_SECONDS. Lookups use one version_files
+        request per MODRINTH_HASH_BATCH_SIZE jars, plus one projects request
+        to fill missing client/server support.
+
+        Args:
+            server_folder: Path to the server folder
+            log_callback: Function to report progress
+            refresh: Look up every jar again, ignoring cached identifications
+
+        Returns:
+            Dict mapping filename -> metadata entry:
+            {sha1, size, mtime, client, server, modrinth: {project_id, version_id,
+            version_number, game_versions, loaders} or None if not on Modrinth}
+        """
+        mods_folder = Path(server_folder) / "mods"
+        if not mods_folder.is_dir():
+            return {}
+
+        metadata = self._load_mod_metadata(server_folder)
+        jars = {p.name: p for p in mods_folder.iterdir() if p.is_file() and p.suffix == ".jar"}
+
+        # 1. Hash new or changed jars
+        stats = {name: path.stat() for name, path in jars.items()}
+        to_hash = [
+            str(path) for name, path in jars.items()
+            if not (
+                metadata.get(name, {}).get("sha1")
+                and metadata[name].get("size") == stats[name].st_size
+                and metadata[name].get("mtime") == stats[name].st_mtime
+            )
+        ]
+        if to_hash and log_callback:
+            log_callback(f"Hashing {len(to_hash)} mods...\n")
+
+        for path_str, sha1 in hash_files(to_hash, "sha1").items():
+            if not sha1:
+                continue
+            name = os.path.basename(path_str)
+            entry = metadata.setdefault(name, {})
+            if entry.get("sha1") != sha1:
+                # Different file under the same name: forget its identification
+                entry.pop("modrinth", None)
+                entry.pop("checked_at", None)
+            entry.update(sha1=sha1, size=stats[name].st_size, mtime=stats[name].st_mtime)
+
+        # 2. Look up jars that are not identified yet
+        now = time.time()
+        pending = {}
+        for name in jars:
+            entry = metadata.get(name, {})
+            if not entry.get("sha1"):
+                continue
+            known = "modrinth" in entry
+            stale_unknown = entry.get("modrinth") is None and now - entry.get("checked_at", 0) > self.UNKNOWN_MOD_RECHECK_SECONDS
+            if refresh or not known or stale_unknown:
+                pending[entry["sha1"]] = name
+
+        if pending and log_callback:
+            log_callback(f"Identifying {len(pending)} mods on Modrinth...\n")
+
+        hashes = list(pending)
+        for i in range(0, len(hashes), self.MODRINTH_HASH_BATCH_SIZE):
+            batch = hashes[i:i + self.MODRINTH_HASH_BATCH_SIZE]
+            versions = self.modrinth_api.get_versions_by_hashes(batch)
+            if versions is None:
+                if log_callback:
+                    log_callback("⚠ Could not reach Modrinth, identification incomplete\n")
+                break
+            for sha1 in batch:
+                entry = metadata[pending[sha1]]
+                version = versions.get(sha1)
+                entry["checked_at"] = now
+                entry["modrinth"] = {
+                    "project_id": version.get("project_id"),
+                    "version_id": version.get("id"),
+                    "version_number": version.get("version_number"),
+                    "game_versions": version.get("game_versions", []),
+                    "loaders": version.get("loaders", []),
+                } if version else None
+
+        # 3. Fill client/server support for identified jars that don't have it
+        missing_env = {}
+        for name in jars:
+            entry = metadata.get(name, {})
+            if entry.get("modrinth") and "server" not in entry:
+                missing_env.setdefault(entry["modrinth"]["project_id"], []).append(name)
+
+        project_ids = list(missing_env)
+        for i in range(0, len(project_ids), self.MODRINTH_PROJECT_BATCH_SIZE):
+            projects = self.modrinth_api.get_projects_info(project_ids[i:i + self.MODRINTH_PROJECT_BATCH_SIZE]) or []
+            for project in projects:
+                for name in missing_env.get(project.get("id"), []):
+                    metadata[name]["client"] = project.get("client_side", "unknown")
+                    metadata[name]["server"] = project.get("server_side", "unknown")
+
+        # Keep entries for jars still present (mods/ or the client-only backup)
+        backup_folder = Path(server_folder) / "client_mods_deleted"
+        metadata = {
+            name: entry for name, entry in metadata.items()
+            if name in jars or (backup_folder / name).exists()
+        }
+        self._save_mod_metadata(server_folder, metadata)
+
+        if log_callback:
+            identified = sum(1 for name in jars if metadata.get(name, {}).get("modrinth"))
+            log_callback(f"[OK] {identified}/{len(jars)} mods identified on Modrinth\n")
+
+        return {name: metadata[name] for name in jars if name in metadata}
+
+    # ==================== MOD UPDATES ====================
+
+    def _read_server_manifest(self, server_folder: str) -> Tuple[Optional[Dict], str]:
+        """Returns the pack manifest saved in the server folder and its source"""
+        for filename, source in (("modrinth.index.json", "modrinth"), ("manifest.json", "curseforge")):
+            manifest_path = Path(server_folder) / filename
+            if manifest_path.exists():
+                try:
+                    with open(manifest_path, 'r', encoding='utf-8') as f:
+                        return json.load(f), source
+                except (OSError, ValueError):
+                    pass
+        return None, ""
+
+    @staticmethod
+    def _primary_file(version: Dict) -> Optional[Dict]:
+        files = version.get("files", [])
+        return next((f for f in files if f.get("primary")), files[0] if files else None)
+
+    def check_mod_updates(
+        self,
+        server_folder: str,
+        minecraft_version: Optional[str] = None,
+        loader: Optional[str] = None,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """
+        Finds newer compatible versions for every installed mod, in bulk.
+
+        Jars identified on Modrinth (see identify_mods) are checked with one
+        version_files/update request per batch for the server's loader and
+        Minecraft version. Jars listed in a CurseForge manifest are checked
+        with batched mods/files requests against latestFilesIndexes.
+
+        Args:
+            server_folder: Path to the server folder
+            minecraft_version: Minecraft version (read from the saved manifest if omitted)
+            loader: "forge", "neoforge", "fabric" or "quilt" (idem)
+            log_callback: Function to report progress
+
+        Returns:
+            Update plan dict: {minecraft_version, loader, updates, up_to_date, unchecked}.
+            Each update has file, source, project_id, current_version,
+            new_version, new_file and an artifact job ("job") ready for
+            ArtifactDownloader.fetch_many / apply_mod_updates.
+        """
+        manifest, source = self._read_server_manifest(server_folder)
+        if manifest:
+            minecraft_version = minecraft_version or self.loader_manager.get_minecraft_version_from_manifest(manifest)
+            loader = loader or self.loader_manager.detect_loader_type(manifest)
+
+        plan = {"minecraft_version": minecraft_version, "loader": loader, "updates": [], "up_to_date": 0, "unchecked": []}
+        if not minecraft_version or not loader:
+            if log_callback:
+                log_callback("✗ Could not determine Minecraft version/loader for update check\n")
+            return plan
+
+        mods_folder = Path(server_folder) / "mods"
+        identified = self.identify_mods(server_folder, log_callback)
+        covered = set()
+
+        # Modrinth: one version_files/update request per batch
+        by_hash = {
+            entry["sha1"]: name for name, entry in identified.items()
+            if entry.get("modrinth") and entry.get("sha1")
+        }
+        loaders = [loader, "fabric"] if loader == "quilt" else [loader]
+        hashes = list(by_hash)
+        if hashes and log_callback:
+            log_callback(f"Checking {len(hashes)} Modrinth mods for updates...\n")
+
+        for i in range(0, len(hashes), self.MODRINTH_HASH_BATCH_SIZE):
+            batch = hashes[i:i + self.MODRINTH_HASH_BATCH_SIZE]
+            latest = self.modrinth_api.get_latest_versions_by_hashes(batch, loaders, [minecraft_version])
+            if latest is None:
+                plan["unchecked"].extend(by_hash[h] for h in batch)
+                continue
+            for sha1 in batch:
+                name = by_hash[sha1]
+                covered.add(name)
+                current = identified[name]["modrinth"]
+                version = latest.get(sha1)
+                file_info = self._primary_file(version) if version else None
+                if not version or version.get("id") == current.get("version_id") or not file_info:
+                    plan["up_to_date"] += 1
+                    continue
+                new_file = os.path.basename(file_info.get("filename", ""))
+                plan["updates"].append({
+                    "file": name,
+                    "source": "modrinth",
+                    "project_id": current.get("project_id"),
+                    "current_version": current.get("version_number"),
+                    "new_version": version.get("version_number"),
+                    "new_file": new_file,
+                    "job": {
+                        "dest": str(mods_folder / new_file),
+                        "urls": [file_info.get("url")],
+                        "sha1": file_info.get("hashes", {}).get("sha1"),
+                        "size": file_info.get("size"),
+                        "filename": new_file,
+                    },
+                    "manifest_entry": {
+                        "path": f"mods/{new_file}",
+                        "hashes": file_info.get("hashes", {}),
+                        "downloads": [file_info.get("url")],
+                        "fileSize": file_info.get("size"),
+                    },
+                })
+
+        # CurseForge: batched file + mod lookups for manifest entries
+        if source == "curseforge":
+            self._check_curseforge_updates(
+                manifest, identified, covered, minecraft_version, loader, mods_folder, plan, log_callback
+            )
+
+        plan["unchecked"].extend(name for name in identified if name not in covered and name not in plan["unchecked"])
+
+        if log_callback:
+            log_callback(
+                f"[OK] {len(plan['updates'])} updates available, {plan['up_to_date']} mods up to date, "
+                f"{len(plan['unchecked'])} not checked\n"
+            )
+        return plan
+
+    def _check_curseforge_updates(
+        self,
+        manifest: Dict,
+        identified: Dict[str, Dict],
+        covered: Set[str],
+        minecraft_version: str,
+        loader: str,
+        mods_folder: Path,
+        plan: Dict,
+        log_callback: Optional[Callable[[str], None]] = None
+    ):
+        """Adds CurseForge updates for manifest mods not already checked on Modrinth"""
+        if self.curseforge_api is None:
+            self.curseforge_api = CurseForgeAPI()
+
+        entries = {f.get("fileID"): f.get("projectID") for f in manifest.get("files", []) if f.get("fileID")}
+        file_ids = list(entries)
+
+        # fileID -> installed file name
+        installed = {}
+        for i in range(0, len(file_ids), self.CURSEFORGE_BATCH_SIZE):
+            for info in self.curseforge_api.get_files_info_batch(file_ids[i:i + self.CURSEFORGE_BATCH_SIZE]) or []:
+                name = os.path.basename(info.get("fileName") or "")
+                if name in identified and name not in covered:
+                    installed[info.get("id")] = name
+        if not installed:
+            return
+
+        if log_callback:
+            log_callback(f"Checking {len(installed)} CurseForge mods for updates...\n")
+
+        loader_id = CurseForgeAPI.MOD_LOADER_TYPES.get(loader)
+        project_to_file = {entries[fid]: fid for fid in installed}
+        project_ids = list(project_to_file)
+        newer = {}
+        for i in range(0, len(project_ids), self.CURSEFORGE_BATCH_SIZE):
+            for mod in self.curseforge_api.get_mods_info_batch(project_ids[i:i + self.CURSEFORGE_BATCH_SIZE]) or []:
+                current_id = project_to_file.get(mod.get("id"))
+                if current_id is None:
+                    continue
+                covered.add(installed[current_id])
+                candidates = [
+                    idx for idx in mod.get("latestFilesIndexes", [])
+                    if idx.get("gameVersion") == minecraft_version
+                    and idx.get("modLoader") in (None, loader_id)
+                ]
+                # Prefer releases (releaseType 1) over betas/alphas
+                releases = [idx for idx in candidates if idx.get("releaseType") == 1] or candidates
+                latest_id = max((idx.get("fileId", 0) for idx in releases), default=0)
+                if latest_id > current_id:
+                    newer[latest_id] = current_id
+                else:
+                    plan["up_to_date"] += 1
+
+        new_ids = list(newer)
+        for i in range(0, len(new_ids), self.CURSEFORGE_BATCH_SIZE):
+            for info in self.curseforge_api.get_files_info_batch(new_ids[i:i + self.CURSEFORGE_BATCH_SIZE]) or []:
+                current_id = newer.get(info.get("id"))
+                if current_id is None:
+                    continue
+                new_file = os.path.basename(info.get("fileName") or "")
+                plan["updates"].append({
+                    "file": installed[current_id],
+                    "source": "curseforge",
+                    "project_id": entries[current_id],
+                    "current_version": current_id,
+                    "new_version": info.get("id"),
+                    "new_file": new_file,
+                    "job": {
+                        "dest": str(mods_folder / new_file),
+                        "urls": self._curseforge_download_urls(info, new_file),
+                        "sha1": next((h.get("value") for h in info.get("hashes", []) if h.get("algo") == 1), None),
+                        "size": info.get("fileLength"),
+                        "key": f"curseforge:{info.get('id')}",
+                        "filename": new_file,
+                    },
+                    "manifest_entry": {"projectID": entries[current_id], "fileID": info.get("id")},
+                })
+
+    def apply_mod_updates(
+        self,
+        server_folder: str,
+        updates: List[Dict],
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Downloads the updates of a check_mod_updates() plan in parallel and
+        swaps them in. Replaced jars are moved to mods_replaced/ and the
+        saved manifest is updated so verify_server_files stays accurate.
+
+        Args:
+            server_folder: Path to the server folder
+            updates: plan["updates"] (or a subset of it)
+            log_callback: Function to report progress
+
+        Returns:
+            Dict with "updated" and "failed" lists of original file names
+        """
+        report = {"updated": [], "failed": []}
+        if not updates:
+            return report
+
+        if log_callback:
+            log_callback(f"Downloading {len(updates)} mod updates...\n")
+        results = self.artifact_downloader.fetch_many([u["job"] for u in updates], log_callback)
+
+        mods_folder = Path(server_folder) / "mods"
+        backup_folder = Path(server_folder) / "mods_replaced"
+        manifest, source = self._read_server_manifest(server_folder)
+
+        for update in updates:
+            if not results.get(update["job"]["dest"]):
+                report["failed"].append(update["file"])
+                continue
+
+            if update["new_file"] != update["file"] and (mods_folder / update["file"]).exists():
+                backup_folder.mkdir(exist_ok=True)
+                os.replace(mods_folder / update["file"], backup_folder / update["file"])
+
+            if manifest and source == update["source"] == "modrinth":
+                for i, entry in enumerate(manifest.get("files", [])):
+                    if entry.get("path") == f"mods/{update['file']}":
+                        manifest["files"][i] = {**entry, **update["manifest_entry"]}
+            elif manifest and source == update["source"] == "curseforge":
+                for entry in manifest.get("files", []):
+                    if entry.get("fileID") == update["current_version"]:
+                        entry.update(update["manifest_entry"])
+            report["updated"].append(update["file"])
+
+        if manifest and report["updated"]:
+            manifest_name = "modrinth.index.json" if source == "modrinth" else "manifest.json"
+            with open(Path(server_folder) / manifest_name, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+
+        # Refresh hashes/identification of the new jars
+        self.identify_mods(server_folder)
+
+        if log_callback:
+            log_callback(f"[OK] {len(report['updated'])} mods updated, {len(report['failed'])} failed\n")
+        return report
+
     # ==================== MODRINTH ====================
 
     def install_modrinth_modpack(
@@ -189,191 +615,304 @@ class ModpackManager:
             if log_callback:
                 log_callback(f"[OK] Modpack downloaded: {os.path.basename(modpack_file)}\n\n")
 
-            # Extract modpack
+            return self._install_mrpack(modpack_file, temp_dir, server_folder, log_callback, java_executable)
+
+        except Exception as e:
             if log_callback:
-                log_callback("Step 2/6: Extracting modpack files...\n")
+                log_callback(f"\n✗ Error during installation: {str(e)}\n")
+            return False
 
-            extract_dir = temp_dir / "extracted"
-            extract_dir.mkdir(exist_ok=True)
+    def _install_mrpack(
+        self,
+        modpack_file: str,
+        temp_dir: Path,
+        server_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        java_executable: Optional[str] = None,
+        mirror_dirs: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Installs an already available .mrpack file (steps 2-6 of a Modrinth install).
 
-            with zipfile.ZipFile(modpack_file, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+        Args:
+            modpack_file: Path to the .mrpack file
+            temp_dir: Temporary folder inside the server folder (removed afterwards)
+            server_folder: Folder where to install the server
+            log_callback: Function to report progress
+            java_executable: Pre-verified Java executable (skips verification if provided)
+            mirror_dirs: Extra local folders searched for mods before the network
 
-            if log_callback:
-                log_callback("[OK] Files extracted successfully\n\n")
+        Returns:
+            True if installation was successful
+        """
+        # Extract modpack
+        if log_callback:
+            log_callback("Step 2/6: Extracting modpack files...\n")
 
-            # Read manifest (modrinth.index.json)
-            manifest_path = extract_dir / "modrinth.index.json"
-            if not manifest_path.exists():
-                if log_callback:
-                    log_callback("✗ Error: modrinth.index.json not found\n")
-                return False
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir(exist_ok=True)
 
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+        with zipfile.ZipFile(modpack_file, 'r') as zip_ref:
+            zip_ref.extractall(extract_dir)
 
-            # Detect modpack information
-            minecraft_version = self.loader_manager.get_minecraft_version_from_manifest(manifest)
-            loader_type = self.loader_manager.detect_loader_type(manifest)
-            loader_version = self.loader_manager.get_loader_version_from_manifest(manifest)
+        if log_callback:
+            log_callback("[OK] Files extracted successfully\n\n")
 
+        # Read manifest (modrinth.index.json)
+        manifest_path = extract_dir / "modrinth.index.json"
+        if not manifest_path.exists():
             if log_callback:
-                log_callback("Step 3/6: Modpack information detected\n")
-                log_callback(f"  -Minecraft: {minecraft_version}\n")
-                log_callback(f"  -Loader: {loader_type}\n")
-                log_callback(f"  -Loader version: {loader_version or 'latest'}\n\n")
+                log_callback("✗ Error: modrinth.index.json not found\n")
+            return False
 
-            # Verify/install Java (skip if already verified)
-            if log_callback:
-                log_callback("Step 4/6: Verifying Java...\n")
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
 
-            if java_executable:
-                java_exe = java_executable
-                if log_callback:
-                    log_callback("Using pre-verified Java\n")
-            else:
-                java_exe = self.java_manager.ensure_java_installed(minecraft_version, log_callback)
+        # Detect modpack information
+        minecraft_version = self.loader_manager.get_minecraft_version_from_manifest(manifest)
+        loader_type = self.loader_manager.detect_loader_type(manifest)
+        loader_version = self.loader_manager.get_loader_version_from_manifest(manifest)
 
-                if not java_exe:
-                    if log_callback:
-                        log_callback("✗ Error: Could not install Java\n")
-                    return False
+        if log_callback:
+            log_callback("Step 3/6: Modpack information detected\n")
+            log_callback(f"  -Minecraft: {minecraft_version}\n")
+            log_callback(f"  -Loader: {loader_type}\n")
+            log_callback(f"  -Loader version: {loader_version or 'latest'}\n\n")
 
-            # Download mods and extract environment metadata
-            if log_callback:
-                log_callback("\nStep 5/6: Downloading modpack mods...\n")
+        # Verify/install Java (skip if already verified)
+        if log_callback:
+            log_callback("Step 4/6: Verifying Java...\n")
 
-            mods_folder = Path(server_folder) / "mods"
-            mods_folder.mkdir(exist_ok=True)
+        if java_executable:
+            java_exe = java_executable
+            if log_callback:
+                log_callback("Using pre-verified Java\n")
+        else:
+            java_exe = self.java_manager.ensure_java_installed(minecraft_version, log_callback)
 
-            files = manifest.get("files", [])
-            total_files = len(files)
+            if not java_exe:
+                if log_callback:
+                    log_callback("✗ Error: Could not install Java\n")
+                return False
 
+        # Download mods and extract environment metadata
+        if log_callback:
+            log_callback("\nStep 5/6: Downloading modpack mods...\n")
+
+        mods_folder = Path(server_folder) / "mods"
+        mods_folder.mkdir(exist_ok=True)
+
+        jobs = []
+        for file_info in manifest.get("files", []):
+            downloads = file_info.get("downloads", [])
+            file_path = file_info.get("path", "")
+
+            # Only download mods (not configs or resources)
+            if downloads and file_path.startswith("mods/"):
+                filename = os.path.basename(file_path)
+                jobs.append({
+                    "dest": str(mods_folder / filename),
+                    "urls": downloads,
+                    "sha1": file_info.get("hashes", {}).get("sha1"),
+                    "size": file_info.get("fileSize"),
+                    "filename": filename,
+                })
+
+        if log_callback:
+            log_callback(f"Downloading {len(jobs)} mods...\n")
+
+        results = self._get_artifact_downloader(mirror_dirs).fetch_many(jobs, log_callback)
+
+        if log_callback:
+            local_hits = sum(1 for source in results.values() if source in ("cache", "mirror"))
+            if local_hits:
+                log_callback(f"\n{local_hits}/{len(jobs)} mods resolved from local cache/mirrors\n")
+            log_callback("\n[OK] Mods downloaded\n\n")
+
+        # Seed the mod metadata cache straight from the manifest (env + hashes),
+        # so identification and client-only detection need no extra requests
+        metadata = self._load_mod_metadata(server_folder)
+        for file_info in manifest.get("files", []):
+            file_path = file_info.get("path", "")
+            if not file_path.startswith("mods/"):
+                continue
+            filename = os.path.basename(file_path)
+            entry = metadata.setdefault(filename, {})
+            env = file_info.get("env") or {}
+            if env:
+                entry["client"] = env.get("client", "required")
+                entry["server"] = env.get("server", "required")
+            jar_path = mods_folder / filename
+            sha1 = file_info.get("hashes", {}).get("sha1")
+            if sha1 and results.get(str(jar_path)):
+                stat = jar_path.stat()
+                entry.update(sha1=sha1.lower(), size=stat.st_size, mtime=stat.st_mtime)
+        self._save_mod_metadata(server_folder, metadata)
+
+        # Copy overrides (Modrinth supports layered overrides for server)
+        # 1. First copy general overrides
+        overrides_dir = extract_dir / "overrides"
+        if overrides_dir.exists():
             if log_callback:
-                log_callback(f"Downloading {total_files} mods...\n")
+                log_callback("Copying configuration files...\n")
 
-            for i, file_info in enumerate(files, 1):
-                downloads = file_info.get("downloads", [])
-                file_path = file_info.get("path", "")
+            self._copy_overrides(overrides_dir, Path(server_folder), log_callback)
 
-                if downloads and file_path:
-                    download_url = downloads[0]
-                    filename = os.path.basename(file_path)
+            if log_callback:
+                log_callback("[OK] Configurations copied\n")
 
-                    # Only download mods (not configs or resources)
-                    if file_path.startswith("mods/"):
-                        try:
-                            dest_file = mods_folder / filename
+        # 2. Then copy server-overrides (overwrites general overrides for server-specific configs)
+        server_overrides_dir = extract_dir / "server-overrides"
+        if server_overrides_dir.exists():
+            if log_callback:
+                log_callback("Applying server-specific configurations...\n")
 
-                            if log_callback:
-                                log_callback(f"  [{i}/{total_files}] {filename}...")
+            self._copy_overrides(server_overrides_dir, Path(server_folder), log_callback)
 
-                            # Use streaming to avoid loading entire file into memory
-                            response = requests.get(download_url, timeout=30, stream=True)
-                            response.raise_for_status()
+            if log_callback:
+                log_callback("[OK] Server configurations applied\n")
+
+        if log_callback:
+            log_callback("\n")
+
+        # Install loader
+        if log_callback:
+            log_callback("Step 6/6: Installing mod loader...\n")
+
+        if loader_type in ("forge", "neoforge"):
+            # NeoForge is a Forge fork - attempt Forge installation
+            if loader_type == "neoforge" and log_callback:
+                log_callback("⚠ NeoForge detected - attempting Forge-compatible installation\n")
+            success = self.loader_manager.install_forge(
+                minecraft_version,
+                server_folder,
+                java_exe,
+                loader_version,
+                log_callback
+            )
+        elif loader_type in ("fabric", "quilt"):
+            # Quilt is compatible with Fabric loader for most cases
+            success = self.loader_manager.install_fabric(
+                minecraft_version,
+                server_folder,
+                java_exe,
+                loader_version,
+                log_callback
+            )
+            if loader_type == "quilt" and log_callback:
+                log_callback("⚠ Note: Installed Fabric (compatible with most Quilt mods)\n")
+        else:
+            if log_callback:
+                log_callback(f"✗ Error: Loader '{loader_type}' not supported\n")
+                log_callback("  Supported loaders: forge, neoforge, fabric, quilt\n")
+            success = False
 
-                            # Write in chunks to reduce memory usage
-                            with open(dest_file, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    if chunk:
-                                        f.write(chunk)
+        # Save manifest to server folder for version detection later
+        if success:
+            try:
+                dest_manifest = Path(server_folder) / "modrinth.index.json"
+                shutil.copy2(manifest_path, dest_manifest)
+                if log_callback:
+                    log_callback("\n[OK] Manifest saved for future reference\n")
+            except Exception as e:
+                if log_callback:
+                    log_callback(f"⚠ Warning: Could not save manifest: {e}\n")
 
-                            if log_callback:
-                                log_callback(" [OK]\n")
+            # Pre-create EULA so server can start and generate files in a single run
+            if log_callback:
+                log_callback("\nConfiguring EULA...\n")
+            self._create_eula_file(server_folder, log_callback)
 
-                        except Exception as e:
-                            if log_callback:
-                                log_callback(f" [ERROR: {str(e)}]\n")
+        # Clean up temporary files
+        try:
+            shutil.rmtree(temp_dir)
+        except Exception:
+            pass
 
-            if log_callback:
-                log_callback("\n[OK] Mods downloaded\n\n")
+        if success and log_callback:
+            log_callback("\n╔════════════════════════════════════════════════╗\n")
+            log_callback("║   [OK] MODPACK INSTALLED SUCCESSFULLY            ║\n")
+            log_callback("╚════════════════════════════════════════════════╝\n\n")
 
-            # Copy overrides (Modrinth supports layered overrides for server)
-            # 1. First copy general overrides
-            overrides_dir = extract_dir / "overrides"
-            if overrides_dir.exists():
-                if log_callback:
-                    log_callback("Copying configuration files...\n")
+        return success
 
-                self._copy_overrides(overrides_dir, Path(server_folder), log_callback)
+    # ==================== LOCAL PACKS ====================
 
-                if log_callback:
-                    log_callback("[OK] Configurations copied\n")
+    def _get_artifact_downloader(self, mirror_dirs: Optional[List[str]] = None) -> ArtifactDownloader:
+        """Returns the shared artifact downloader, or a one-off one with extra mirrors"""
+        if not mirror_dirs:
+            return self.artifact_downloader
+        return ArtifactDownloader(
+            self.artifact_downloader.cache,
+            mirror_dirs=list(mirror_dirs),
+            max_workers=self.artifact_downloader.max_workers,
+            race=self.artifact_downloader.race
+        )
 
-            # 2. Then copy server-overrides (overwrites general overrides for server-specific configs)
-            server_overrides_dir = extract_dir / "server-overrides"
-            if server_overrides_dir.exists():
-                if log_callback:
-                    log_callback("Applying server-specific configurations...\n")
+    def install_local_modpack(
+        self,
+        pack_path: str,
+        server_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        java_executable: Optional[str] = None,
+        mirror_dirs: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Installs a modpack from a local .mrpack or CurseForge export zip.
 
-                self._copy_overrides(server_overrides_dir, Path(server_folder), log_callback)
+        No modpack API call is needed to start: every mod is resolved from the
+        local artifact cache or the given mirror folders first, and only misses
+        go to the network (CurseForge misses are resolved with one batched
+        files request).
 
-                if log_callback:
-                    log_callback("[OK] Server configurations applied\n")
+        Args:
+            pack_path: Path to a .mrpack or a CurseForge export (.zip with manifest.json)
+            server_folder: Folder where to install the server
+            log_callback: Function to report progress
+            java_executable: Pre-verified Java executable (skips verification if provided)
+            mirror_dirs: Local mirror folders (PyCraft cache layout or plain jar folders)
 
+        Returns:
+            True if installation was successful
+        """
+        try:
             if log_callback:
-                log_callback("\n")
+                log_callback("\n╔════════════════════════════════════════════════╗\n")
+                log_callback("║   LOCAL MODPACK INSTALLATION                   ║\n")
+                log_callback("╚════════════════════════════════════════════════╝\n\n")
+                log_callback(f"Step 1/6: Using local modpack file: {os.path.basename(pack_path)}\n")
 
-            # Install loader
-            if log_callback:
-                log_callback("Step 6/6: Installing mod loader...\n")
-
-            if loader_type in ("forge", "neoforge"):
-                # NeoForge is a Forge fork - attempt Forge installation
-                if loader_type == "neoforge" and log_callback:
-                    log_callback("⚠ NeoForge detected - attempting Forge-compatible installation\n")
-                success = self.loader_manager.install_forge(
-                    minecraft_version,
-                    server_folder,
-                    java_exe,
-                    loader_version,
-                    log_callback
-                )
-            elif loader_type in ("fabric", "quilt"):
-                # Quilt is compatible with Fabric loader for most cases
-                success = self.loader_manager.install_fabric(
-                    minecraft_version,
-                    server_folder,
-                    java_exe,
-                    loader_version,
-                    log_callback
-                )
-                if loader_type == "quilt" and log_callback:
-                    log_callback("⚠ Note: Installed Fabric (compatible with most Quilt mods)\n")
-            else:
+            if not zipfile.is_zipfile(pack_path):
                 if log_callback:
-                    log_callback(f"✗ Error: Loader '{loader_type}' not supported\n")
-                    log_callback("  Supported loaders: forge, neoforge, fabric, quilt\n")
-                success = False
+                    log_callback("✗ Error: File is not a .mrpack or .zip modpack\n")
+                return False
 
-            # Save manifest to server folder for version detection later
-            if success:
-                try:
-                    dest_manifest = Path(server_folder) / "modrinth.index.json"
-                    shutil.copy2(manifest_path, dest_manifest)
-                    if log_callback:
-                        log_callback("\n[OK] Manifest saved for future reference\n")
-                except Exception as e:
-                    if log_callback:
-                        log_callback(f"⚠ Warning: Could not save manifest: {e}\n")
+            with zipfile.ZipFile(pack_path, 'r') as zip_ref:
+                names = set(zip_ref.namelist())
 
-                # Pre-create EULA so server can start and generate files in a single run
-                if log_callback:
-                    log_callback("\nConfiguring EULA...\n")
-                self._create_eula_file(server_folder, log_callback)
+            os.makedirs(server_folder, exist_ok=True)
+            temp_dir = Path(server_folder) / ".temp_modpack"
+            temp_dir.mkdir(exist_ok=True)
 
-            # Clean up temporary files
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception:
-                pass
+            if "modrinth.index.json" in names:
+                if log_callback:
+                    log_callback("[OK] Modrinth modpack detected\n\n")
+                return self._install_mrpack(
+                    pack_path, temp_dir, server_folder, log_callback, java_executable, mirror_dirs
+                )
 
-            if success and log_callback:
-                log_callback("\n╔════════════════════════════════════════════════╗\n")
-                log_callback("║   [OK] MODPACK INSTALLED SUCCESSFULLY            ║\n")
-                log_callback("╚════════════════════════════════════════════════╝\n\n")
+            if "manifest.json" in names:
+                if self.curseforge_api is None:
+                    self.curseforge_api = CurseForgeAPI()
+                if log_callback:
+                    log_callback("[OK] CurseForge modpack detected\n\n")
+                return self._install_curseforge_pack(
+                    pack_path, temp_dir, server_folder, log_callback, java_executable, mirror_dirs
+                )
 
-            return success
+            if log_callback:
+                log_callback("✗ Error: No modrinth.index.json or manifest.json in modpack file\n")
+            return False
 
         except Exception as e:
             if log_callback:
@@ -882,205 +1421,436 @@ class ModpackManager:
             if log_callback:
                 log_callback(f"[OK] Modpack downloaded: {os.path.basename(modpack_file)}\n\n")
 
-            # Extract modpack
+            return self._install_curseforge_pack(modpack_file, temp_dir, server_folder, log_callback, java_executable)
+
+        except Exception as e:
             if log_callback:
-                log_callback("Step 3/6: Extracting modpack files...\n")
+                log_callback(f"\n✗ Error during installation: {str(e)}\n")
+            return False
 
-            extract_dir = temp_dir / "extracted"
-            extract_dir.mkdir(exist_ok=True)
+    def _resolve_curseforge_jobs(
+        self,
+        files: List[Dict],
+        mods_folder: Path,
+        downloader: ArtifactDownloader,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> List[Dict]:
+        """
+        Turns CurseForge manifest entries into artifact jobs.
 
-            with zipfile.ZipFile(modpack_file, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+        File IDs already known to the artifact cache (or a mirror) are resolved
+        locally; the rest are looked up with batched files requests.
 
-            if log_callback:
-                log_callback("[OK] Files extracted successfully\n\n")
+        Args:
+            files: manifest.json "files" entries (projectID/fileID)
+            mods_folder: Destination mods folder
+            downloader: Artifact downloader whose cache/mirrors are consulted
+            log_callback: Function to report progress
 
-            # Read manifest (manifest.json)
-            manifest_path = extract_dir / "manifest.json"
-            if not manifest_path.exists():
-                if log_callback:
-                    log_callback("✗ Error: manifest.json not found\n")
-                return False
+        Returns:
+            List of artifact job dicts
+        """
+        jobs = []
+        unresolved = []
+
+        for file_info in files:
+            project_id = file_info.get("projectID")
+            file_id_mod = file_info.get("fileID")
+            if not project_id or not file_id_mod:
+                continue
+
+            key = f"curseforge:{file_id_mod}"
+            entry = downloader.lookup(key)
+            if entry:
+                filename = os.path.basename(entry["filename"])
+                jobs.append({
+                    "dest": str(mods_folder / filename),
+                    "urls": [],
+                    "sha1": entry["sha1"],
+                    "key": key,
+                    "filename": filename,
+                })
+            else:
+                unresolved.append((project_id, file_id_mod))
+
+        if not unresolved:
+            return jobs
+
+        if log_callback:
+            log_callback(f"Resolving {len(unresolved)} files from CurseForge...\n")
+
+        file_infos = []
+        for i in range(0, len(unresolved), self.CURSEFORGE_BATCH_SIZE):
+            batch = unresolved[i:i + self.CURSEFORGE_BATCH_SIZE]
+            infos = self.curseforge_api.get_files_info_batch([fid for _, fid in batch])
+            if infos is None:
+                # Batch endpoint unavailable - fall back to per-file lookups
+                infos = [self.curseforge_api.get_mod_file_info(pid, fid) for pid, fid in batch]
+            file_infos.extend(info for info in infos if info)
+
+        for file_data in file_infos:
+            file_id_mod = file_data.get("id")
+            filename = os.path.basename(file_data.get("fileName") or f"mod_{file_data.get('modId')}.jar")
+
+            jobs.append({
+                "dest": str(mods_folder / filename),
+                # downloadUrl (may be null) and the CDN hosts, ranked/raced by the downloader
+                "urls": self._curseforge_download_urls(file_data, filename),
+                # CurseForge hash algo 1 = sha1
+                "sha1": next((h.get("value") for h in file_data.get("hashes", []) if h.get("algo") == 1), None),
+                "size": file_data.get("fileLength"),
+                "key": f"curseforge:{file_id_mod}",
+                "filename": filename,
+            })
+
+        return jobs
+
+    def _install_curseforge_pack(
+        self,
+        modpack_file: str,
+        temp_dir: Path,
+        server_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        java_executable: Optional[str] = None,
+        mirror_dirs: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Installs an already available CurseForge client pack (manifest.json + overrides).
+
+        Args:
+            modpack_file: Path to the CurseForge modpack zip
+            temp_dir: Temporary folder inside the server folder (removed afterwards)
+            server_folder: Folder where to install the server
+            log_callback: Function to report progress
+            java_executable: Pre-verified Java executable (skips verification if provided)
+            mirror_dirs: Extra local folders searched for mods before the network
+
+        Returns:
+            True if installation was successful
+        """
+        # Extract modpack
+        if log_callback:
+            log_callback("Step 3/6: Extracting modpack files...\n")
+
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir(exist_ok=True)
 
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+        with zipfile.ZipFile(modpack_file, 'r') as zip_ref:
+            zip_ref.extractall(extract_dir)
 
-            # Detect modpack information
-            minecraft_version = self.loader_manager.get_minecraft_version_from_manifest(manifest)
-            loader_type = self.loader_manager.detect_loader_type(manifest)
-            loader_version = self.loader_manager.get_loader_version_from_manifest(manifest)
+        if log_callback:
+            log_callback("[OK] Files extracted successfully\n\n")
 
+        # Read manifest (manifest.json)
+        manifest_path = extract_dir / "manifest.json"
+        if not manifest_path.exists():
             if log_callback:
-                log_callback("Step 4/6: Modpack information detected\n")
-                log_callback(f"  - Minecraft: {minecraft_version}\n")
-                log_callback(f"  - Loader: {loader_type}\n")
-                log_callback(f"  - Loader version: {loader_version or 'latest'}\n\n")
+                log_callback("✗ Error: manifest.json not found\n")
+            return False
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        # Detect modpack information
+        minecraft_version = self.loader_manager.get_minecraft_version_from_manifest(manifest)
+        loader_type = self.loader_manager.detect_loader_type(manifest)
+        loader_version = self.loader_manager.get_loader_version_from_manifest(manifest)
 
-            # Verify/install Java (skip if already verified)
+        if log_callback:
+            log_callback("Step 4/6: Modpack information detected\n")
+            log_callback(f"  - Minecraft: {minecraft_version}\n")
+            log_callback(f"  - Loader: {loader_type}\n")
+            log_callback(f"  - Loader version: {loader_version or 'latest'}\n\n")
+
+        # Verify/install Java (skip if already verified)
+        if log_callback:
+            log_callback("    Verifying Java...\n")
+
+        if java_executable:
+            java_exe = java_executable
             if log_callback:
-                log_callback("    Verifying Java...\n")
+                log_callback("Using pre-verified Java\n")
+        else:
+            java_exe = self.java_manager.ensure_java_installed(minecraft_version, log_callback)
 
-            if java_executable:
-                java_exe = java_executable
+            if not java_exe:
                 if log_callback:
-                    log_callback("Using pre-verified Java\n")
-            else:
-                java_exe = self.java_manager.ensure_java_installed(minecraft_version, log_callback)
+                    log_callback("✗ Error: Could not install Java\n")
+                return False
 
-                if not java_exe:
-                    if log_callback:
-                        log_callback("✗ Error: Could not install Java\n")
-                    return False
+        # Download mods
+        if log_callback:
+            log_callback("\nStep 5/6: Downloading modpack mods...\n")
+
+        mods_folder = Path(server_folder) / "mods"
+        mods_folder.mkdir(exist_ok=True)
+
+        downloader = self._get_artifact_downloader(mirror_dirs)
+        jobs = self._resolve_curseforge_jobs(manifest.get("files", []), mods_folder, downloader, log_callback)
+
+        if log_callback:
+            log_callback(f"Downloading {len(jobs)} mods from CurseForge...\n")
+
+        results = downloader.fetch_many(jobs, log_callback)
+
+        if log_callback:
+            local_hits = sum(1 for source in results.values() if source in ("cache", "mirror"))
+            if local_hits:
+                log_callback(f"\n{local_hits}/{len(jobs)} mods resolved from local cache/mirrors\n")
+            log_callback("\n[OK] Mods downloaded\n\n")
 
-            # Download mods
+        # Copy overrides
+        overrides_dir = extract_dir / manifest.get("overrides", "overrides")
+        if overrides_dir.exists():
             if log_callback:
-                log_callback("\nStep 5/6: Downloading modpack mods...\n")
+                log_callback("Copying configuration files...\n")
 
-            mods_folder = Path(server_folder) / "mods"
-            mods_folder.mkdir(exist_ok=True)
+            self._copy_overrides(overrides_dir, Path(server_folder), log_callback)
 
-            files = manifest.get("files", [])
-            total_files = len(files)
+            if log_callback:
+                log_callback("[OK] Configurations copied\n\n")
+
+        # Install loader
+        if log_callback:
+            log_callback("Step 6/6: Installing mod loader...\n")
+
+        if loader_type in ("forge", "neoforge"):
+            # NeoForge is a Forge fork - attempt Forge installation
+            # Note: Some NeoForge-specific modpacks may require manual setup
+            if loader_type == "neoforge" and log_callback:
+                log_callback("⚠ NeoForge detected - attempting Forge-compatible installation\n")
+            success = self.loader_manager.install_forge(
+                minecraft_version,
+                server_folder,
+                java_exe,
+                loader_version,
+                log_callback
+            )
+        elif loader_type in ("fabric", "quilt"):
+            # Quilt is compatible with Fabric loader for most cases
+            success = self.loader_manager.install_fabric(
+                minecraft_version,
+                server_folder,
+                java_exe,
+                loader_version,
+                log_callback
+            )
+            if loader_type == "quilt" and log_callback:
+                log_callback("⚠ Note: Installed Fabric (compatible with most Quilt mods)\n")
+        else:
+            if log_callback:
+                log_callback(f"✗ Error: Loader '{loader_type}' not supported\n")
+                log_callback("  Supported loaders: forge, neoforge, fabric, quilt\n")
+            success = False
+
+        # Save manifest to server folder for version detection later
+        if success:
+            try:
+                dest_manifest = Path(server_folder) / "manifest.json"
+                shutil.copy2(manifest_path, dest_manifest)
+                if log_callback:
+                    log_callback("\n[OK] Manifest saved for future reference\n")
+            except Exception as e:
+                if log_callback:
+                    log_callback(f"⚠ Warning: Could not save manifest: {e}\n")
 
+            # Pre-create EULA so server can start and generate files in a single run
             if log_callback:
-                log_callback(f"Downloading {total_files} mods from CurseForge...\n")
-
-            def build_cdn_url(file_id: int, filename: str) -> str:
-                """Build alternative CDN URL when downloadUrl is null"""
-                file_id_str = str(file_id)
-                if len(file_id_str) > 4:
-                    first_part = file_id_str[:4]
-                    second_part = file_id_str[4:].lstrip('0') or '0'
-                else:
-                    first_part = file_id_str
-                    second_part = "0"
-                return f"https://edge.forgecdn.net/files/{first_part}/{second_part}/{filename}"
+                log_callback("\nConfiguring EULA...\n")
+            self._create_eula_file(server_folder, log_callback)
 
-            for i, file_info in enumerate(files, 1):
-                project_id = file_info.get("projectID")
-                file_id_mod = file_info.get("fileID")
+        # Clean up temporary files
+        try:
+            shutil.rmtree(temp_dir)
+        except Exception:
+            pass
 
-                if project_id and file_id_mod:
-                    try:
-                        # Get file information
-                        file_data = self.curseforge_api.get_mod_file_info(project_id, file_id_mod)
+        if success and log_callback:
+            log_callback("\n╔════════════════════════════════════════════════╗\n")
+            log_callback("║   [OK] MODPACK INSTALLED SUCCESSFULLY          ║\n")
+            log_callback("╚════════════════════════════════════════════════╝\n\n")
 
-                        if file_data:
-                            filename = file_data.get("fileName", f"mod_{project_id}.jar")
-                            download_url = file_data.get("downloadUrl")
+        return success
 
-                            # If no download URL, use the CDN fallback
-                            if not download_url:
-                                download_url = build_cdn_url(file_id_mod, filename)
+    # ==================== VERIFICATION ====================
 
-                            if log_callback:
-                                log_callback(f"  [{i}/{total_files}] {filename}...")
+    @staticmethod
+    def _curseforge_cdn_url(file_id: int, filename: str, host: str = "edge.forgecdn.net") -> str:
+        """Builds the forgecdn URL used when downloadUrl is null"""
+        file_id_str = str(file_id)
+        first_part = file_id_str[:4]
+        second_part = file_id_str[4:].lstrip('0') or '0'
+        return f"https://{host}/files/{first_part}/{second_part}/{quote(filename)}"
 
-                            dest_file = mods_folder / filename
+    @classmethod
+    def _curseforge_download_urls(cls, file_data: Dict, filename: str) -> List[str]:
+        """Candidate URLs for a CurseForge file: its downloadUrl plus every CDN host"""
+        urls = [file_data.get("downloadUrl")]
+        urls.extend(cls._curseforge_cdn_url(file_data.get("id"), filename, host) for host in CurseForgeAPI.CDN_HOSTS)
+        return list(dict.fromkeys(u for u in urls if u))
 
-                            # Use streaming with redirects support
-                            response = requests.get(
-                                download_url,
-                                timeout=60,
-                                stream=True,
-                                allow_redirects=True,
-                                headers={"User-Agent": "PyCraft/1.0"}
-                            )
-                            response.raise_for_status()
+    def _load_expected_files(
+        self,
+        server_folder: str,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[Optional[Dict[str, Dict]], str]:
+        """
+        Builds the list of files a server should contain from its saved manifest.
 
-                            # Write in chunks to reduce memory usage
-                            with open(dest_file, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    if chunk:
-                                        f.write(chunk)
+        modrinth.index.json already carries sha1/size per file. CurseForge's
+        manifest.json only has project/file IDs, so file names and hashes are
+        resolved with a single batched files request.
 
-                            if log_callback:
-                                log_callback(" [OK]\n")
+        Args:
+            server_folder: Path to the server folder
+            log_callback: Function to report progress
 
-                    except Exception as e:
-                        if log_callback:
-                            log_callback(f" ✗ Error: {str(e)}\n")
+        Returns:
+            Tuple of (dict mapping relative path -> {sha1, size, downloads} or None, source)
+        """
+        modrinth_manifest = Path(server_folder) / "modrinth.index.json"
+        if modrinth_manifest.exists():
+            with open(modrinth_manifest, 'r', encoding='utf-8') as f:
+                return expected_from_modrinth_index(json.load(f), prefixes=None), "modrinth"
 
-            if log_callback:
-                log_callback("\n[OK] Mods downloaded\n\n")
+        curseforge_manifest = Path(server_folder) / "manifest.json"
+        if not curseforge_manifest.exists():
+            return None, ""
 
-            # Copy overrides
-            overrides_dir = extract_dir / manifest.get("overrides", "overrides")
-            if overrides_dir.exists():
-                if log_callback:
-                    log_callback("Copying configuration files...\n")
+        with open(curseforge_manifest, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
 
-                self._copy_overrides(overrides_dir, Path(server_folder), log_callback)
+        file_ids = [f.get("fileID") for f in manifest.get("files", []) if f.get("fileID")]
+        if not file_ids:
+            return None, ""
 
-                if log_callback:
-                    log_callback("[OK] Configurations copied\n\n")
+        if self.curseforge_api is None:
+            self.curseforge_api = CurseForgeAPI()
 
-            # Install loader
-            if log_callback:
-                log_callback("Step 6/6: Installing mod loader...\n")
-
-            if loader_type in ("forge", "neoforge"):
-                # NeoForge is a Forge fork - attempt Forge installation
-                # Note: Some NeoForge-specific modpacks may require manual setup
-                if loader_type == "neoforge" and log_callback:
-                    log_callback("⚠ NeoForge detected - attempting Forge-compatible installation\n")
-                success = self.loader_manager.install_forge(
-                    minecraft_version,
-                    server_folder,
-                    java_exe,
-                    loader_version,
-                    log_callback
-                )
-            elif loader_type in ("fabric", "quilt"):
-                # Quilt is compatible with Fabric loader for most cases
-                success = self.loader_manager.install_fabric(
-                    minecraft_version,
-                    server_folder,
-                    java_exe,
-                    loader_version,
-                    log_callback
-                )
-                if loader_type == "quilt" and log_callback:
-                    log_callback("⚠ Note: Installed Fabric (compatible with most Quilt mods)\n")
-            else:
+        if log_callback:
+            log_callback(f"Resolving {len(file_ids)} CurseForge files...\n")
+
+        expected = {}
+        for i in range(0, len(file_ids), self.CURSEFORGE_BATCH_SIZE):
+            batch = self.curseforge_api.get_files_info_batch(file_ids[i:i + self.CURSEFORGE_BATCH_SIZE])
+            if batch is None:
                 if log_callback:
-                    log_callback(f"✗ Error: Loader '{loader_type}' not supported\n")
-                    log_callback("  Supported loaders: forge, neoforge, fabric, quilt\n")
-                success = False
+                    log_callback("✗ Could not reach CurseForge to resolve manifest files\n")
+                return None, "curseforge"
+            for file_data in batch:
+                filename = os.path.basename(file_data.get("fileName") or "")
+                if not filename:
+                    continue
+                # CurseForge hash algo 1 = sha1, 2 = md5
+                sha1 = next((h.get("value") for h in file_data.get("hashes", []) if h.get("algo") == 1), None)
+                expected[f"mods/{filename}"] = {
+                    "sha1": sha1,
+                    "size": file_data.get("fileLength"),
+                    "downloads": self._curseforge_download_urls(file_data, filename),
+                }
+        return expected, "curseforge"
 
-            # Save manifest to server folder for version detection later
-            if success:
-                try:
-                    dest_manifest = Path(server_folder) / "manifest.json"
-                    shutil.copy2(manifest_path, dest_manifest)
-                    if log_callback:
-                        log_callback("\n[OK] Manifest saved for future reference\n")
-                except Exception as e:
-                    if log_callback:
-                        log_callback(f"⚠ Warning: Could not save manifest: {e}\n")
+    def _refetch_file(self, server_folder: str, rel_path: str, info: Dict) -> bool:
+        """
+        Re-downloads one manifest file from its URLs and checks the result
 
-                # Pre-create EULA so server can start and generate files in a single run
-                if log_callback:
-                    log_callback("\nConfiguring EULA...\n")
-                self._create_eula_file(server_folder, log_callback)
+        Installed files are hard-linked to their cache entry, so a corrupt
+        file usually means a corrupt cache entry: the entry is re-hashed (and
+        evicted if bad) and the local stores are skipped.
+        """
+        dest_file = Path(server_folder, *rel_path.split("/"))
+        sha1 = info.get("sha1")
+        self.artifact_downloader.cache.evict_if_corrupt(sha1)
+        make_private(str(dest_file))
+        job = {
+            "dest": str(dest_file),
+            "urls": info.get("downloads", []),
+            "sha1": sha1,
+            "size": info.get("size"),
+            "filename": dest_file.name,
+            "local": False,
+        }
+        if self.artifact_downloader.fetch(job) is None:
+            return False
+        if sha1:
+            return (hash_file(str(dest_file)) or "").lower() == sha1.lower()
+        return info.get("size") is None or dest_file.stat().st_size == info["size"]
 
-            # Clean up temporary files
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception:
-                pass
+    def verify_server_files(
+        self,
+        server_folder: str,
+        repair: bool = False,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> Optional[Dict]:
+        """
+        Verifies an installed modpack server against its saved manifest.
 
-            if success and log_callback:
-                log_callback("\n╔════════════════════════════════════════════════╗\n")
-                log_callback("║   [OK] MODPACK INSTALLED SUCCESSFULLY          ║\n")
-                log_callback("╚════════════════════════════════════════════════╝\n\n")
+        Every manifest-listed server-side file (mods, configs, resource packs,
+        libraries...) is hashed concurrently (sha1 fast path). Unlisted files
+        are reported as "extra" only in the folders the manifest installs to.
+        Mods moved to client_mods_deleted by the client-only cleanup are
+        reported as "removed" instead of missing.
 
-            return success
+        In the GUI: "Verify Files" on the Run Modded Server page.
+
+        Args:
+            server_folder: Path to the server folder
+            repair: Re-download only missing and corrupt files
+            log_callback: Function to report progress
 
+        Returns:
+            Dict with lists ok, missing, corrupt, extra, removed (and repaired,
+            failed when repair=True) plus "source", or None if no manifest exists
+        """
+        try:
+            expected, source = self._load_expected_files(server_folder, log_callback)
         except Exception as e:
             if log_callback:
-                log_callback(f"\n✗ Error during installation: {str(e)}\n")
-            return False
+                log_callback(f"✗ Could not read manifest: {e}\n")
+            return None
+
+        if expected is None:
+            if log_callback:
+                log_callback("✗ No modrinth.index.json or manifest.json found in server folder\n")
+            return None
+
+        if log_callback:
+            log_callback(f"Verifying {len(expected)} files...\n")
+
+        scan_folders = sorted({path.split("/")[0] for path in expected if "/" in path})
+        report = verify_files(server_folder, expected, scan_folders=scan_folders)
+        report["source"] = source
+
+        backup_folder = Path(server_folder) / "client_mods_deleted"
+        report["removed"] = [
+            p for p in report["missing"] if p.startswith("mods/") and (backup_folder / os.path.basename(p)).exists()
+        ]
+        report["missing"] = [p for p in report["missing"] if p not in report["removed"]]
+
+        if log_callback:
+            log_callback(
+                f"[OK] {len(report['ok'])} ok, {len(report['missing'])} missing, "
+                f"{len(report['corrupt'])} corrupt, {len(report['extra'])} extra\n"
+            )
+            for rel_path in report["missing"]:
+                log_callback(f"  missing: {rel_path}\n")
+            for rel_path in report["corrupt"]:
+                log_callback(f"  corrupt: {rel_path}\n")
+
+        if repair:
+            bad = report["missing"] + report["corrupt"]
+            report["repaired"], report["failed"] = [], []
+            if bad:
+                if log_callback:
+                    log_callback(f"Re-downloading {len(bad)} file(s)...\n")
+                with ThreadPoolExecutor(max_workers=min(8, len(bad))) as executor:
+                    results = executor.map(lambda p: self._refetch_file(server_folder, p, expected[p]), bad)
+                    for rel_path, ok in zip(bad, results):
+                        report["repaired" if ok else "failed"].append(rel_path)
+                if log_callback:
+                    log_callback(f"[OK] Repaired {len(report['repaired'])}/{len(bad)} file(s)\n")
+
+        return report
 
     # ==================== UTILITIES ====================
 
@@ -1243,7 +2013,8 @@ max-world-size=29999984
                     # Create directories if they don't exist
                     dest_file.parent.mkdir(parents=True, exist_ok=True)
 
-                    # Copy file
+                    # Copy file (detach shared inodes first so other servers keep theirs)
+                    make_private(str(dest_file))
                     shutil.copy2(item, dest_file)
 
         except Exception as e:
@@ -1257,13 +2028,13 @@ max-world-size=29999984
         limit: int = 10,
         offset: int = 0,
         side_filter: str = None
-    ) -> Tuple[Optional[List[Dict]], int]:
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
         """
         Searches for modpacks on the specified platform
 
         Args:
             query: Search text
-            platform: "modrinth" or "curseforge"
+            platform: "modrinth", "curseforge" or "all" (both, merged)
             limit: Maximum number of results per page
             offset: Number of results to skip (for pagination)
             side_filter: Filter by side - "server" for server-compatible modpacks,
@@ -1272,16 +2043,381 @@ max-world-size=29999984
         Returns:
             Tuple of (list of modpacks, total results count)
         """
+        if platform == "all":
+            return self.search_modpacks_federated(query, limit, offset, side_filter)
         if platform == "modrinth":
-            return self.modrinth_api.search_modpacks(query, limit, offset, side_filter)
+            results, total = self.modrinth_api.search_modpacks(query, limit, offset, side_filter)
         elif platform == "curseforge":
             # CurseForge API is always configured (uses proxy)
             if self.curseforge_api is None:
                 self.curseforge_api = CurseForgeAPI()
             # For server filter, use server_pack_filter
             server_pack_filter = side_filter == "server"
-            return self.curseforge_api.search_modpacks(query, limit, offset, server_pack_filter)
-        return None, 0
+            results, total = self.curseforge_api.search_modpacks(query, limit, offset, server_pack_filter)
+        else:
+            return None, 0
+
+        # Everything seen online refreshes the offline catalog
+        if results and self.catalog:
+            self.catalog.upsert(results)
+        return results, total
+
+    def search_modpacks_federated(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        side_filter: str = None,
+        on_partial: Optional[Callable[[List[ModpackSummary], int], None]] = None
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
+        """
+        Searches Modrinth and CurseForge concurrently and merges the results
+
+        Both providers are queried at the same time on one event loop
+        (AsyncHttpClient), so latency is that of the slowest one. Each provider's results are paged through (within its own
+        maximum page size) until it has offset + limit of them, and kept for
+        the same query and filter so later pages only fetch what's missing.
+        Packs published on both (same slug or title) appear once, with the
+        other copy kept in "alternates". Results are ranked by search_score().
+
+        Args:
+            query: Search text
+            limit: Maximum number of results per page
+            offset: Number of results to skip (for pagination)
+            side_filter: Same as search_modpacks()
+            on_partial: Called with (page, total) each time a provider answers,
+                        so results can be shown before the slower one finishes
+
+        Returns:
+            Tuple of (list of modpacks, estimated total results count)
+        """
+        key = (query, side_filter)
+        with self._federated_cache_lock:
+            cached_key, created, cache = self._federated_cache
+            if cached_key != key or time.time() - created > self.SEARCH_CACHE_SECONDS:
+                cache = {}
+                self._federated_cache = (key, time.time(), cache)
+
+        return asyncio.run(self._search_federated_async(query, limit, offset, side_filter, on_partial, cache))
+
+    async def _search_federated_async(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        side_filter: Optional[str],
+        on_partial: Optional[Callable[[List[ModpackSummary], int], None]],
+        cache: Dict[str, Dict]
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
+        """search_modpacks_federated() on one event loop (both providers share one client)"""
+        responses: Dict[str, Tuple[List[ModpackSummary], int]] = {}
+        page: List[Dict] = []
+        total = 0
+
+        async with AsyncHttpClient() as client:
+            apis = {"modrinth": AsyncModrinthAPI(client), "curseforge": AsyncCurseForgeAPI(client=client)}
+
+            async def search(platform: str):
+                try:
+                    return platform, await self._fetch_provider_results(
+                        apis[platform], query, platform, offset + limit, side_filter, cache
+                    )
+                except Exception as e:
+                    print(f"Error searching modpacks on {platform}: {e}")
+                    return platform, (None, 0)
+
+            for next_done in asyncio.as_completed([search(platform) for platform in self.SEARCH_PROVIDERS]):
+                platform, (results, provider_total) = await next_done
+                if results is None:
+                    continue
+                responses[platform] = (results, provider_total)
+
+                merged, duplicates = self._merge_search_results(responses, query)
+                page = merged[offset:offset + limit]
+                total = max(sum(t for _, t in responses.values()) - duplicates, len(merged))
+                if on_partial:
+                    on_partial(page, total)
+
+        if not responses:
+            return None, 0
+        return page, total
+
+    async def _fetch_provider_results(
+        self,
+        api,
+        query: str,
+        platform: str,
+        count: int,
+        side_filter: Optional[str],
+        cache: Dict[str, Dict]
+    ) -> Tuple[Optional[List[ModpackSummary]], int]:
+        """
+        A provider's first `count` search results, fetched page by page
+
+        Args:
+            api: AsyncModrinthAPI or AsyncCurseForgeAPI
+            query: Search text
+            platform: "modrinth" or "curseforge"
+            count: Number of results needed (fewer if the provider has no more)
+            side_filter: Same as search_modpacks()
+            cache: Results fetched so far per provider for this query and filter
+
+        Returns:
+            Tuple of (results, provider total), or (None, 0) if the first page failed
+        """
+        with self._federated_cache_lock:
+            state = cache.get(platform)
+            results = list(state["results"]) if state else []
+            total = state["total"] if state else 0
+            exhausted = state["exhausted"] if state else False
+
+        batch_size = self.SEARCH_PAGE_SIZE.get(platform, 50)
+        while len(results) < count and not exhausted:
+            requested = min(batch_size, count - len(results))
+            if platform == "curseforge":
+                batch, batch_total = await api.search_modpacks(query, requested, len(results), side_filter == "server")
+            else:
+                batch, batch_total = await api.search_modpacks(query, requested, len(results), side_filter)
+            if batch is None:
+                if not results:
+                    return None, 0
+                break  # Show what we have; the next page retries the rest
+            results.extend(batch)
+            total = max(batch_total, len(results))
+            exhausted = len(batch) < requested or len(results) >= batch_total
+            # Everything seen online refreshes the offline catalog
+            if batch and self.catalog:
+                self.catalog.upsert(batch)
+
+        with self._federated_cache_lock:
+            cached = cache.get(platform)
+            if not cached or len(cached["results"]) < len(results):
+                cache[platform] = {"results": results, "total": total, "exhausted": exhausted}
+        return results[:count], total
+
+    @staticmethod
+    def _search_title_key(title: str) -> str:
+        return re.sub(r'[^a-z0-9]', '', (title or "").lower())
+
+    @classmethod
+    def _search_dedup_keys(cls, modpack: Dict) -> List[str]:
+        """Identities of a pack across providers: slug and title without punctuation"""
+        keys = [f"slug:{(modpack.get('slug') or '').lower()}", f"title:{cls._search_title_key(modpack.get('title'))}"]
+        return [k for k in keys if not k.endswith(":")]
+
+    @classmethod
+    def search_score(cls, position: int, count: int, downloads: int, max_downloads: int) -> float:
+        """
+        Combined ranking score of a search result (0..1)
+
+        Args:
+            position: Index in its provider's result list (provider relevance)
+            count: Number of results that provider returned
+            downloads: Download count
+            max_downloads: Highest download count among all results
+
+        Returns:
+            Score; higher ranks first
+        """
+        relevance = 1.0 - position / max(count, 1)
+        popularity = math.log10(downloads + 1) / math.log10(max_downloads + 1) if max_downloads > 0 else 0.0
+        return cls.SEARCH_RELEVANCE_WEIGHT * relevance + (1 - cls.SEARCH_RELEVANCE_WEIGHT) * popularity
+
+    def _merge_search_results(
+        self,
+        responses: Dict[str, Tuple[List[ModpackSummary], int]],
+        query: str
+    ) -> Tuple[List[ModpackSummary], int]:
+        """Deduplicates and ranks the results of several providers; returns (merged, duplicates)"""
+        max_downloads = max(
+            (mp.get("downloads", 0) for results, _ in responses.values() for mp in results), default=0
+        )
+        query_key = self._search_title_key(query)
+
+        merged: List[Dict] = []
+        scores: List[float] = []
+        index: Dict[str, int] = {}  # dedup key -> position in merged
+        duplicates = 0
+        for platform in self.SEARCH_PROVIDERS:
+            results = responses.get(platform, ([], 0))[0]
+            for position, mp in enumerate(results):
+                score = self.search_score(position, len(results), mp.get("downloads", 0), max_downloads)
+                # An exact title match is what the user typed: keep it on top
+                if query_key and self._search_title_key(mp.get("title")) == query_key:
+                    score += 1.0
+                keys = self._search_dedup_keys(mp)
+                key = next((index[k] for k in keys if k in index), None)
+                # Only merge across providers, never two packs of the same one
+                if key is not None and platform in [merged[key].get("source")] + [
+                    a.get("source") for a in merged[key]["alternates"]
+                ]:
+                    key = None
+                if key is None:
+                    for k in keys:
+                        index.setdefault(k, len(merged))
+                    merged.append(mp.with_alternates([]))
+                    scores.append(score)
+                    continue
+                for k in keys:
+                    index.setdefault(k, key)
+                # Same pack on another provider: keep the more popular copy, remember the other
+                duplicates += 1
+                kept = merged[key]
+                if mp.downloads > kept.downloads:
+                    merged[key] = mp.with_alternates([kept.with_alternates([])] + kept.alternates)
+                else:
+                    kept.alternates.append(mp)
+                scores[key] = max(scores[key], score)
+
+        ranked = sorted(range(len(merged)), key=lambda i: scores[i], reverse=True)
+        return [merged[i] for i in ranked], duplicates
+
+    def get_modpack_details(self, modpack: ModpackSummary) -> Optional[Dict]:
+        """
+        Loads the full project data of a search result (once per result)
+
+        Search results only keep summary fields; call this for the pack the
+        user actually opens.
+
+        Args:
+            modpack: Search result
+
+        Returns:
+            Raw project data (Modrinth project / CurseForge mod), or None on error
+        """
+        if modpack.details is None:
+            if modpack.source == "curseforge":
+                if self.curseforge_api is None:
+                    self.curseforge_api = CurseForgeAPI()
+                modpack.details = self.curseforge_api.get_modpack_info(modpack._curseforge_id)
+            else:
+                modpack.details = self.modrinth_api.get_project_info(modpack.project_id)
+        return modpack.details
+
+    # ==================== LOCAL CATALOG ====================
+
+    @property
+    def catalog(self) -> Optional[ModpackCatalog]:
+        """Offline modpack catalog (None if the database can't be opened)"""
+        if self._catalog is None:
+            try:
+                self._catalog = ModpackCatalog()
+            except Exception as e:
+                print(f"Error opening modpack catalog: {e}")
+                self._catalog = False
+        return self._catalog or None
+
+    def search_catalog(
+        self,
+        query: str,
+        platform: str = "modrinth",
+        limit: int = 10,
+        offset: int = 0,
+        side_filter: str = None
+    ) -> Tuple[List[ModpackSummary], int]:
+        """
+        Searches the local catalog (milliseconds, works offline)
+
+        Args:
+            query: Search text
+            platform: "modrinth", "curseforge" or "all"
+            limit: Maximum number of results per page
+            offset: Number of results to skip (for pagination)
+            side_filter: Same as search_modpacks()
+
+        Returns:
+            Tuple of (list of modpacks, total matches); empty if the catalog is empty
+        """
+        if not self.catalog:
+            return [], 0
+        source = None if platform == "all" else platform
+        return self.catalog.search(query, source, limit, offset, side_filter)
+
+    def sync_catalog(
+        self,
+        platforms: Optional[List[str]] = None,
+        force: bool = False,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> int:
+        """
+        Refreshes the local catalog from the providers
+
+        The first sync stores the CATALOG_SEED_PAGES most downloaded pages.
+        Later syncs walk the "recently updated" listing and stop at the first
+        pack not updated since the previous sync, so they usually cost one
+        request per provider.
+
+        Args:
+            platforms: Providers to sync (default: both)
+            force: Sync even if the last sync is recent
+            log_callback: Function to report progress
+
+        Returns:
+            Number of catalog entries written
+        """
+        if not self.catalog or not self._catalog_sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            written = 0
+            for platform in platforms or self.SEARCH_PROVIDERS:
+                last_sync, newest = self.catalog.get_sync_state(platform)
+                if not force and time.time() - last_sync < self.CATALOG_SYNC_INTERVAL:
+                    continue
+                if platform == "curseforge" and self.curseforge_api is None:
+                    self.curseforge_api = CurseForgeAPI()
+
+                if not last_sync:
+                    seeded = self._sync_catalog_pages(platform, "popular", self.CATALOG_SEED_PAGES)
+                    written += seeded[0] if seeded else 0
+                updated = self._sync_catalog_pages(platform, "updated", self.CATALOG_UPDATE_PAGES, newest)
+                if updated is not None:
+                    written += updated[0]
+                    self.catalog.set_sync_state(platform, updated[1] or newest)
+
+            if log_callback and written:
+                log_callback(f"[OK] Modpack catalog updated ({written} entries)\n")
+            return written
+        finally:
+            self._catalog_sync_lock.release()
+
+    def _sync_catalog_pages(
+        self,
+        platform: str,
+        order: str,
+        max_pages: int,
+        since: str = ""
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Stores listing pages of one provider ("popular" or "updated" order) in the catalog
+
+        Returns:
+            (entries written, newest "updated" value seen), or None if the provider failed
+        """
+        page_size = 100 if platform == "modrinth" else 50
+        written, newest = 0, ""
+        for page in range(max_pages):
+            if platform == "modrinth":
+                index = "downloads" if order == "popular" else "updated"
+                results, total = self.modrinth_api.search_modpacks("", page_size, page * page_size, None, index)
+            else:
+                sort_field = CurseForgeAPI.SORT_POPULARITY if order == "popular" else CurseForgeAPI.SORT_LAST_UPDATED
+                results, total = self.curseforge_api.search_modpacks("", page_size, page * page_size, False, sort_field)
+            if results is None:
+                return None
+            written += self.catalog.upsert(results)
+            newest = max([newest] + [mp.get("updated", "") for mp in results])
+
+            reached_known = since and any(mp.get("updated", "") <= since for mp in results)
+            if not results or reached_known or (page + 1) * page_size >= total:
+                break
+
+        return written, newest
+
+    def start_catalog_sync(self, log_callback: Optional[Callable[[str], None]] = None) -> threading.Thread:
+        """Runs sync_catalog() in a background thread"""
+        thread = threading.Thread(target=self.sync_catalog, kwargs={"log_callback": log_callback}, daemon=True)
+        thread.start()
+        return thread
 
     def get_recommended_ram(self, modpack_manifest: Dict) -> int:
         """
@@ -3,5 +3,26 @@ Server Manager - Gestión de servidores de Minecraft
 """
 
 from .server_manager import ServerManager
+from .console import ConsoleBuffer
+from .server_log import ServerLog, LogStore, LogParser, LogRecord
+from .rcon import RconClient, RconError
+from .status import ServerStatus, ping_server, ping_server_async
+from .supervisor import ProcessSupervisor, SupervisedProcess
+from .properties import default_properties
+from .jvm_flags import build_jvm_args, select_profile, java_major_version
+from .cds import CdsArchive
+from .launch_resolver import LaunchResolver, read_argfile
+from .server_pool import ServerPool, ServerInstance
 
-__all__ = ["ServerManager"]
+__all__ = [
+    "ServerManager", "ConsoleBuffer",
+    "ServerLog", "LogStore", "LogParser", "LogRecord",
+    "RconClient", "RconError",
+    "ServerStatus", "ping_server", "ping_server_async",
+    "ProcessSupervisor", "SupervisedProcess",
+    "default_properties",
+    "build_jvm_args", "select_profile", "java_major_version",
+    "CdsArchive",
+    "LaunchResolver", "read_argfile",
+    "ServerPool", "ServerInstance",
+]
@@ -0,0 +1,138 @@
+"""AppCDS: per-server class data sharing archive (faster JVM startup)"""
+
+import os
+import json
+import shutil
+import hashlib
+from typing import List, Optional
+
+
+class CdsArchive:
+    """
+    Dynamic AppCDS archive of a server's loaded classes
+
+    The first start with CDS enabled is a training run: the JVM records the
+    classes it loads and writes them to an archive when it exits (a normal
+    "stop" is enough). Later starts map that archive instead of parsing and
+    verifying the same classes again.
+
+    The archive is tied to a fingerprint of mods/, libraries/, the server
+    jars and the Java runtime; when any of them changes it is deleted and the
+    next start records a new one. The JVM also checks the archive itself and
+    silently falls back to normal class loading if it can't use it.
+
+    Files live in <server>/.pycraft-cds/ (server.jsa + server.json).
+    """
+
+    FOLDER = ".pycraft-cds"
+    ARCHIVE_NAME = "server.jsa"
+    META_NAME = "server.json"
+    WATCHED_FOLDERS = ("mods", "libraries")
+    MIN_JAVA = 13  # -XX:ArchiveClassesAtExit (dynamic archives)
+    AUTO_CREATE_JAVA = 19  # -XX:+AutoCreateSharedArchive
+    DUMP_TIMEOUT = 60  # Seconds a training run may take to exit while writing the archive
+
+    STATE_TRAINING = "training"
+    STATE_USING = "using"
+
+    def __init__(self, server_folder: str):
+        self.server_folder = server_folder
+        self.folder = os.path.join(server_folder, self.FOLDER)
+        self.archive_path = os.path.join(self.folder, self.ARCHIVE_NAME)
+        self.meta_path = os.path.join(self.folder, self.META_NAME)
+        self.state: Optional[str] = None  # STATE_TRAINING / STATE_USING after prepare()
+
+    def fingerprint(self, java_executable: str) -> str:
+        """Hash of everything that makes an archive stale (jars and Java runtime)"""
+        digest = hashlib.sha256()
+
+        java_path = os.path.realpath(shutil.which(java_executable) or java_executable)
+        digest.update(java_path.encode("utf-8"))
+        # The runtime image changes with every Java update
+        java_home = os.path.dirname(os.path.dirname(java_path))
+        for runtime_file in (java_path, os.path.join(java_home, "lib", "modules")):
+            try:
+                stat = os.stat(runtime_file)
+                digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+            except OSError:
+                pass
+
+        entries = []
+        for name in os.listdir(self.server_folder):
+            if name.endswith(".jar"):
+                entries.append(os.path.join(self.server_folder, name))
+        for folder in self.WATCHED_FOLDERS:
+            for root, dirs, files in os.walk(os.path.join(self.server_folder, folder)):
+                entries.extend(os.path.join(root, f) for f in files if f.endswith((".jar", ".txt")))
+
+        for path in sorted(entries):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, self.server_folder).replace(os.sep, "/")
+            digest.update(f"{rel}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _read_meta(self) -> dict:
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_valid(self, java_executable: str) -> bool:
+        """True if the archive exists and matches the current jars and runtime"""
+        if not os.path.exists(self.archive_path):
+            return False
+        return self._read_meta().get("fingerprint") == self.fingerprint(java_executable)
+
+    def clear(self):
+        """Deletes the archive (the next start records a new one)"""
+        for path in (self.archive_path, self.meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error removing CDS archive: {e}")
+
+    def prepare(self, java_executable: str, java_major: Optional[int]) -> List[str]:
+        """
+        JVM flags for the next launch, invalidating a stale archive first
+
+        Args:
+            java_executable: Java used for the launch
+            java_major: Its major version
+
+        Returns:
+            Flags to add (empty if this Java can't create dynamic archives)
+        """
+        self.state = None
+        if java_major is None or java_major < self.MIN_JAVA:
+            return []
+
+        fingerprint = self.fingerprint(java_executable)
+        meta = self._read_meta()
+        if meta.get("fingerprint") != fingerprint:
+            self.clear()
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                with open(self.meta_path, 'w', encoding='utf-8') as f:
+                    json.dump({"fingerprint": fingerprint, "java": java_executable, "java_major": java_major}, f, indent=2)
+            except OSError as e:
+                print(f"Error preparing CDS archive: {e}")
+                return []
+
+        self.state = self.STATE_USING if os.path.exists(self.archive_path) else self.STATE_TRAINING
+        # Relative to the server's working directory: these flags also go into
+        # user_jvm_args.txt, where a path with spaces would split into two arguments
+        archive = f"{self.FOLDER}/{self.ARCHIVE_NAME}"
+        # Mismatch warnings would end up in the server console
+        flags = ["-Xshare:auto", "-Xlog:cds*=off"]
+        if java_major >= self.AUTO_CREATE_JAVA:
+            # The JVM writes the archive at exit when it's missing or unusable
+            return flags + ["-XX:+AutoCreateSharedArchive", f"-XX:SharedArchiveFile={archive}"]
+        if self.state == self.STATE_USING:
+            return flags + [f"-XX:SharedArchiveFile={archive}"]
+        return flags + [f"-XX:ArchiveClassesAtExit={archive}"]
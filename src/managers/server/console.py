@@ -0,0 +1,92 @@
+"""Batched server console: ring buffer between stdout readers and log consumers"""
+
+import time
+import threading
+from collections import deque
+from typing import Callable, List, Tuple
+
+
+class ConsoleBuffer:
+    """
+    Bounded ring buffer that delivers console lines in batches
+
+    The stdout reader only appends to the buffer (never blocks on the UI).
+    A flusher thread hands everything buffered to the callback at most once
+    per interval (30 times per second by default), as one string. If the
+    consumer falls behind, the oldest lines are dropped and a single
+    "[N lines skipped]" marker is delivered instead, so a server printing
+    thousands of lines per second costs the UI one update per frame.
+    """
+
+    DEFAULT_MAX_LINES = 5000
+    DEFAULT_INTERVAL = 1 / 30
+
+    def __init__(
+        self,
+        callback: Callable[[str], None],
+        max_lines: int = DEFAULT_MAX_LINES,
+        interval: float = DEFAULT_INTERVAL
+    ):
+        self.callback = callback
+        self.interval = interval
+        self._lines = deque(maxlen=max_lines)
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._has_data = threading.Event()
+        self._closed = threading.Event()
+        self._thread = None
+
+    def push(self, line: str):
+        """Adds a line (drops the oldest one when full)"""
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+            self._lines.append(line)
+        self._has_data.set()
+
+    def drain(self) -> Tuple[List[str], int]:
+        """Takes everything buffered; returns (lines, lines dropped since the last drain)"""
+        with self._lock:
+            lines = list(self._lines)
+            self._lines.clear()
+            dropped, self._dropped = self._dropped, 0
+            self._has_data.clear()
+        return lines, dropped
+
+    def flush(self):
+        """Delivers the buffered lines now (on the calling thread)"""
+        lines, dropped = self.drain()
+        if not lines and not dropped:
+            return
+        text = "".join(lines)
+        if dropped:
+            text = f"[{dropped} lines skipped]\n{text}"
+        try:
+            self.callback(text)
+        except Exception:
+            pass
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._has_data.wait()
+            started = time.monotonic()
+            self.flush()
+            # Frame-rate limit: lines arriving meanwhile go into the next batch
+            remaining = self.interval - (time.monotonic() - started)
+            if remaining > 0:
+                self._closed.wait(remaining)
+
+    def start(self) -> "ConsoleBuffer":
+        """Starts the flusher thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stops the flusher and delivers what is left"""
+        self._closed.set()
+        self._has_data.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self.flush()
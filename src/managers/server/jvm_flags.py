@@ -0,0 +1,180 @@
+"""JVM flag profiles for Minecraft servers (GC tuning chosen per Java version and heap size)"""
+
+import os
+import re
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_AUTO = "auto"
+PROFILE_AIKAR = "aikar"
+PROFILE_ZGC = "zgc"
+PROFILE_SHENANDOAH = "shenandoah"
+PROFILE_LOW_MEMORY = "low-memory"
+PROFILE_NONE = "none"
+
+PROFILES = {
+    PROFILE_AIKAR: "G1 with Aikar's flags (recommended for most servers)",
+    PROFILE_ZGC: "Generational ZGC, very short pauses for large heaps (Java 21+)",
+    PROFILE_SHENANDOAH: "Shenandoah, low-pause GC (Java 17+ builds that include it)",
+    PROFILE_LOW_MEMORY: "G1 tuned for small heaps (under 4 GB)",
+    PROFILE_NONE: "No GC tuning, JVM defaults",
+}
+
+LOW_MEMORY_MB = 4096     # Below this, auto picks the low-memory profile
+LARGE_HEAP_MB = 12288    # Aikar's larger-heap G1 values from here on
+ZGC_HEAP_MB = 16384      # With Java 21+, auto picks ZGC from here on
+
+GC_SELECTION = re.compile(r'-XX:\+Use\w*GC\b')
+
+
+def _aikar_flags(java_major: Optional[int], ram_mb: int) -> List[str]:
+    large = ram_mb >= LARGE_HEAP_MB
+    flags = [
+        "-XX:+UseG1GC",
+        "-XX:+ParallelRefProcEnabled",
+        "-XX:MaxGCPauseMillis=200",
+        "-XX:+UnlockExperimentalVMOptions",
+        "-XX:+DisableExplicitGC",
+        "-XX:+AlwaysPreTouch",
+        f"-XX:G1NewSizePercent={40 if large else 30}",
+        f"-XX:G1MaxNewSizePercent={50 if large else 40}",
+        f"-XX:G1HeapRegionSize={16 if large else 8}M",
+        f"-XX:G1ReservePercent={15 if large else 20}",
+        "-XX:G1HeapWastePercent=5",
+        "-XX:G1MixedGCCountTarget=4",
+        f"-XX:InitiatingHeapOccupancyPercent={20 if large else 15}",
+        "-XX:G1MixedGCLiveThresholdPercent=90",
+        "-XX:SurvivorRatio=32",
+        "-XX:+PerfDisableSharedMem",
+        "-XX:MaxTenuringThreshold=1",
+    ]
+    if java_major is None or java_major < 20:
+        # Obsolete (ignored with a warning) since Java 20
+        flags.insert(-3, "-XX:G1RSetUpdatingPauseTimePercent=5")
+    return flags + ["-Dusing.aikars.flags=https://mcflags.emc.gs", "-Daikars.new.flags=true"]
+
+
+def profile_flags(profile: str, java_major: Optional[int], ram_mb: int) -> List[str]:
+    """
+    Returns the GC flags of a profile
+
+    Args:
+        profile: One of PROFILES (PROFILE_AUTO is resolved with select_profile)
+        java_major: Java major version (None if unknown)
+        ram_mb: Heap size in MB
+
+    Returns:
+        JVM flags (without heap size)
+    """
+    if profile == PROFILE_AUTO:
+        profile = select_profile(java_major, ram_mb)
+
+    if profile == PROFILE_AIKAR:
+        return _aikar_flags(java_major, ram_mb)
+    if profile == PROFILE_ZGC:
+        flags = ["-XX:+UseZGC"]
+        # Generational mode is opt-in on 21-22 and the only mode from 23 on
+        if java_major in (21, 22):
+            flags.append("-XX:+ZGenerational")
+        return flags + ["-XX:+AlwaysPreTouch", "-XX:+DisableExplicitGC", "-XX:+PerfDisableSharedMem"]
+    if profile == PROFILE_SHENANDOAH:
+        return ["-XX:+UseShenandoahGC", "-XX:+AlwaysPreTouch", "-XX:+DisableExplicitGC", "-XX:+PerfDisableSharedMem"]
+    if profile == PROFILE_LOW_MEMORY:
+        return [
+            "-XX:+UseG1GC",
+            "-XX:MaxGCPauseMillis=200",
+            "-XX:+ParallelRefProcEnabled",
+            "-XX:+DisableExplicitGC",
+            "-XX:+UseStringDeduplication",
+            "-XX:+PerfDisableSharedMem",
+        ]
+    return []
+
+
+def select_profile(java_major: Optional[int], ram_mb: int) -> str:
+    """Picks a profile for the Java version and heap size"""
+    if ram_mb < LOW_MEMORY_MB:
+        return PROFILE_LOW_MEMORY
+    if java_major is not None and java_major >= 21 and ram_mb >= ZGC_HEAP_MB:
+        return PROFILE_ZGC
+    return PROFILE_AIKAR
+
+
+def build_jvm_args(
+    ram_mb: int,
+    java_major: Optional[int] = None,
+    profile: str = PROFILE_AUTO,
+    extra_args: Optional[List[str]] = None,
+    include_gc: bool = True
+) -> List[str]:
+    """
+    Full list of JVM flags for a server launch
+
+    Heap size and headless mode always come first, then the profile's GC
+    flags, then extra_args. If extra_args (or the caller, via include_gc)
+    already select a garbage collector, the profile's GC flags are left out
+    so the JVM doesn't refuse to start with two collectors.
+
+    Args:
+        ram_mb: Heap size in MB (-Xms and -Xmx)
+        java_major: Java major version (None if unknown)
+        profile: Profile name or PROFILE_AUTO
+        extra_args: Per-server flags added last
+        include_gc: False to leave out GC tuning (flags chosen elsewhere)
+
+    Returns:
+        JVM flags, without the java executable or main class/jar
+    """
+    extra_args = list(extra_args or [])
+    args = [f"-Xms{ram_mb}M", f"-Xmx{ram_mb}M", "-Djava.awt.headless=true"]
+    if include_gc and not any(GC_SELECTION.search(arg) for arg in extra_args):
+        args.extend(profile_flags(profile, java_major, ram_mb))
+    return args + extra_args
+
+
+_java_versions: Dict[Tuple[str, float], Optional[int]] = {}
+_java_versions_lock = threading.Lock()
+
+
+def java_major_version(java_executable: str) -> Optional[int]:
+    """
+    Major version of a Java executable (cached per executable)
+
+    PyCraft's own runtimes are recognized from their folder name
+    (~/.pycraft/java/java-21/...); anything else runs `java -version` once.
+
+    Returns:
+        Major version (8, 17, 21...) or None if it can't be determined
+    """
+    match = re.search(r'[\\/]java-(\d+)[\\/]', java_executable)
+    if match:
+        return int(match.group(1))
+
+    try:
+        key = (java_executable, os.path.getmtime(java_executable) if os.path.isabs(java_executable) else 0.0)
+    except OSError:
+        key = (java_executable, 0.0)
+    with _java_versions_lock:
+        if key in _java_versions:
+            return _java_versions[key]
+
+    major = None
+    try:
+        creation_flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        result = subprocess.run(
+            [java_executable, "-version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            creationflags=creation_flags
+        )
+        match = re.search(r'version "(\d+)(?:\.(\d+))?', result.stderr)
+        if match:
+            major = int(match.group(2)) if match.group(1) == "1" else int(match.group(1))
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+    with _java_versions_lock:
+        _java_versions[key] = major
+    return major
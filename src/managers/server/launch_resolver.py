@@ -0,0 +1,239 @@
+"""Resolves Forge/NeoForge run scripts and argument files into a direct Java command line"""
+
+import os
+import re
+import json
+import shlex
+from typing import Dict, List, Optional, Tuple
+
+USER_JVM_ARGS = "user_jvm_args.txt"
+JAVA_NAMES = ("java", "java.exe", "javaw", "javaw.exe")
+# $JAVA, ${JAVA_PATH}, %JAVA%, "%JAVA_HOME%\bin\java.exe"...
+JAVA_VARIABLE = re.compile(r'^(?:\$\{?\w*JAVA\w*\}?|%\w*JAVA\w*%)(?:[\\/].*)?$', re.IGNORECASE)
+PASSTHROUGH = ("$@", "$*", "%*")  # Arguments forwarded by the script
+HEAP_FLAG = re.compile(r'^-Xm[sx]\d+[KkMmGg]?$')
+
+
+def read_argfile(path: str) -> List[str]:
+    """
+    Reads a JDK @argfile into arguments
+
+    Same rules as the java launcher: whitespace separates arguments, single
+    or double quotes group them (with backslash escapes and line
+    continuation inside quotes), and # starts a comment outside an argument.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    args, current, quote, in_arg, i = [], [], None, False, 0
+    while i < len(text):
+        c = text[i]
+        if quote:
+            if c == quote:
+                quote = None
+            elif c == '\\' and i + 1 < len(text):
+                i += 1
+                escaped = text[i]
+                if escaped in '\r\n':
+                    # Continuation: skip the line break and the next line's indentation
+                    while i + 1 < len(text) and text[i + 1] in ' \t\r\n':
+                        i += 1
+                else:
+                    current.append({'n': '\n', 't': '\t', 'r': '\r', 'f': '\f'}.get(escaped, escaped))
+            else:
+                current.append(c)
+        elif c in '"\'':
+            quote, in_arg = c, True
+        elif c == '#' and not in_arg:
+            while i < len(text) and text[i] not in '\r\n':
+                i += 1
+        elif c.isspace():
+            if in_arg:
+                args.append("".join(current))
+                current, in_arg = [], False
+        else:
+            current.append(c)
+            in_arg = True
+        i += 1
+    if in_arg:
+        args.append("".join(current))
+    return args
+
+
+def _split_batch_line(line: str) -> List[str]:
+    """Splits a cmd.exe command line (double quotes only, no escapes)"""
+    return [part.replace('"', '') for part in re.findall(r'(?:"[^"]*"|[^\s"])+', line)]
+
+
+def parse_run_script(script_path: str) -> Optional[List[str]]:
+    """
+    Finds the Java invocation in a run script and returns its arguments
+
+    Only plain scripts are understood (like the run.sh/run.bat the Forge and
+    NeoForge installers write): exactly one line that runs java or a
+    $JAVA/%JAVA% variable, whose other arguments don't depend on variables.
+
+    Returns:
+        Arguments after the java executable (argfile references kept as
+        @path), or None if the script can't be resolved safely
+    """
+    batch = script_path.lower().endswith((".bat", ".cmd"))
+    try:
+        with open(script_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    # Join continued lines (\ in sh, ^ in cmd)
+    content = re.sub(r'\^\r?\n' if batch else r'\\\r?\n', ' ', content)
+
+    invocations = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or line.lower().startswith(('rem ', '::', '@echo')):
+            continue
+        try:
+            tokens = _split_batch_line(line) if batch else shlex.split(line, comments=True)
+        except ValueError:
+            return None
+        if tokens and tokens[0] in ("exec", "@call", "call"):
+            tokens = tokens[1:]
+        if not tokens:
+            continue
+        program = tokens[0].replace('%~dp0', '')
+        if os.path.basename(program.replace('\\', '/')).lower() in JAVA_NAMES or JAVA_VARIABLE.match(program):
+            invocations.append(tokens[1:])
+
+    if len(invocations) != 1:
+        return None
+
+    args = []
+    for token in invocations[0]:
+        if token in PASSTHROUGH:
+            continue
+        token = token.replace('%~dp0', '')
+        if '$' in token or '%' in token or token in ('&&', '||', '|', ';', '>', '<'):
+            return None
+        args.append(token)
+    return args
+
+
+class LaunchResolver:
+    """
+    Turns a server's run script into the arguments of a direct Java launch
+
+    Running java directly (instead of bash/cmd running the script) means one
+    process to supervise and stop, no script-side Java detection and full
+    control over JVM flags. Argument files from libraries/ are expanded
+    once and cached in <server>/.pycraft-launch.json until the script or
+    the files change; user_jvm_args.txt stays an @reference because PyCraft
+    rewrites it on every start.
+    """
+
+    CACHE_NAME = ".pycraft-launch.json"
+
+    def __init__(self, server_folder: str):
+        self.server_folder = server_folder
+        self.cache_path = os.path.join(server_folder, self.CACHE_NAME)
+        self._cache: Optional[Dict] = None
+
+    def _stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def _path(self, reference: str) -> str:
+        return os.path.normpath(os.path.join(self.server_folder, reference))
+
+    def _load_cache(self) -> Dict:
+        if self._cache is None:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self):
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, indent=2)
+        except OSError as e:
+            print(f"Error saving launch cache: {e}")
+
+    def _cached(self, key: str) -> Optional[List[str]]:
+        """Cached arguments, if none of the files they came from changed"""
+        entry = self._load_cache().get(key)
+        if not entry:
+            return None
+        for path, stamp in entry["stamps"].items():
+            if self._stamp(self._path(path)) != tuple(stamp):
+                return None
+        return entry["args"]
+
+    def _store(self, key: str, files: List[str], args: List[str]):
+        stamps = {}
+        for path in files:
+            stamp = self._stamp(self._path(path))
+            if stamp is None:
+                return
+            stamps[path] = list(stamp)
+        self._load_cache()[key] = {"stamps": stamps, "args": args}
+        self._save_cache()
+
+    def expand(self, args: List[str]) -> Tuple[List[str], List[str]]:
+        """Expands @argfiles except user_jvm_args.txt; returns (args, files read)"""
+        expanded, files = [], []
+        for arg in args:
+            if arg.startswith('@') and os.path.basename(arg[1:]) != USER_JVM_ARGS:
+                reference = os.path.relpath(self._path(arg[1:]), self.server_folder)
+                expanded.extend(read_argfile(self._path(reference)))
+                files.append(reference)
+            else:
+                expanded.append(arg)
+        return expanded, files
+
+    def resolve_script(self, script_path: str) -> Optional[List[str]]:
+        """
+        Java arguments equivalent to running a script (cached)
+
+        Heap sizes set in the script itself are dropped (PyCraft sets them).
+
+        Returns:
+            Arguments after the java executable, or None if the script
+            can't be resolved (the caller then runs the script itself)
+        """
+        key = os.path.relpath(script_path, self.server_folder)
+        args = self._cached(key)
+        if args is not None:
+            return args
+
+        args = parse_run_script(script_path)
+        if args is None:
+            return None
+        try:
+            args, files = self.expand(args)
+        except OSError:
+            return None
+        args = [arg for arg in args if not HEAP_FLAG.match(arg)]
+        self._store(key, [key] + files, args)
+        return args
+
+    def resolve_argfile(self, args_file_path: str) -> Optional[List[str]]:
+        """Contents of a libraries/ argument file (win_args.txt/unix_args.txt), cached"""
+        key = os.path.relpath(args_file_path, self.server_folder)
+        args = self._cached(key)
+        if args is not None:
+            return args
+        try:
+            args = read_argfile(args_file_path)
+        except OSError:
+            return None
+        self._store(key, [key], args)
+        return args
+
+    def uses_user_jvm_args(self, args: List[str]) -> bool:
+        """True if the arguments read user_jvm_args.txt (which then carries the JVM flags)"""
+        return any(arg.startswith('@') and os.path.basename(arg[1:]) == USER_JVM_ARGS for arg in args)
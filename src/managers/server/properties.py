@@ -0,0 +1,135 @@
+"""Default server.properties per Minecraft version, as the server's first run writes it"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+# (key, default value, first version with it, first version without it)
+# Several rows per key when the default changed between versions.
+PROPERTY_TABLE = (
+    ("accepts-transfers", "false", "1.20.5", None),
+    ("allow-flight", "false", None, None),
+    ("allow-nether", "true", None, None),
+    ("announce-player-achievements", "true", None, "1.12"),
+    ("broadcast-console-to-ops", "true", "1.14", None),
+    ("broadcast-rcon-to-ops", "true", "1.14", None),
+    ("bug-report-link", "", "1.21", None),
+    ("difficulty", "1", None, "1.14"),
+    ("difficulty", "easy", "1.14", None),
+    ("enable-command-block", "false", None, None),
+    ("enable-jmx-monitoring", "false", "1.16", None),
+    ("enable-query", "false", None, None),
+    ("enable-rcon", "false", None, None),
+    ("enable-status", "true", "1.16", None),
+    ("enforce-secure-profile", "true", "1.19", None),
+    ("enforce-whitelist", "false", "1.13", None),
+    ("entity-broadcast-range-percentage", "100", "1.16", None),
+    ("force-gamemode", "false", None, None),
+    ("function-permission-level", "2", "1.14", None),
+    ("gamemode", "0", None, "1.14"),
+    ("gamemode", "survival", "1.14", None),
+    ("generate-structures", "true", None, None),
+    ("generator-settings", "", None, "1.19"),
+    ("generator-settings", "{}", "1.19", None),
+    ("hardcore", "false", None, None),
+    ("hide-online-players", "false", "1.18", None),
+    ("initial-disabled-packs", "", "1.19.3", None),
+    ("initial-enabled-packs", "vanilla", "1.19.3", None),
+    ("level-name", "world", None, None),
+    ("level-seed", "", None, None),
+    ("level-type", "DEFAULT", None, "1.19"),
+    ("level-type", "minecraft\\:normal", "1.19", None),
+    ("log-ips", "true", "1.20.2", None),
+    ("max-build-height", "256", None, "1.17"),
+    ("max-chained-neighbor-updates", "1000000", "1.19", None),
+    ("max-players", "20", None, None),
+    ("max-tick-time", "60000", "1.8", None),
+    ("max-world-size", "29999984", "1.8", None),
+    ("motd", "A Minecraft Server", None, None),
+    ("network-compression-threshold", "256", "1.8", None),
+    ("online-mode", "true", None, None),
+    ("op-permission-level", "4", None, None),
+    ("pause-when-empty-seconds", "60", "1.21.2", None),
+    ("player-idle-timeout", "0", None, None),
+    ("prevent-proxy-connections", "false", "1.11", None),
+    ("previews-chat", "false", "1.19", "1.19.3"),
+    ("pvp", "true", None, None),
+    ("query.port", "25565", None, None),
+    ("rate-limit", "0", "1.16.2", None),
+    ("rcon.password", "", None, None),
+    ("rcon.port", "25575", None, None),
+    ("region-file-compression", "deflate", "1.20.5", None),
+    ("require-resource-pack", "false", "1.17", None),
+    ("resource-pack", "", None, None),
+    ("resource-pack-id", "", "1.20.3", None),
+    ("resource-pack-prompt", "", "1.17", None),
+    ("resource-pack-sha1", "", None, None),
+    ("server-ip", "", None, None),
+    ("server-port", "25565", None, None),
+    ("simulation-distance", "10", "1.18", None),
+    ("snooper-enabled", "true", None, "1.18"),
+    ("spawn-animals", "true", None, "1.21.2"),
+    ("spawn-monsters", "true", None, None),
+    ("spawn-npcs", "true", None, "1.21.2"),
+    ("spawn-protection", "16", None, None),
+    ("sync-chunk-writes", "true", "1.16", None),
+    ("text-filtering-config", "", "1.16.4", None),
+    ("use-native-transport", "true", "1.8", None),
+    ("view-distance", "10", None, None),
+    ("white-list", "false", None, None),
+)
+
+# PyCraft's own defaults on top of vanilla's (LAN/Hamachi play without Mojang auth)
+PYCRAFT_DEFAULTS = {
+    "online-mode": "false",
+    "enforce-secure-profile": "false",
+    "difficulty": "normal",
+}
+
+# Lists the server creates (empty) on its first start
+EMPTY_JSON_FILES = ("ops.json", "whitelist.json", "banned-players.json", "banned-ips.json", "usercache.json")
+
+
+def _version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r'\d+', version)[:3])
+
+
+def default_properties(minecraft_version: Optional[str] = None) -> Dict[str, str]:
+    """
+    Returns the server.properties defaults for a Minecraft version
+
+    Keys the server doesn't know are dropped and missing ones added the next
+    time it saves the file, so an unknown version just gets the newest set.
+
+    Args:
+        minecraft_version: e.g. "1.20.1" (None = newest)
+
+    Returns:
+        Dict of property -> value, sorted like the server writes them
+    """
+    version = _version_key(minecraft_version) if minecraft_version else None
+    properties = {}
+    for key, value, since, until in PROPERTY_TABLE:
+        if version is not None:
+            if since and version < _version_key(since):
+                continue
+            if until and version >= _version_key(until):
+                continue
+        elif until:
+            continue
+        properties[key] = value
+
+    # Servers before 1.14 store difficulty as a number
+    numeric_difficulty = properties.get("difficulty", "").isdigit()
+    for key, value in PYCRAFT_DEFAULTS.items():
+        if key in properties:
+            properties[key] = value
+    if numeric_difficulty:
+        properties["difficulty"] = "2"
+    return dict(sorted(properties.items()))
+
+
+def render_properties(properties: Dict[str, str]) -> str:
+    """Formats properties as a server.properties file"""
+    lines = ["#Minecraft server properties", "#Generated by PyCraft"]
+    lines.extend(f"{key}={value}" for key, value in properties.items())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,177 @@
+"""Minecraft RCON client (Source RCON protocol over TCP)"""
+
+import socket
+import struct
+import threading
+from typing import List, Optional
+
+
+class RconError(Exception):
+    """Connection, authentication or protocol failure"""
+
+
+class RconClient:
+    """
+    Persistent RCON connection to a Minecraft server
+
+    One TCP connection is opened and authenticated once, then reused for
+    every command. Requests go out one packet at a time: vanilla's handler
+    (also used by Forge and Fabric) reads each packet with a single socket
+    read and drops the connection if it gets more or less than one packet.
+
+    Replies longer than one packet arrive as several packets with the same
+    ID. To find the end, a sentinel packet of an unknown type is sent once
+    the first reply packet has arrived; the server answers it after the
+    rest of the reply.
+
+    Thread-safe: callers share the connection behind a lock.
+    """
+
+    TYPE_RESPONSE = 0
+    TYPE_COMMAND = 2
+    TYPE_AUTH = 3
+    TYPE_SENTINEL = 100  # Unknown type: the server echoes its ID back
+
+    MAX_PAYLOAD = 1446  # Largest command body vanilla servers accept
+
+    def __init__(self, host: str, port: int, password: str, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b""
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    # ==================== PROTOCOL ====================
+
+    def _request_id(self) -> int:
+        request_id = self._next_id
+        self._next_id = self._next_id + 1 if self._next_id < 0x7FFFFFFF else 1
+        return request_id
+
+    @staticmethod
+    def _packet(request_id: int, packet_type: int, body: str) -> bytes:
+        payload = struct.pack("<ii", request_id, packet_type) + body.encode("utf-8") + b"\x00\x00"
+        return struct.pack("<i", len(payload)) + payload
+
+    def _recv_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            chunk = self._sock.recv(max(4096, size - len(self._buffer)))
+            if not chunk:
+                raise RconError("Connection closed by server")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _read_packet(self):
+        """Returns (request id, type, body)"""
+        (length,) = struct.unpack("<i", self._recv_exact(4))
+        if length < 10:
+            raise RconError(f"Malformed packet (length {length})")
+        data = self._recv_exact(length)
+        request_id, packet_type = struct.unpack("<ii", data[:8])
+        return request_id, packet_type, data[8:-2].decode("utf-8", errors="replace")
+
+    # ==================== CONNECTION ====================
+
+    def connect(self):
+        """Opens and authenticates the connection (no-op if already open)"""
+        if self._sock is not None:
+            return
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            raise RconError(f"Could not connect to {self.host}:{self.port}: {e}")
+
+        self._sock, self._buffer = sock, b""
+        try:
+            auth_id = self._request_id()
+            self._sock.sendall(self._packet(auth_id, self.TYPE_AUTH, self.password))
+            while True:
+                request_id, packet_type, _ = self._read_packet()
+                if request_id == -1:
+                    raise RconError("Authentication failed (wrong rcon.password)")
+                # Some servers send an empty response packet before the auth reply
+                if request_id == auth_id and packet_type == self.TYPE_COMMAND:
+                    break
+        except (OSError, struct.error, RconError) as e:
+            self._close_socket()
+            raise e if isinstance(e, RconError) else RconError(str(e))
+
+    def _close_socket(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock, self._buffer = None, b""
+
+    def close(self):
+        with self._lock:
+            self._close_socket()
+
+    # ==================== COMMANDS ====================
+
+    def _run(self, command: str) -> str:
+        """Sends one command and collects its (possibly multi-packet) reply"""
+        request_id = self._request_id()
+        self._sock.sendall(self._packet(request_id, self.TYPE_COMMAND, command))
+
+        parts: List[str] = []
+        sentinel = None
+        while True:
+            reply_id, _, body = self._read_packet()
+            if sentinel is not None and reply_id == sentinel:
+                return "".join(parts)
+            if reply_id != request_id:
+                continue
+            parts.append(body)
+            if sentinel is None:
+                # Only now, so the server never sees two packets in one read
+                sentinel = self._request_id()
+                self._sock.sendall(self._packet(sentinel, self.TYPE_SENTINEL, ""))
+
+    def command(self, command: str) -> str:
+        """Runs one command and returns the server's reply"""
+        return self.commands([command])[0]
+
+    def commands(self, commands: List[str]) -> List[str]:
+        """
+        Runs several commands over the shared connection, one after another
+
+        Args:
+            commands: Commands without the leading "/"
+
+        Returns:
+            Replies in the same order (color codes stripped)
+
+        Raises:
+            RconError: On connection/protocol errors (the connection is dropped,
+                so the next call reconnects)
+        """
+        for command in commands:
+            if len(command.encode("utf-8")) > self.MAX_PAYLOAD:
+                raise RconError(f"Command too long for RCON: {command[:40]}...")
+
+        with self._lock:
+            try:
+                self.connect()
+                replies = [self._run(command) for command in commands]
+            except (OSError, struct.error, RconError) as e:
+                self._close_socket()
+                raise e if isinstance(e, RconError) else RconError(str(e))
+
+        return [self.strip_formatting(reply) for reply in replies]
+
+    @staticmethod
+    def strip_formatting(text: str) -> str:
+        """Removes § color/format codes from a reply"""
+        parts = text.split("§")
+        return parts[0] + "".join(part[1:] for part in parts[1:])
@@ -0,0 +1,290 @@
+"""Structured server log: line parser, append-only store and startup/crash tracking"""
+
+import re
+import json
+import time
+import bisect
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class LogRecord:
+    """One parsed console line"""
+
+    __slots__ = ("seq", "received", "time", "thread", "level", "logger", "message")
+
+    def __init__(
+        self,
+        seq: int,
+        received: float,
+        time: str,
+        thread: str,
+        level: str,
+        logger: str,
+        message: str
+    ):
+        self.seq = seq
+        self.received = received  # Epoch seconds when PyCraft read the line
+        self.time = time          # Timestamp as printed by the server
+        self.thread = thread
+        self.level = level
+        self.logger = logger
+        self.message = message
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"LogRecord({self.seq} {self.level} [{self.thread}] {self.message[:60]!r})"
+
+
+class LogParser:
+    """
+    Turns server console lines into LogRecords
+
+    Understands the log4j layouts used by:
+        vanilla / Paper    [12:34:56] [Server thread/INFO]: message
+        Paper / Spigot     [12:34:56 INFO]: message
+        Fabric / Quilt     [12:34:56] [Server thread/INFO] (Minecraft) message
+        Forge / NeoForge   [12Mar2024 12:34:56.789] [main/INFO] [net.minecraft.server.Main/]: message
+                           [12:34:56] [Server thread/INFO] [minecraft/DedicatedServer]: message
+
+    ANSI color codes (Paper and some wrappers color the console) are
+    stripped first. Lines that match no layout (stack traces, wrapper script
+    output) keep the level of the previous record when they look like a
+    continuation, and get level "RAW" otherwise.
+    """
+
+    LINE = re.compile(
+        r'^\[(?P<time>[^\]]+)\] '
+        r'\[(?P<thread>[^\]]*?)/(?P<level>[A-Z]+)\]'
+        r'(?: \[(?P<logger>[^\]]*)\]:| \((?P<logger2>[^)]*)\)|:)'
+        r' ?(?P<message>.*)$'
+    )
+    SHORT_LINE = re.compile(r'^\[(?P<time>\d{1,2}:\d{2}:\d{2}) (?P<level>[A-Z]+)\]: ?(?P<message>.*)$')
+    ANSI = re.compile(r'\x1b\[[0-9;?]*[ -/]*[@-~]')
+    CONTINUATION = re.compile(r'^(?:\s+|\tat |Caused by:|\.\.\. \d+ more|[\w.$]+(?:Exception|Error)\b)')
+
+    def __init__(self):
+        self._last_level = "INFO"
+        self._last_thread = ""
+        self._last_logger = ""
+
+    def parse(self, line: str, seq: int = 0, received: Optional[float] = None) -> LogRecord:
+        line = self.ANSI.sub("", line.rstrip("\r\n"))
+        received = received if received is not None else time.time()
+        match = self.LINE.match(line) or self.SHORT_LINE.match(line)
+        if match:
+            fields = match.groupdict()
+            logger = fields.get("logger") or fields.get("logger2") or ""
+            record = LogRecord(
+                seq, received, fields["time"], fields.get("thread") or "",
+                fields["level"], logger.rstrip("/"), fields["message"]
+            )
+            self._last_level, self._last_thread, self._last_logger = record.level, record.thread, record.logger
+            return record
+
+        if self.CONTINUATION.match(line):
+            return LogRecord(seq, received, "", self._last_thread, self._last_level, self._last_logger, line)
+        return LogRecord(seq, received, "", "", "RAW", "", line)
+
+
+class LogStore:
+    """
+    Append-only record store with an in-memory index
+
+    Records are appended to a JSON-lines file; memory only holds each
+    record's file offset, its receive time (for time-range lookups with
+    bisect) and per-level lists of record numbers, so error filtering reads
+    just the matching lines back from disk.
+    """
+
+    MAX_BYTES = 32 * 1024 * 1024  # Rotated to <name>.1 when a new store opens past this
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if self.path.stat().st_size > self.MAX_BYTES:
+                self.path.replace(self.path.with_name(self.path.name + ".1"))
+        except OSError:
+            pass
+        self._file = open(self.path, 'a+b')
+        self._lock = threading.Lock()
+        self._offsets: List[int] = []
+        self._times: List[float] = []
+        self._by_level: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, record: LogRecord) -> int:
+        """Stores a record; returns its number in this store"""
+        data = (json.dumps(record.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            self._file.seek(0, 2)
+            offset = self._file.tell()
+            self._file.write(data)
+            number = len(self._offsets)
+            self._offsets.append(offset)
+            self._times.append(record.received)
+            self._by_level.setdefault(record.level, []).append(number)
+        return number
+
+    def count(self, level: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._by_level.get(level, ())) if level else len(self._offsets)
+
+    def _read(self, number: int) -> LogRecord:
+        self._file.seek(self._offsets[number])
+        data = json.loads(self._file.readline().decode("utf-8"))
+        return LogRecord(**data)
+
+    def read_range(self, start: int, end: Optional[int] = None) -> List[LogRecord]:
+        """Returns records number start..end-1, oldest first"""
+        with self._lock:
+            self._file.flush()
+            end = len(self._offsets) if end is None else min(end, len(self._offsets))
+            return [self._read(n) for n in range(max(start, 0), end)]
+
+    def query(
+        self,
+        levels: Optional[List[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[LogRecord]:
+        """
+        Returns stored records, oldest first
+
+        Args:
+            levels: Only these levels (e.g. ["ERROR", "FATAL"])
+            since: Only records received at or after this epoch time
+            until: Only records received before this epoch time
+            limit: Keep only the newest `limit` matches
+
+        Returns:
+            Matching records
+        """
+        with self._lock:
+            self._file.flush()
+            start = bisect.bisect_left(self._times, since) if since is not None else 0
+            end = bisect.bisect_left(self._times, until) if until is not None else len(self._times)
+            if levels:
+                numbers = sorted(
+                    n for level in levels for n in self._by_level.get(level, ())
+                    if start <= n < end
+                )
+            else:
+                numbers = range(start, end)
+            numbers = list(numbers)
+            if limit is not None:
+                numbers = numbers[-limit:] if limit else []
+            return [self._read(n) for n in numbers]
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class ServerLog:
+    """
+    Parses and stores a server's console output and tracks its lifecycle
+
+    Startup phases and crashes are recognized from parsed records (message
+    and level), not substring scans over raw text. on_ready is called once,
+    when the server reports it finished starting; on_crash when a crash
+    marker is seen.
+    """
+
+    # Startup phases in order: (phase, message pattern)
+    PHASES = (
+        ("launch", re.compile(r'^(?:Loading Minecraft|ModLauncher running|Launching target|Loading \d+ mods)')),
+        ("starting", re.compile(r'^Starting minecraft server version')),
+        ("properties", re.compile(r'^Loading properties')),
+        ("world", re.compile(r'^Preparing level')),
+        ("spawn", re.compile(r'^Preparing (?:start region|spawn area)')),
+        ("ready", re.compile(r'^Done \((?P<seconds>[\d.,]+)s\)!')),
+    )
+    # "Done" inside a line no layout matched (custom logger, wrapper prefix)
+    RAW_READY = re.compile(r'\bDone \((?P<seconds>[\d.,]+)s\)!')
+    CRASH = re.compile(
+        r'This crash report has been saved to|Encountered an unexpected exception|'
+        r'Failed to start the minecraft server|Exception in server tick loop|'
+        r'Crash report saved to|Preparing crash report'
+    )
+    STORE_NAME = "pycraft-console.jsonl"
+
+    def __init__(
+        self,
+        server_folder: str,
+        on_ready: Optional[Callable[[], None]] = None,
+        on_crash: Optional[Callable[[LogRecord], None]] = None
+    ):
+        self.parser = LogParser()
+        self.store = LogStore(Path(server_folder) / "logs" / self.STORE_NAME)
+        self.on_ready = on_ready
+        self.on_crash = on_crash
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+        self.reported_startup: Optional[float] = None
+        self.crash: Optional[LogRecord] = None
+        self._seq = 0
+
+    @property
+    def ready(self) -> bool:
+        return "ready" in self.phases
+
+    def feed(self, line: str) -> LogRecord:
+        """Parses, stores and inspects one console line"""
+        record = self.parser.parse(line, self._seq)
+        self._seq += 1
+        self.store.append(record)
+
+        self._track(record)
+        return record
+
+    def _track(self, record: LogRecord):
+        if not self.ready:
+            for phase, pattern in self.PHASES:
+                if phase in self.phases:
+                    continue
+                match = pattern.match(record.message)
+                if match:
+                    self._reach(phase, record, match)
+                    break
+            else:
+                if record.level == "RAW":
+                    match = self.RAW_READY.search(record.message)
+                    if match:
+                        self._reach("ready", record, match)
+
+        if self.crash is None and (record.level == "FATAL" or self.CRASH.search(record.message)):
+            self.crash = record
+            if self.on_crash:
+                self.on_crash(record)
+
+    def _reach(self, phase: str, record: LogRecord, match: re.Match):
+        self.phases[phase] = record.received
+        if phase == "ready":
+            try:
+                self.reported_startup = float(match.group("seconds").replace(",", "."))
+            except ValueError:
+                pass
+            if self.on_ready:
+                self.on_ready()
+
+    def startup_phases(self) -> Dict[str, float]:
+        """Seconds from launch to each phase reached so far"""
+        return {phase: round(at - self.started_at, 3) for phase, at in self.phases.items()}
+
+    def errors(self, since: Optional[float] = None, limit: Optional[int] = 200) -> List[LogRecord]:
+        """ERROR/FATAL records (newest `limit`)"""
+        return self.store.query(["ERROR", "FATAL"], since=since, limit=limit)
+
+    def warnings(self, since: Optional[float] = None, limit: Optional[int] = 200) -> List[LogRecord]:
+        return self.store.query(["WARN"], since=since, limit=limit)
+
+    def close(self):
+        self.store.close()
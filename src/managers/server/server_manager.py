@@ -1,14 +1,24 @@
 import subprocess
 import os
 import time
+import asyncio
 import json
 import zipfile
-import queue
-from typing import Optional, Callable, Tuple
+import secrets
+from typing import Optional, Callable, List, Tuple
 import threading
 
 # Import system utilities for validation
 from ...utils import system_utils
+from .console import ConsoleBuffer
+from .server_log import ServerLog
+from .rcon import RconClient, RconError
+from .status import ServerStatus, ping_server, ping_server_async
+from .supervisor import ProcessSupervisor
+from .properties import EMPTY_JSON_FILES, default_properties, render_properties
+from . import jvm_flags
+from .cds import CdsArchive
+from .launch_resolver import LaunchResolver, JAVA_NAMES
 
 
 class ServerManager:
@@ -22,6 +32,17 @@ class ServerManager:
         self.server_process = None
         self.java_executable = java_executable
         self._detected_version = None  # Cache for detected version
+        self.server_log: Optional[ServerLog] = None  # Parsed output of the detached server
+        self._rcon: Optional[RconClient] = None  # Pooled RCON connection to the running server
+        # Readiness of the detached server (Server List Ping or parsed log, whichever comes first)
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.last_status: Optional[ServerStatus] = None
+        self._ready_event = threading.Event()
+        self._ready_lock = threading.Lock()
+        self.cds = CdsArchive(server_folder)  # Optional class data sharing archive (see set_jvm_settings)
+        self.launch_resolver = LaunchResolver(server_folder)  # Run scripts -> direct Java command
+        self._direct_launch = False  # Detached server is the JVM itself (no wrapper script)
 
     def _patch_serverpack_script(
         self,
@@ -584,13 +605,18 @@ set "PATH=%JAVA_HOME%\\bin;%PATH%"
             print(f"Error accepting EULA: {e}")
             return False
 
-    def ensure_server_properties(self, log_callback: Optional[Callable[[str], None]] = None) -> bool:
+    def ensure_server_properties(
+        self,
+        log_callback: Optional[Callable[[str], None]] = None,
+        minecraft_version: Optional[str] = None
+    ) -> bool:
         """
         Pre-emptively creates server.properties if it doesn't exist.
         This avoids having to run the server just to generate this file.
 
         Args:
             log_callback: Callback function to report progress
+            minecraft_version: Version whose defaults to write (detected if None)
 
         Returns:
             True if server.properties exists or was created successfully
@@ -602,71 +628,13 @@ set "PATH=%JAVA_HOME%\\bin;%PATH%"
             if log_callback:
                 log_callback("[INFO] server.properties no encontrado. Creando archivo por defecto...\n")
 
-            # Default server.properties content (Minecraft 1.19.2+ compatible)
-            default_properties = """#Minecraft server properties
-#Auto-generated by PyCraft
-enable-jmx-monitoring=false
-rcon.port=25575
-level-seed=
-gamemode=survival
-enable-command-block=false
-enable-query=false
-generator-settings={}
-enforce-secure-profile=false
-level-name=world
-motd=A Minecraft Server
-query.port=25565
-pvp=true
-generate-structures=true
-max-chained-neighbor-updates=1000000
-difficulty=normal
-network-compression-threshold=256
-max-tick-time=60000
-require-resource-pack=false
-use-native-transport=true
-max-players=20
-online-mode=false
-enable-status=true
-allow-flight=false
-initial-disabled-packs=
-broadcast-rcon-to-ops=true
-view-distance=10
-server-ip=
-resource-pack-prompt=
-allow-nether=true
-server-port=25565
-enable-rcon=false
-sync-chunk-writes=true
-op-permission-level=4
-prevent-proxy-connections=false
-hide-online-players=false
-resource-pack=
-entity-broadcast-range-percentage=100
-simulation-distance=10
-rcon.password=
-player-idle-timeout=0
-force-gamemode=false
-rate-limit=0
-hardcore=false
-white-list=false
-broadcast-console-to-ops=true
-spawn-npcs=true
-spawn-animals=true
-function-permission-level=2
-initial-enabled-packs=vanilla
-level-type=minecraft\\:normal
-text-filtering-config=
-spawn-monsters=true
-enforce-whitelist=false
-spawn-protection=16
-resource-pack-sha1=
-max-world-size=29999984
-"""
-            with open(self.properties_path, 'w', encoding='utf-8') as f:
-                f.write(default_properties)
+            # Same keys and defaults the server itself would write for this version
+            version = minecraft_version or self.detect_minecraft_version()
+            with open(self.properties_path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(render_properties(default_properties(version)))
 
             if log_callback:
-                log_callback("[OK] server.properties created with default configuration\n")
+                log_callback(f"[OK] server.properties created with default configuration{f' for {version}' if version else ''}\n")
 
             return True
 
@@ -675,6 +643,42 @@ max-world-size=29999984
                 log_callback(f"[WARN] Could not create server.properties: {e}\n")
             return False
 
+    def provision_server(
+        self,
+        minecraft_version: Optional[str] = None,
+        log_callback: Optional[Callable[[str], None]] = None
+    ) -> bool:
+        """
+        Writes every file the server's first run would generate, without starting Java
+
+        Creates eula.txt (accepted), server.properties with the defaults of the
+        Minecraft version and the empty player lists (ops.json, whitelist.json...).
+        Existing files are left alone.
+
+        Args:
+            minecraft_version: Server version (detected from the jar if None)
+            log_callback: Callback function to report progress
+
+        Returns:
+            True if all files are in place
+        """
+        if not self.ensure_eula_accepted(log_callback):
+            return False
+        if not self.ensure_server_properties(log_callback, minecraft_version):
+            return False
+
+        try:
+            for name in EMPTY_JSON_FILES:
+                path = os.path.join(self.server_folder, name)
+                if not os.path.exists(path):
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write("[]")
+        except OSError as e:
+            if log_callback:
+                log_callback(f"[ERROR] Could not create server files: {e}\n")
+            return False
+        return True
+
     def ensure_eula_accepted(self, log_callback: Optional[Callable[[str], None]] = None) -> bool:
         """
         Pre-emptively ensures EULA is accepted BEFORE starting the server.
@@ -978,7 +982,10 @@ max-world-size=29999984
         log_callback: Optional[Callable[[str], None]] = None
     ) -> bool:
         """
-        Runs the server for the first time and performs all automatic configuration
+        Prepares a new server for its first start and performs all automatic configuration
+
+        Generates the files the first run would create (see provision_server)
+        instead of booting the JVM to have the server write them.
 
         Args:
             log_callback: Callback function to receive process logs
@@ -988,7 +995,7 @@ max-world-size=29999984
         """
         try:
             if log_callback:
-                log_callback("Starting server for the first time...\n")
+                log_callback("Preparing server for the first start...\n")
                 log_callback("\n" + "="*70 + "\n")
                 log_callback("PRE-FLIGHT CHECKS\n")
                 log_callback("="*70 + "\n\n")
@@ -1016,85 +1023,45 @@ max-world-size=29999984
             if not can_ram:
                 return False
 
-            # 3. Check if port 25565 is in use
+            # 3. Check if the server port is in use
+            _, port = self.server_address()
             if log_callback:
-                log_callback("Checking port 25565...\n")
+                log_callback(f"Checking port {port}...\n")
 
-            system_utils.check_minecraft_port(log_callback)
+            system_utils.check_minecraft_port(log_callback, port)
 
             if log_callback:
                 log_callback("\n" + "="*70 + "\n")
                 log_callback("FILE GENERATION\n")
                 log_callback("="*70 + "\n\n")
 
-            # 4. First execution (will generate eula.txt) - Increased timeout to 20s
+            # 4. Write the files the first run would generate (no JVM boot needed)
             if log_callback:
-                log_callback("Generating EULA (this may take up to 20 seconds)...\n")
-
-            self._run_server_and_wait(log_callback, timeout=20, check_for="eula.txt")
+                log_callback("Generating server files...\n")
 
-            # Wait briefly
-            time.sleep(0.5)
+            if not self.provision_server(log_callback=log_callback):
+                return False
 
-            # 5. Validate EULA file
+            # 5. Validate generated files
             if not system_utils.validate_eula_file(self.eula_path):
                 if log_callback:
                     log_callback("\n[ERROR] EULA was not generated correctly or is corrupted\n")
-                    log_callback("   Possible causes:\n")
-                    log_callback("   -Java did not execute correctly\n")
-                    log_callback("   -The process was interrupted\n")
-                    log_callback("   -Permission issues\n")
-                return False
-
-            # 6. Accept EULA
-            if os.path.exists(self.eula_path):
-                if log_callback:
-                    log_callback("[OK] EULA generated successfully\n")
-                    log_callback("Accepting EULA automatically...\n")
-                if not self.accept_eula():
-                    if log_callback:
-                        log_callback("[ERROR] Error accepting EULA\n")
-                    return False
-            else:
-                if log_callback:
-                    log_callback("[ERROR] EULA file not found\n")
                 return False
-
-            # 7. Second execution (will generate all server files) - Increased timeout to 40s
-            if log_callback:
-                log_callback("[OK] EULA accepted\n\n")
-                log_callback("Generating server files (this may take up to 40 seconds)...\n")
-
-            self._run_server_and_wait(log_callback, timeout=40, check_for="server.properties")
-
-            # Wait briefly
-            time.sleep(0.5)
-
-            # 8. Validate server.properties file
             if not system_utils.validate_properties_file(self.properties_path):
                 if log_callback:
                     log_callback("\n[ERROR] server.properties was not generated correctly or is corrupted\n")
-                    log_callback("   Possible causes:\n")
-                    log_callback("   -The server did not have enough time to initialize\n")
-                    log_callback("   -Incompatible Minecraft version\n")
-                    log_callback("   -Permission issues\n")
                 return False
 
-            # 9. Modify server.properties
-            if os.path.exists(self.properties_path):
-                if log_callback:
-                    log_callback("[OK] server.properties generated successfully\n")
-                    log_callback("Configuring server.properties...\n")
-                if not self.configure_server_properties(log_callback=log_callback):
-                    if log_callback:
-                        log_callback("[ERROR] Error modifying server.properties\n")
-                    return False
-            else:
+            # 6. Modify server.properties
+            if log_callback:
+                log_callback("[OK] Server files generated\n")
+                log_callback("Configuring server.properties...\n")
+            if not self.configure_server_properties(log_callback=log_callback):
                 if log_callback:
-                    log_callback("[ERROR] server.properties file not found\n")
+                    log_callback("[ERROR] Error modifying server.properties\n")
                 return False
 
-            # 10. Configuration complete
+            # 7. Configuration complete
             if log_callback:
                 log_callback("\n[OK] Configuration completed successfully!\n\n")
 
@@ -1109,156 +1076,122 @@ max-world-size=29999984
             # Clean up zombie processes
             system_utils.cleanup_zombie_processes(log_callback)
 
-    def _run_server_and_wait(
+    @property
+    def _supervisor(self) -> ProcessSupervisor:
+        return ProcessSupervisor.shared()
+
+    def _generated_file_ready(self, name: str, markers: Tuple[str, ...] = (), min_size: int = 10) -> bool:
+        """True once the server has written a file it generates on first run (with real content)"""
+        path = os.path.join(self.server_folder, name)
+        try:
+            if os.path.getsize(path) <= min_size:
+                return False
+            if not markers:
+                return True
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            return any(marker in content for marker in markers)
+        except OSError:
+            return False
+
+    def _launch_detached(
         self,
+        command: List[str],
         log_callback: Optional[Callable[[str], None]] = None,
-        timeout: int = 30,
-        check_for: Optional[str] = None
+        on_ready: Optional[Callable[[], None]] = None,
+        on_stopped: Optional[Callable[[], None]] = None,
+        env: Optional[dict] = None,
+        shell: bool = False,
+        creation_flags: int = 0
     ):
         """
-        Ejecuta el servidor y espera a que termine o alcance el timeout
+        Starts the detached server under the process supervisor
 
-        Args:
-            log_callback: Función callback para recibir logs
-            timeout: Tiempo máximo de espera en segundos
-            check_for: Archivo a buscar para terminar antes (optimización)
+        Every output line goes through self.server_log (parsed, stored under
+        logs/pycraft-console.jsonl and checked for startup/crash markers) and
+        reaches log_callback in frame-rate batches, never one call per line.
+        Readiness is also probed with Server List Ping on the same loop.
+
+        on_ready and on_stopped run on the supervisor thread and must not block.
         """
+        self.started_at, self.ready_at, self.last_status = time.time(), None, None
+        self._ready_event = ready_event = threading.Event()
+
+        def mark_ready():
+            with self._ready_lock:
+                if ready_event.is_set():
+                    return
+                self.ready_at = time.time()
+                ready_event.set()
+            if on_ready:
+                on_ready()
+
+        if self.server_log:
+            self.server_log.close()
         try:
-            # Comando para ejecutar el servidor (2GB RAM por defecto para vanilla)
-            command = [self.java_executable, "-Xmx2048M", "-Xms2048M", "-Djava.awt.headless=true", "-jar", "server.jar", "nogui"]
-
-            # Ejecutar el proceso
-            # Configurar flags para Windows
-            creation_flags = 0
-            if os.name == 'nt':
-                creation_flags = subprocess.CREATE_NO_WINDOW
+            self.server_log = ServerLog(self.server_folder, on_ready=mark_ready)
+        except OSError as e:
+            print(f"Error opening server log store: {e}")
+            self.server_log = None
+        server_log = self.server_log
+        console = ConsoleBuffer(log_callback).start() if log_callback else None
+
+        def on_line(line: str):
+            if server_log:
+                try:
+                    server_log.feed(line)
+                except Exception as e:
+                    print(f"Error parsing server log line: {e}")
+            if console:
+                console.push(line)
+
+        def on_exit(returncode: int):
+            if console:
+                console.close()
+            self._close_rcon()
+            # Server process has ended - call the on_stopped callback
+            if on_stopped:
+                on_stopped()
 
-            process = subprocess.Popen(
+        try:
+            process = self._supervisor.spawn(
                 command,
                 cwd=self.server_folder,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                creationflags=creation_flags
+                env=env,
+                shell=shell,
+                creationflags=creation_flags,
+                on_line=on_line,
+                on_exit=on_exit
             )
-
-            # Use a thread-safe queue for output
-            output_queue = queue.Queue()
-            stop_reader = threading.Event()
-
-            def read_output():
-                """Read output in a separate thread to avoid blocking"""
-                try:
-                    while not stop_reader.is_set():
-                        if process.stdout:
-                            line = process.stdout.readline()
-                            if line:
-                                output_queue.put(line)
-                            elif process.poll() is not None:
-                                # Process ended and no more output
-                                break
-                        else:
-                            break
-                except Exception:
-                    pass
-
-            reader_thread = threading.Thread(target=read_output, daemon=True)
-            reader_thread.start()
-
-            # Wait for timeout or process completion
-            start_time = time.time()
-            file_found = False
-
-            while True:
-                # Process any pending output (non-blocking)
-                try:
-                    while True:
-                        line = output_queue.get_nowait()
-                        if log_callback:
-                            log_callback(line)
-                except queue.Empty:
-                    pass
-
-                # Check if process ended
-                if process.poll() is not None:
-                    break
-
-                # Check for target file
-                if check_for and not file_found:
-                    check_path = os.path.join(self.server_folder, check_for)
-                    if os.path.exists(check_path):
-                        # Wait for file to have valid content
-                        file_ready = False
-                        for _ in range(10):  # Try for up to 5 seconds
-                            time.sleep(0.5)
-                            try:
-                                file_size = os.path.getsize(check_path)
-                                if file_size > 50:
-                                    with open(check_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                        content = f.read()
-                                    # For server.properties, check for server-port
-                                    # For eula.txt, check for eula=
-                                    if 'server-port=' in content or 'eula=' in content:
-                                        file_ready = True
-                                        break
-                            except:
-                                pass
-
-                        file_found = True
-                        process.terminate()
-                        try:
-                            process.wait(timeout=3)
-                        except subprocess.TimeoutExpired:
-                            process.kill()
-                        break
-
-                # Timeout check
-                if time.time() - start_time > timeout:
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                    break
-
-                time.sleep(0.1)
-
-            # Stop the reader thread
-            stop_reader.set()
-
-            # Give reader thread a moment to finish, then process remaining output
-            reader_thread.join(timeout=2)
-
-            # Process any remaining output
-            try:
-                while True:
-                    line = output_queue.get_nowait()
-                    if log_callback:
-                        log_callback(line)
-            except queue.Empty:
-                pass
-
-        except FileNotFoundError as e:
-            if log_callback:
-                log_callback(f"\n✗ Error: Java executable not found.\n")
-                log_callback(f"Path searched: {self.java_executable}\n")
-                log_callback("Make sure Java is installed correctly.\n")
-        except PermissionError as e:
-            if log_callback:
-                log_callback(f"\n✗ Permission error running the server: {e}\n")
-        except Exception as e:
-            if log_callback:
-                log_callback(f"\n✗ Error running server: {e}\n")
-                log_callback(f"Error type: {type(e).__name__}\n")
+        except Exception:
+            if console:
+                console.close()
+            raise
+        self.server_process = process
+        self._direct_launch = not shell and os.path.basename(command[0]).lower() in JAVA_NAMES
+        host, port = self.server_address()
+
+        async def probe_readiness():
+            # Protocol-level readiness: works for custom loggers and buffered wrapper scripts.
+            # Pre-1.19.4 servers answer while loading with an empty status: those
+            # replies are ignored and the log's "Done" record marks them ready
+            while process.returncode is None and not ready_event.is_set():
+                status = await ping_server_async(host, port, self.READY_PROBE_TIMEOUT)
+                if status and status.is_complete:
+                    self.last_status = status
+                    mark_ready()
+                    return
+                await asyncio.sleep(self.READY_PROBE_INTERVAL)
+
+        self._supervisor.submit(probe_readiness())
 
     def start_server(
         self,
         ram_mb: int = 2048,
         log_callback: Optional[Callable[[str], None]] = None,
         detached: bool = False,
-        on_stopped: Optional[Callable[[], None]] = None
+        on_stopped: Optional[Callable[[], None]] = None,
+        on_ready: Optional[Callable[[], None]] = None
     ) -> bool:
         """
         Inicia el servidor de Minecraft
@@ -1268,6 +1201,7 @@ max-world-size=29999984
             log_callback: Función callback para recibir logs del servidor
             detached: Si es True, el servidor se ejecuta en segundo plano
             on_stopped: Callback que se llama cuando el servidor se detiene (solo en modo detached)
+            on_ready: Callback que se llama una vez cuando el servidor termina de arrancar (solo en modo detached)
 
         Returns:
             True si el servidor se inició correctamente, False en caso contrario
@@ -1296,12 +1230,14 @@ max-world-size=29999984
 
             if os.name == 'nt':  # Windows
                 if os.path.exists(run_bat):
-                    # Patch the batch script to use correct Java
-                    self._patch_serverpack_bat(run_bat, self.java_executable, log_callback)
-                    command = [run_bat]
-                    use_shell = True
-                    if log_callback:
-                        log_callback("Using run.bat to start server...\n")
+                    command = self._direct_script_command(run_bat, ram_mb, self.java_executable, log_callback)
+                    if command is None:
+                        # Patch the batch script to use correct Java
+                        self._patch_serverpack_bat(run_bat, self.java_executable, log_callback)
+                        command = [run_bat]
+                        use_shell = True
+                        if log_callback:
+                            log_callback("Using run.bat to start server...\n")
                 elif os.path.exists(start_bat):
                     # Patch the batch script to use correct Java
                     self._patch_serverpack_bat(start_bat, self.java_executable, log_callback)
@@ -1311,9 +1247,11 @@ max-world-size=29999984
                         log_callback("Using start.bat to start server...\n")
             else:  # Linux/Mac
                 if os.path.exists(run_sh):
-                    command = ["bash", run_sh]
-                    if log_callback:
-                        log_callback("Using run.sh to start server...\n")
+                    command = self._direct_script_command(run_sh, ram_mb, self.java_executable, log_callback)
+                    if command is None:
+                        command = ["bash", run_sh]
+                        if log_callback:
+                            log_callback("Using run.sh to start server...\n")
                 elif os.path.exists(start_sh):
                     command = ["bash", start_sh]
                     if log_callback:
@@ -1325,7 +1263,7 @@ max-world-size=29999984
 
                 # Check for server.jar first
                 if os.path.exists(self.server_jar_path):
-                    command = [self.java_executable, f"-Xmx{ram_mb}M", f"-Xms{ram_mb}M", "-Djava.awt.headless=true", "-jar", "server.jar", "nogui"]
+                    command = [self.java_executable, *self.build_jvm_args(ram_mb), "-jar", "server.jar", "nogui"]
                 else:
                     # Look for other server jars
                     jar_patterns = ["forge-*.jar", "neoforge-*.jar", "fabric-server-*.jar", "quilt-server-*.jar"]
@@ -1338,7 +1276,7 @@ max-world-size=29999984
                             break
 
                     if server_jar:
-                        command = [self.java_executable, f"-Xmx{ram_mb}M", f"-Xms{ram_mb}M", "-Djava.awt.headless=true", "-jar", server_jar, "nogui"]
+                        command = [self.java_executable, *self.build_jvm_args(ram_mb), "-jar", server_jar, "nogui"]
                         if log_callback:
                             log_callback(f"Using {server_jar}...\n")
                     else:
@@ -1346,8 +1284,13 @@ max-world-size=29999984
                             log_callback("No server jar or start script found\n")
                         return False
 
+            self._prepare_script_launch(command, ram_mb, self.java_executable, log_callback)
+
             if log_callback:
                 log_callback(f"Starting server with {ram_mb} MB ({ram_mb/1024:.1f} GB) of RAM...\n")
+                if command[0] == self.java_executable:
+                    log_callback(f"JVM profile: {self.jvm_profile(ram_mb)}\n")
+                    self._log_cds_state(log_callback)
 
             if detached:
                 # Run in background with stdin for commands
@@ -1359,34 +1302,12 @@ max-world-size=29999984
                 if os.name == 'nt':
                     creation_flags = subprocess.CREATE_NO_WINDOW
 
-                self.server_process = subprocess.Popen(
-                    command,
-                    cwd=self.server_folder,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    stdin=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    creationflags=creation_flags,
-                    shell=use_shell
+                # El supervisor lee los logs y detecta la salida del proceso
+                self._launch_detached(
+                    command, log_callback, on_ready, on_stopped,
+                    shell=use_shell, creation_flags=creation_flags
                 )
 
-                # Leer logs en un hilo separado
-                def read_output():
-                    try:
-                        if log_callback and self.server_process and self.server_process.stdout:
-                            for line in self.server_process.stdout:
-                                log_callback(line)
-                    except Exception:
-                        pass
-                    finally:
-                        # Server process has ended - call the on_stopped callback
-                        if on_stopped:
-                            on_stopped()
-
-                thread = threading.Thread(target=read_output, daemon=True)
-                thread.start()
-
                 if log_callback:
                     log_callback("Server started!\n")
                 return True
@@ -1448,60 +1369,82 @@ max-world-size=29999984
                         pass
 
                 # Give Minecraft a moment to save and shutdown gracefully
-                import time
-                time.sleep(2)
-
-                # Now kill the ENTIRE process tree to prevent restart scripts
-                # This is necessary because some modpacks use scripts with auto-restart loops
+                # (returns as soon as the supervisor sees the process exit).
+                # A JVM launched directly has no restart loop around it, so it
+                # gets time to save; a CDS training run also writes its archive.
+                grace = self.STOP_TIMEOUT if self._direct_launch else 2
+                if self.cds.state == CdsArchive.STATE_TRAINING:
+                    grace = max(grace, CdsArchive.DUMP_TIMEOUT)
                 try:
-                    import psutil
+                    self.server_process.wait(timeout=grace)
+                except subprocess.TimeoutExpired:
+                    pass
+
+                if self._direct_launch:
+                    # Single process: no tree to walk
+                    if self.server_process.poll() is None:
+                        self.server_process.terminate()
+                        try:
+                            self.server_process.wait(timeout=10)
+                        except subprocess.TimeoutExpired:
+                            self.server_process.kill()
+                            try:
+                                self.server_process.wait(timeout=5)
+                            except subprocess.TimeoutExpired:
+                                pass
+                else:
+                    # Kill the ENTIRE process tree to prevent restart scripts
+                    # This is necessary because some modpacks use scripts with auto-restart loops
                     try:
-                        parent = psutil.Process(pid)
-                        # Get all children BEFORE killing anything
-                        children = parent.children(recursive=True)
+                        import psutil
+                        try:
+                            parent = psutil.Process(pid)
+                            # Get all children BEFORE killing anything
+                            children = parent.children(recursive=True)
 
-                        # Kill children first (Java process)
-                        for child in children:
+                            # Kill children first (Java process)
+                            for child in children:
+                                try:
+                                    child.kill()
+                                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                    pass
+
+                            # Then kill parent (script/cmd)
                             try:
-                                child.kill()
+                                parent.kill()
                             except (psutil.NoSuchProcess, psutil.AccessDenied):
                                 pass
 
-                        # Then kill parent (script/cmd)
-                        try:
-                            parent.kill()
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-
-                        # Wait for all to terminate
-                        psutil.wait_procs(children + [parent], timeout=5)
+                            # Wait for all to terminate
+                            psutil.wait_procs(children + [parent], timeout=5)
 
-                    except psutil.NoSuchProcess:
-                        # Process already dead
-                        pass
+                        except psutil.NoSuchProcess:
+                            # Process already dead
+                            pass
 
-                except ImportError:
-                    # psutil not available, use basic approach
-                    self.server_process.terminate()
-                    try:
-                        self.server_process.wait(timeout=10)
-                    except subprocess.TimeoutExpired:
-                        self.server_process.kill()
+                    except ImportError:
+                        # psutil not available, use basic approach
+                        self.server_process.terminate()
                         try:
-                            self.server_process.wait(timeout=5)
+                            self.server_process.wait(timeout=10)
                         except subprocess.TimeoutExpired:
-                            # On Windows, try taskkill for the whole tree
-                            if os.name == 'nt':
-                                try:
-                                    subprocess.run(
-                                        ['taskkill', '/F', '/T', '/PID', str(pid)],
-                                        capture_output=True,
-                                        timeout=10
-                                    )
-                                except Exception:
-                                    pass
+                            self.server_process.kill()
+                            try:
+                                self.server_process.wait(timeout=5)
+                            except subprocess.TimeoutExpired:
+                                # On Windows, try taskkill for the whole tree
+                                if os.name == 'nt':
+                                    try:
+                                        subprocess.run(
+                                            ['taskkill', '/F', '/T', '/PID', str(pid)],
+                                            capture_output=True,
+                                            timeout=10
+                                        )
+                                    except Exception:
+                                        pass
 
                 print("Servidor detenido")
+                self._close_rcon()
                 self.server_process = None
                 return True
             else:
@@ -1544,6 +1487,480 @@ max-world-size=29999984
             print(f"Error sending command: {e}")
             return False
 
+    # ==================== STATUS ====================
+
+    READY_PROBE_INTERVAL = 1.0  # Seconds between Server List Pings while starting
+    READY_PROBE_TIMEOUT = 2.0
+
+    def server_address(self) -> Tuple[str, int]:
+        """Returns (host, port) to reach the local server, from server.properties"""
+        host = (self.get_property("server-ip") or "").strip()
+        if host in ("", "0.0.0.0", "::"):
+            host = "127.0.0.1"
+        try:
+            port = int(self.get_property("server-port") or 25565)
+        except ValueError:
+            port = 25565
+        return host, port
+
+    def ping(self, timeout: float = 2.0) -> Optional[ServerStatus]:
+        """
+        Consulta el estado del servidor con Server List Ping
+
+        Returns:
+            ServerStatus (versión, jugadores, latencia) o None si el servidor no responde
+        """
+        host, port = self.server_address()
+        status = ping_server(host, port, timeout)
+        if status:
+            self.last_status = status
+        return status
+
+    def is_ready(self) -> bool:
+        """True once the running server accepts players"""
+        return self.is_server_running() and self._ready_event.is_set()
+
+    @property
+    def startup_seconds(self) -> Optional[float]:
+        """Seconds from launch until the server became ready (None until then)"""
+        if self.started_at is None or self.ready_at is None:
+            return None
+        return round(self.ready_at - self.started_at, 3)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the detached server is ready, stops or timeout expires
+
+        Returns:
+            True if the server is ready
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.is_server_running():
+            remaining = deadline - time.monotonic() if deadline is not None else 0.5
+            if remaining <= 0:
+                break
+            if self._ready_event.wait(min(remaining, 0.5)):
+                return True
+        return self.is_ready()
+
+    def start_health_check(
+        self,
+        callback: Callable[[Optional[ServerStatus]], None],
+        interval: float = 10.0
+    ) -> threading.Event:
+        """
+        Pings the running server periodically on a background thread
+
+        Args:
+            callback: Receives each ServerStatus (None when the server didn't answer)
+            interval: Seconds between pings
+
+        Returns:
+            Event that stops the health check when set (it also stops with the server)
+        """
+        stop = threading.Event()
+
+        def run():
+            while not stop.is_set() and self.is_server_running():
+                try:
+                    callback(self.ping())
+                except Exception as e:
+                    print(f"Error in server health check: {e}")
+                stop.wait(interval)
+
+        threading.Thread(target=run, daemon=True).start()
+        return stop
+
+    # ==================== RCON ====================
+
+    DEFAULT_RCON_PORT = 25575
+    STDIN_REPLY_QUIET = 0.15  # Seconds without new output that end a stdin reply
+
+    def enable_rcon(self, log_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Turns on RCON in server.properties (takes effect on the next start)
+
+        Sets enable-rcon=true and fills in rcon.port and a random rcon.password
+        when they are missing. An existing password is kept.
+
+        Returns:
+            True if RCON is configured, False otherwise
+        """
+        if not os.path.exists(self.properties_path):
+            # server.properties doesn't exist yet, will be created on first server run
+            return False
+
+        changes = {}
+        if self.get_property("enable-rcon") != "true":
+            changes["enable-rcon"] = "true"
+        if not (self.get_property("rcon.port") or "").strip().isdigit():
+            changes["rcon.port"] = str(self.DEFAULT_RCON_PORT)
+        if not self.get_property("rcon.password"):
+            changes["rcon.password"] = secrets.token_urlsafe(24)
+
+        for name, value in changes.items():
+            if not self.update_property(name, value):
+                return False
+        if changes and log_callback:
+            log_callback("[OK] RCON enabled for server commands\n")
+        return True
+
+    def _rcon_settings(self) -> Optional[Tuple[int, str]]:
+        """Returns (port, password) if RCON is enabled in server.properties"""
+        if self.get_property("enable-rcon") != "true":
+            return None
+        password = self.get_property("rcon.password")
+        try:
+            port = int(self.get_property("rcon.port") or self.DEFAULT_RCON_PORT)
+        except ValueError:
+            return None
+        return (port, password) if password else None
+
+    def _get_rcon(self) -> Optional[RconClient]:
+        """Returns the pooled RCON client, or None if RCON can't be used right now"""
+        if not self.is_server_running():
+            return None
+        # The RCON listener only starts once the server has finished loading
+        if not self.is_ready():
+            return None
+        settings = self._rcon_settings()
+        if not settings:
+            return None
+        port, password = settings
+        if self._rcon is None or (self._rcon.port, self._rcon.password) != (port, password):
+            self._close_rcon()
+            self._rcon = RconClient("127.0.0.1", port, password)
+        return self._rcon
+
+    def _close_rcon(self):
+        if self._rcon is not None:
+            self._rcon.close()
+            self._rcon = None
+
+    def execute_commands(self, commands: List[str], timeout: float = 5.0) -> Optional[List[str]]:
+        """
+        Ejecuta comandos en el servidor y devuelve sus respuestas
+
+        Usa la conexión RCON persistente (una sola ida y vuelta para todo el
+        lote). Si RCON no está disponible, escribe los comandos en stdin y toma
+        como respuesta la salida de consola que producen.
+
+        Args:
+            commands: Comandos sin "/" (ej: ["list", "save-all"])
+            timeout: Segundos máximos de espera por respuesta (modo stdin)
+
+        Returns:
+            Lista de respuestas en el mismo orden, o None si el servidor no está en ejecución
+        """
+        if not self.is_server_running():
+            print("Server is not running")
+            return None
+
+        rcon = self._get_rcon()
+        if rcon:
+            try:
+                return rcon.commands(commands)
+            except RconError as e:
+                print(f"RCON unavailable, using console: {e}")
+
+        replies = []
+        for command in commands:
+            reply = self._execute_via_stdin(command, timeout)
+            if reply is None:
+                return None
+            replies.append(reply)
+        return replies
+
+    def execute_command(self, command: str, timeout: float = 5.0) -> Optional[str]:
+        """
+        Ejecuta un comando en el servidor y devuelve su respuesta
+
+        Returns:
+            Respuesta del servidor, o None si no se pudo enviar
+        """
+        replies = self.execute_commands([command], timeout)
+        return replies[0] if replies else None
+
+    def _execute_via_stdin(self, command: str, timeout: float) -> Optional[str]:
+        """Sends a command over stdin and collects the console lines it produces"""
+        server_log = self.server_log
+        before = len(server_log.store) if server_log else 0
+        if not self.send_command(command):
+            return None
+        if not server_log:
+            return ""
+
+        deadline = time.monotonic() + timeout
+        last_count, last_change = before, None
+        while time.monotonic() < deadline:
+            time.sleep(0.02)
+            count = len(server_log.store)
+            if count != last_count:
+                last_count, last_change = count, time.monotonic()
+            elif last_change and time.monotonic() - last_change >= self.STDIN_REPLY_QUIET:
+                break
+
+        records = server_log.store.read_range(before, last_count)
+        return "\n".join(record.message for record in records)
+
+    # ==================== JVM FLAGS ====================
+
+    JVM_SETTINGS_FILE = "pycraft_jvm.json"
+    USER_JVM_ARGS_BEGIN = "# --- PyCraft JVM flags (regenerated on every start) ---"
+    USER_JVM_ARGS_END = "# --- End of PyCraft JVM flags ---"
+
+    def get_jvm_settings(self) -> dict:
+        """
+        Returns the server's JVM settings: {"profile": str, "extra_args": [str], "cds": bool}
+
+        profile is "auto" (chosen from Java version and RAM) unless the user
+        picked one of jvm_flags.PROFILES for this server. cds turns on the
+        AppCDS archive (off by default: the first start is a training run).
+        """
+        settings = {"profile": jvm_flags.PROFILE_AUTO, "extra_args": [], "cds": False}
+        path = os.path.join(self.server_folder, self.JVM_SETTINGS_FILE)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("profile") in jvm_flags.PROFILES:
+                    settings["profile"] = data["profile"]
+                if isinstance(data.get("extra_args"), list):
+                    settings["extra_args"] = [str(arg) for arg in data["extra_args"] if str(arg).strip()]
+                settings["cds"] = data.get("cds") is True
+            except Exception as e:
+                print(f"Error reading JVM settings: {e}")
+        return settings
+
+    def set_jvm_settings(
+        self,
+        profile: Optional[str] = None,
+        extra_args: Optional[List[str]] = None,
+        cds: Optional[bool] = None
+    ) -> bool:
+        """
+        Saves the server's JVM profile and extra flags (used from the next start)
+
+        Settings passed as None keep their current value, so e.g.
+        set_jvm_settings(cds=True) leaves the profile and extra flags alone.
+
+        Args:
+            profile: "auto" or one of jvm_flags.PROFILES
+            extra_args: Additional JVM flags, added after the profile's ([] clears them)
+            cds: Enable/disable the AppCDS archive
+
+        Returns:
+            True if saved, False otherwise
+        """
+        if profile is not None and profile != jvm_flags.PROFILE_AUTO and profile not in jvm_flags.PROFILES:
+            print(f"Error saving JVM settings: unknown profile {profile}")
+            return False
+        current = self.get_jvm_settings()
+        profile = current["profile"] if profile is None else profile
+        extra_args = current["extra_args"] if extra_args is None else extra_args
+        cds = current["cds"] if cds is None else cds
+        try:
+            with open(os.path.join(self.server_folder, self.JVM_SETTINGS_FILE), 'w', encoding='utf-8') as f:
+                json.dump({"profile": profile, "extra_args": list(extra_args), "cds": cds}, f, indent=2)
+            if not cds:
+                self.cds.clear()
+            return True
+        except Exception as e:
+            print(f"Error saving JVM settings: {e}")
+            return False
+
+    def build_jvm_args(
+        self,
+        ram_mb: int,
+        java_executable: Optional[str] = None,
+        include_gc: bool = True,
+        cds: bool = True
+    ) -> List[str]:
+        """
+        JVM flags for this server: heap, headless mode, GC profile, CDS and extra flags
+
+        Args:
+            ram_mb: RAM en MB
+            java_executable: Java used for the launch (default: self.java_executable)
+            include_gc: False when the user already chose a GC (user_jvm_args.txt)
+            cds: False for runs that are killed early (file generation), which
+                would record a truncated archive
+
+        Returns:
+            Flags to put between the java executable and -jar/@args
+        """
+        java_executable = java_executable or self.java_executable
+        java_major = jvm_flags.java_major_version(java_executable)
+        settings = self.get_jvm_settings()
+        args = jvm_flags.build_jvm_args(
+            ram_mb,
+            java_major,
+            settings["profile"],
+            settings["extra_args"],
+            include_gc
+        )
+        if cds and settings["cds"]:
+            # Heap and GC flags come first; the archive is checked against the same runtime
+            args[3:3] = self.cds.prepare(java_executable, java_major)
+        else:
+            self.cds.state = None
+        return args
+
+    def jvm_profile(self, ram_mb: int, java_executable: Optional[str] = None) -> str:
+        """Profile used for a launch with this RAM ("auto" resolved to the chosen one)"""
+        profile = self.get_jvm_settings()["profile"]
+        if profile == jvm_flags.PROFILE_AUTO:
+            java_major = jvm_flags.java_major_version(java_executable or self.java_executable)
+            profile = jvm_flags.select_profile(java_major, ram_mb)
+        return profile
+
+    def _log_cds_state(self, log_callback: Callable[[str], None]):
+        if self.cds.state == CdsArchive.STATE_USING:
+            log_callback("[OK] Using class data sharing archive for faster startup\n")
+        elif self.cds.state == CdsArchive.STATE_TRAINING:
+            log_callback("Recording class data sharing archive (used from the next start, after a clean stop)\n")
+
+    def _write_user_jvm_args(self, ram_mb: int, java_executable: str, cds: bool = True) -> str:
+        """
+        Writes PyCraft's flags into user_jvm_args.txt (Forge/NeoForge)
+
+        The flags go in a marked block that is replaced on every start; the
+        user's own lines are kept, minus heap sizes (PyCraft's RAM setting
+        wins). If the user's lines pick a garbage collector, the profile's GC
+        flags are left out so the two don't conflict.
+
+        Returns:
+            Path to user_jvm_args.txt
+        """
+        import re
+        path = os.path.join(self.server_folder, "user_jvm_args.txt")
+        user_lines = []
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                in_block = False
+                for line in f.read().splitlines():
+                    if line.strip() == self.USER_JVM_ARGS_BEGIN:
+                        in_block = True
+                    elif line.strip() == self.USER_JVM_ARGS_END:
+                        in_block = False
+                    elif not in_block:
+                        if not line.lstrip().startswith('#'):
+                            line = re.sub(r'(?<!\S)(-Xm[sx]\d+[KkMmGg]?|-Djava\.awt\.headless=\S*)(?!\S)', '', line).strip()
+                            if not line.strip():
+                                continue
+                        user_lines.append(line)
+        while user_lines and not user_lines[-1].strip():
+            user_lines.pop()
+
+        user_gc = any(
+            jvm_flags.GC_SELECTION.search(line) for line in user_lines if not line.lstrip().startswith('#')
+        )
+        flags = self.build_jvm_args(ram_mb, java_executable, include_gc=not user_gc, cds=cds)
+
+        lines = user_lines + ([""] if user_lines else [])
+        lines += [self.USER_JVM_ARGS_BEGIN, *flags, self.USER_JVM_ARGS_END]
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    # ==================== DIRECT LAUNCH ====================
+
+    STOP_TIMEOUT = 30  # Seconds a directly launched JVM gets to save and exit after "stop"
+
+    @staticmethod
+    def _with_nogui(command: List[str]) -> List[str]:
+        if not any(arg.lstrip('-').lower() == "nogui" for arg in command[1:]):
+            command.append("nogui")
+        return command
+
+    def _direct_script_command(
+        self,
+        script_path: str,
+        ram_mb: int,
+        java_executable: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        cds: bool = True
+    ) -> Optional[List[str]]:
+        """
+        Java command equivalent to a run script (run.sh/run.bat)
+
+        Launching the JVM directly leaves a single process to supervise and
+        stop, skips the shell and the script's own Java detection, and puts
+        PyCraft's JVM flags in control.
+
+        Returns:
+            Command list, or None if the script can't be resolved (run it instead)
+        """
+        args = self.launch_resolver.resolve_script(script_path)
+        if args is None:
+            return None
+        if self.launch_resolver.uses_user_jvm_args(args):
+            # Heap, GC and CDS flags reach the JVM through user_jvm_args.txt
+            self._write_user_jvm_args(ram_mb, java_executable, cds=cds)
+            command = [java_executable, *args]
+        else:
+            command = [java_executable, *self.build_jvm_args(ram_mb, java_executable, cds=cds), *args]
+        if log_callback:
+            log_callback(f"Launching Java directly (resolved from {os.path.basename(script_path)})...\n")
+        return self._with_nogui(command)
+
+    SCRIPT_EXTENSIONS = ('.sh', '.bat', '.cmd', '.ps1')
+
+    def _script_reads_user_jvm_args(self, script_path: str) -> bool:
+        """Whether a start script (or the run.sh/run.bat it calls) takes its JVM flags from user_jvm_args.txt"""
+        try:
+            with open(script_path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            return False
+        if "user_jvm_args.txt" in text:
+            return True
+        folder = os.path.dirname(script_path)
+        for name in ("run.sh", "run.bat"):
+            nested = os.path.join(folder, name)
+            if name in text and os.path.abspath(nested) != os.path.abspath(script_path) and os.path.exists(nested):
+                return self._script_reads_user_jvm_args(nested)
+        return False
+
+    def _prepare_script_launch(
+        self,
+        command: List[str],
+        ram_mb: int,
+        java_executable: str,
+        log_callback: Optional[Callable[[str], None]] = None,
+        cds: bool = True
+    ) -> None:
+        """
+        Applies PyCraft's JVM flags to a server started through a script
+
+        Direct Java commands already carry the flags. A script that reads
+        user_jvm_args.txt gets them through that file, written just before the
+        launch; any other script picks its own flags, which is logged.
+        """
+        script = next(
+            (arg for arg in reversed(command)
+             if arg.lower().endswith(self.SCRIPT_EXTENSIONS) and os.path.isfile(arg)),
+            None
+        )
+        if script is None:
+            return
+        name = os.path.basename(script)
+        if self._script_reads_user_jvm_args(script):
+            self._write_user_jvm_args(ram_mb, java_executable, cds=cds)
+            if log_callback:
+                log_callback(f"JVM flags passed to {name} through user_jvm_args.txt\n")
+        elif log_callback:
+            log_callback(
+                f"⚠ {name} sets its own JVM flags: PyCraft's RAM ({ram_mb} MB) and JVM profile are not applied\n"
+            )
+
+    def _args_file_command(self, java_executable: str, user_jvm_args_path: str, args_file_path: str) -> List[str]:
+        """Java command for Forge/NeoForge from user_jvm_args.txt and libraries/.../unix_args.txt"""
+        args = self.launch_resolver.resolve_argfile(args_file_path)
+        if args is None:
+            return self._with_nogui([java_executable, f"@{user_jvm_args_path}", f"@{args_file_path}"])
+        return self._with_nogui([java_executable, f"@{user_jvm_args_path}", *args])
+
     # ==================== SOPORTE PARA MODPACKS ====================
 
     def detect_server_type(self) -> str:
@@ -1944,7 +2361,8 @@ max-world-size=29999984
         java_executable: str = "java",
         log_callback: Optional[Callable[[str], None]] = None,
         detached: bool = False,
-        on_stopped: Optional[Callable[[], None]] = None
+        on_stopped: Optional[Callable[[], None]] = None,
+        on_ready: Optional[Callable[[], None]] = None
     ) -> bool:
         """
         Inicia un servidor con mods (Forge, Fabric, NeoForge o Quilt)
@@ -1956,6 +2374,7 @@ max-world-size=29999984
             log_callback: Función callback para recibir logs del servidor
             detached: Si es True, el servidor se ejecuta en segundo plano
             on_stopped: Callback que se llama cuando el servidor se detiene (solo en modo detached)
+            on_ready: Callback que se llama una vez cuando el servidor termina de arrancar (solo en modo detached)
 
         Returns:
             True si el servidor se inició correctamente
@@ -1983,8 +2402,7 @@ max-world-size=29999984
             if log_callback:
                 log_callback("[OK] Configuration completed\n\n")
 
-            ram_min = f"-Xms{ram_mb}M"
-            ram_max = f"-Xmx{ram_mb}M"
+            jvm_args = self.build_jvm_args(ram_mb, java_executable)
 
             if server_type == "fabric":
                 # Fabric uses fabric-server-launcher.jar (or fabric-server-launch.jar in older versions)
@@ -2001,7 +2419,7 @@ max-world-size=29999984
 
                 if fabric_jar_path:
                     # Found Fabric jar - use it directly
-                    command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", fabric_jar, "nogui"]
+                    command = [java_executable, *jvm_args, "-jar", fabric_jar, "nogui"]
                 else:
                     # No Fabric jar found - try to install it automatically
                     # This avoids using problematic .bat/.ps1 scripts from ServerPackCreator
@@ -2048,7 +2466,7 @@ max-world-size=29999984
                                 else:
                                     fabric_jar = "fabric-server-launcher.jar"
 
-                                command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", fabric_jar, "nogui"]
+                                command = [java_executable, *jvm_args, "-jar", fabric_jar, "nogui"]
                                 if log_callback:
                                     log_callback(f"Fabric installed successfully. Using {fabric_jar}\n")
                             else:
@@ -2067,29 +2485,8 @@ max-world-size=29999984
             elif server_type == "forge":
                 # Forge uses argument files (@user_jvm_args.txt, @win_args.txt)
 
-                # First, modify or create user_jvm_args.txt with RAM settings
-                user_jvm_args_path = os.path.join(self.server_folder, "user_jvm_args.txt")
-
-                # Create default user_jvm_args.txt if it doesn't exist
-                if not os.path.exists(user_jvm_args_path):
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(f"-Djava.awt.headless=true\n-Xms{ram_mb}M\n-Xmx{ram_mb}M\n")
-                else:
-                    # Read and modify JVM arguments
-                    with open(user_jvm_args_path, 'r', encoding='utf-8') as f:
-                        jvm_args = f.read()
-
-                    # Replace RAM arguments
-                    import re
-                    jvm_args = re.sub(r'-Xmx\d+[MGmg]', f'-Xmx{ram_mb}M', jvm_args)
-                    jvm_args = re.sub(r'-Xms\d+[MGmg]', f'-Xms{ram_mb}M', jvm_args)
-
-                    # Add headless mode to prevent server GUI window from opening
-                    if '-Djava.awt.headless=true' not in jvm_args:
-                        jvm_args = '-Djava.awt.headless=true\n' + jvm_args
-
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(jvm_args)
+                # First, write RAM and GC flags into user_jvm_args.txt
+                user_jvm_args_path = self._write_user_jvm_args(ram_mb, java_executable)
 
                 # Find win_args.txt or unix_args.txt
                 forge_path = os.path.join(self.server_folder, "libraries", "net", "minecraftforge", "forge")
@@ -2148,25 +2545,27 @@ max-world-size=29999984
                                     log_callback(f"Error running installer: {e}\n")
                                 return False
 
-                            # After installation, use run.bat/run.sh
+                            # After installation, use run.bat/run.sh (both read user_jvm_args.txt)
+                            self._write_user_jvm_args(ram_mb, java_executable)
                             run_bat = os.path.join(self.server_folder, "run.bat")
                             run_sh = os.path.join(self.server_folder, "run.sh")
                             if os.name == 'nt' and os.path.exists(run_bat):
-                                command = ["cmd", "/c", run_bat]
+                                command = (self._direct_script_command(run_bat, ram_mb, java_executable, log_callback)
+                                           or ["cmd", "/c", run_bat])
                             elif os.path.exists(run_sh):
-                                command = ["bash", run_sh]
+                                command = (self._direct_script_command(run_sh, ram_mb, java_executable, log_callback)
+                                           or ["bash", run_sh])
                             else:
                                 # Try to find the actual server jar in libraries
                                 args_file = "win_args.txt" if os.name == 'nt' else "unix_args.txt"
                                 for root, dirs, files in os.walk(libraries_folder):
                                     if args_file in files:
                                         args_file_path = os.path.join(root, args_file)
-                                        user_jvm = os.path.join(self.server_folder, "user_jvm_args.txt")
-                                        command = [java_executable, f"@{user_jvm}", f"@{args_file_path}"]
+                                        command = self._args_file_command(java_executable, user_jvm_args_path, args_file_path)
                                         break
                         else:
                             # Not an installer or already installed, run directly
-                            command = [java_executable, f"-Xms{ram_mb}M", f"-Xmx{ram_mb}M", "-Djava.awt.headless=true", "-jar", forge_jar, "nogui"]
+                            command = [java_executable, *jvm_args, "-jar", forge_jar, "nogui"]
                     else:
                         # Fallback 2: Check for ServerPackCreator format or other modpack formats
                         # Instead of running their buggy scripts, we run Java directly
@@ -2200,19 +2599,8 @@ max-world-size=29999984
                                     pass
 
                             # Build command - server.jar from NeoForge/Forge handles everything
-                            command = [
-                                java_executable,
-                                f"-Xms{ram_mb}M",
-                                f"-Xmx{ram_mb}M",
-                                "-Djava.awt.headless=true",
-                            ]
-
-                            # Add user_jvm_args.txt if it exists
-                            user_jvm_args = os.path.join(self.server_folder, "user_jvm_args.txt")
-                            if os.path.exists(user_jvm_args):
-                                command.append(f"@user_jvm_args.txt")
-
-                            command.extend(["-jar", jar_to_run, "nogui"])
+                            # (user_jvm_args.txt already holds the RAM and GC flags)
+                            command = [java_executable, f"@{user_jvm_args_path}", "-jar", jar_to_run, "nogui"]
 
                             if log_callback:
                                 log_callback(f"Java: {java_executable}\n")
@@ -2265,46 +2653,15 @@ max-world-size=29999984
                                     log_callback("Error: No server files found. Try running the modpack installer first.\n")
                                 return False
                 else:
-                    # Add nogui to the args file if not present
-                    try:
-                        with open(args_file_path, 'r', encoding='utf-8') as f:
-                            args_content = f.read()
-                        if 'nogui' not in args_content.lower():
-                            with open(args_file_path, 'a', encoding='utf-8') as f:
-                                f.write('\nnogui\n')
-                    except Exception:
-                        pass
-
-                    # Build command using @ for argument files
-                    command = [
-                        java_executable,
-                        f"@{user_jvm_args_path}",
-                        f"@{args_file_path}"
-                    ]
+                    # Run Java directly with the args file's contents (plus nogui)
+                    command = self._args_file_command(java_executable, user_jvm_args_path, args_file_path)
 
             elif server_type == "neoforge":
                 # NeoForge uses similar structure to modern Forge
                 # Check for libraries/net/neoforged/neoforge/ folder
 
-                user_jvm_args_path = os.path.join(self.server_folder, "user_jvm_args.txt")
-
                 # Create or update user_jvm_args.txt
-                if not os.path.exists(user_jvm_args_path):
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(f"-Djava.awt.headless=true\n-Xms{ram_mb}M\n-Xmx{ram_mb}M\n")
-                else:
-                    with open(user_jvm_args_path, 'r', encoding='utf-8') as f:
-                        jvm_args = f.read()
-
-                    import re
-                    jvm_args = re.sub(r'-Xmx\d+[MGmg]', f'-Xmx{ram_mb}M', jvm_args)
-                    jvm_args = re.sub(r'-Xms\d+[MGmg]', f'-Xms{ram_mb}M', jvm_args)
-
-                    if '-Djava.awt.headless=true' not in jvm_args:
-                        jvm_args = '-Djava.awt.headless=true\n' + jvm_args
-
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(jvm_args)
+                user_jvm_args_path = self._write_user_jvm_args(ram_mb, java_executable)
 
                 # Find NeoForge args file
                 neoforge_path = os.path.join(self.server_folder, "libraries", "net", "neoforged", "neoforge")
@@ -2321,21 +2678,7 @@ max-world-size=29999984
                                 break
 
                 if args_file_path:
-                    # Add nogui if not present
-                    try:
-                        with open(args_file_path, 'r', encoding='utf-8') as f:
-                            args_content = f.read()
-                        if 'nogui' not in args_content.lower():
-                            with open(args_file_path, 'a', encoding='utf-8') as f:
-                                f.write('\nnogui\n')
-                    except Exception:
-                        pass
-
-                    command = [
-                        java_executable,
-                        f"@{user_jvm_args_path}",
-                        f"@{args_file_path}"
-                    ]
+                    command = self._args_file_command(java_executable, user_jvm_args_path, args_file_path)
                 else:
                     # Fallback: Check for run.bat/run.sh, start.bat/start.sh, or startserver.bat/startserver.sh
                     run_bat = os.path.join(self.server_folder, "run.bat")
@@ -2347,11 +2690,13 @@ max-world-size=29999984
 
                     if os.name == 'nt':
                         if os.path.exists(run_bat):
-                            # Patch the batch script to use correct Java
-                            self._patch_serverpack_bat(run_bat, java_executable, log_callback)
-                            if log_callback:
-                                log_callback("Using run.bat for NeoForge...\n")
-                            command = ["cmd", "/c", run_bat]
+                            command = self._direct_script_command(run_bat, ram_mb, java_executable, log_callback)
+                            if command is None:
+                                # Patch the batch script to use correct Java
+                                self._patch_serverpack_bat(run_bat, java_executable, log_callback)
+                                if log_callback:
+                                    log_callback("Using run.bat for NeoForge...\n")
+                                command = ["cmd", "/c", run_bat]
                         elif os.path.exists(start_bat):
                             # Patch the batch script to use correct Java
                             self._patch_serverpack_bat(start_bat, java_executable, log_callback)
@@ -2370,9 +2715,11 @@ max-world-size=29999984
                             return False
                     else:
                         if os.path.exists(run_sh):
-                            if log_callback:
-                                log_callback("Using run.sh for NeoForge...\n")
-                            command = ["bash", run_sh]
+                            command = self._direct_script_command(run_sh, ram_mb, java_executable, log_callback)
+                            if command is None:
+                                if log_callback:
+                                    log_callback("Using run.sh for NeoForge...\n")
+                                command = ["bash", run_sh]
                         elif os.path.exists(start_sh):
                             if log_callback:
                                 log_callback("Using start.sh for NeoForge...\n")
@@ -2392,7 +2739,7 @@ max-world-size=29999984
                 quilt_jar_path = os.path.join(self.server_folder, quilt_jar)
 
                 if os.path.exists(quilt_jar_path):
-                    command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", quilt_jar, "nogui"]
+                    command = [java_executable, *jvm_args, "-jar", quilt_jar, "nogui"]
                 else:
                     # Fallback: Check for start scripts or other quilt jars
                     start_bat = os.path.join(self.server_folder, "start.bat")
@@ -2406,7 +2753,7 @@ max-world-size=29999984
                         quilt_jar = os.path.basename(quilt_jars[0])
                         if log_callback:
                             log_callback(f"Using {quilt_jar}...\n")
-                        command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", quilt_jar, "nogui"]
+                        command = [java_executable, *jvm_args, "-jar", quilt_jar, "nogui"]
                     elif os.name == 'nt' and os.path.exists(start_bat):
                         # Patch the batch script to use correct Java
                         self._patch_serverpack_bat(start_bat, java_executable, log_callback)
@@ -2427,10 +2774,14 @@ max-world-size=29999984
                     log_callback(f"Error: Server type '{server_type}' not supported\n")
                 return False
 
+            self._prepare_script_launch(command, ram_mb, java_executable, log_callback)
+
             if detached:
                 if log_callback:
                     log_callback(f"Iniciando servidor {server_type} en segundo plano...\n")
                     log_callback(f"RAM asignada: {ram_mb} MB\n")
+                    log_callback(f"Perfil JVM: {self.jvm_profile(ram_mb, java_executable)}\n")
+                    self._log_cds_state(log_callback)
 
                 # Configurar flags para Windows (evitar ventana CMD extra)
                 creation_flags = 0
@@ -2452,34 +2803,12 @@ max-world-size=29999984
                     # Prepend Java bin to PATH so it's found first
                     env['PATH'] = java_bin_dir + os.pathsep + env.get('PATH', '')
 
-                self.server_process = subprocess.Popen(
-                    command,
-                    cwd=self.server_folder,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    stdin=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    creationflags=creation_flags,
-                    env=env
+                # El supervisor lee los logs y detecta la salida del proceso
+                self._launch_detached(
+                    command, log_callback, on_ready, on_stopped,
+                    env=env, creation_flags=creation_flags
                 )
 
-                # Leer logs en un hilo separado
-                def read_output():
-                    try:
-                        if log_callback and self.server_process and self.server_process.stdout:
-                            for line in self.server_process.stdout:
-                                log_callback(line)
-                    except Exception:
-                        pass
-                    finally:
-                        # Server process has ended - call the on_stopped callback
-                        if on_stopped:
-                            on_stopped()
-
-                thread = threading.Thread(target=read_output, daemon=True)
-                thread.start()
-
                 if log_callback:
                     log_callback("Servidor iniciado!\n")
                 return True
@@ -2637,8 +2966,7 @@ max-world-size=29999984
             check_for: Archivo a buscar para terminar antes
         """
         try:
-            ram_min = f"-Xms{ram_mb}M"
-            ram_max = f"-Xmx{ram_mb}M"
+            jvm_args = self.build_jvm_args(ram_mb, java_executable, cds=False)
 
             if server_type == "fabric":
                 # Check for common Fabric jar names
@@ -2652,7 +2980,7 @@ max-world-size=29999984
                         break
 
                 if fabric_jar_path:
-                    command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", fabric_jar, "nogui"]
+                    command = [java_executable, *jvm_args, "-jar", fabric_jar, "nogui"]
                 else:
                     # No Fabric jar found - install it automatically
                     if log_callback:
@@ -2692,7 +3020,7 @@ max-world-size=29999984
                                         break
                                 else:
                                     fabric_jar = "fabric-server-launcher.jar"
-                                command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", fabric_jar, "nogui"]
+                                command = [java_executable, *jvm_args, "-jar", fabric_jar, "nogui"]
                                 if log_callback:
                                     log_callback(f"Fabric installed successfully. Using {fabric_jar}\n")
                             else:
@@ -2710,25 +3038,7 @@ max-world-size=29999984
 
             elif server_type == "forge":
                 # Modify or create user_jvm_args.txt
-                user_jvm_args_path = os.path.join(self.server_folder, "user_jvm_args.txt")
-
-                # Create default user_jvm_args.txt if it doesn't exist
-                if not os.path.exists(user_jvm_args_path):
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(f"-Djava.awt.headless=true\n-Xms{ram_mb}M\n-Xmx{ram_mb}M\n")
-                else:
-                    with open(user_jvm_args_path, 'r', encoding='utf-8') as f:
-                        jvm_args = f.read()
-                    import re
-                    jvm_args = re.sub(r'-Xmx\d+[MGmg]', f'-Xmx{ram_mb}M', jvm_args)
-                    jvm_args = re.sub(r'-Xms\d+[MGmg]', f'-Xms{ram_mb}M', jvm_args)
-
-                    # Add headless mode to prevent server GUI window from opening
-                    if '-Djava.awt.headless=true' not in jvm_args:
-                        jvm_args = '-Djava.awt.headless=true\n' + jvm_args
-
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(jvm_args)
+                user_jvm_args_path = self._write_user_jvm_args(ram_mb, java_executable, cds=False)
 
                 # Find win_args.txt or unix_args.txt
                 forge_path = os.path.join(self.server_folder, "libraries", "net", "minecraftforge", "forge")
@@ -2745,17 +3055,7 @@ max-world-size=29999984
                                 break
 
                 if args_file_path:
-                    # Add nogui to the args file if not present
-                    try:
-                        with open(args_file_path, 'r', encoding='utf-8') as f:
-                            args_content = f.read()
-                        if 'nogui' not in args_content.lower():
-                            with open(args_file_path, 'a', encoding='utf-8') as f:
-                                f.write('\nnogui\n')
-                    except Exception:
-                        pass
-
-                    command = [java_executable, f"@{user_jvm_args_path}", f"@{args_file_path}"]
+                    command = self._args_file_command(java_executable, user_jvm_args_path, args_file_path)
                 else:
                     # Fallback: try to run with direct jar
                     if log_callback:
@@ -2764,7 +3064,7 @@ max-world-size=29999984
                     forge_jars = glob.glob(os.path.join(self.server_folder, "forge-*.jar"))
                     if forge_jars:
                         forge_jar = os.path.basename(forge_jars[0])
-                        command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", forge_jar, "nogui"]
+                        command = [java_executable, *jvm_args, "-jar", forge_jar, "nogui"]
                     else:
                         if log_callback:
                             log_callback("Error: No Forge server files found\n")
@@ -2772,21 +3072,7 @@ max-world-size=29999984
 
             elif server_type == "neoforge":
                 # NeoForge - similar to Forge
-                user_jvm_args_path = os.path.join(self.server_folder, "user_jvm_args.txt")
-
-                if not os.path.exists(user_jvm_args_path):
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(f"-Djava.awt.headless=true\n-Xms{ram_mb}M\n-Xmx{ram_mb}M\n")
-                else:
-                    with open(user_jvm_args_path, 'r', encoding='utf-8') as f:
-                        jvm_args = f.read()
-                    import re
-                    jvm_args = re.sub(r'-Xmx\d+[MGmg]', f'-Xmx{ram_mb}M', jvm_args)
-                    jvm_args = re.sub(r'-Xms\d+[MGmg]', f'-Xms{ram_mb}M', jvm_args)
-                    if '-Djava.awt.headless=true' not in jvm_args:
-                        jvm_args = '-Djava.awt.headless=true\n' + jvm_args
-                    with open(user_jvm_args_path, 'w', encoding='utf-8') as f:
-                        f.write(jvm_args)
+                user_jvm_args_path = self._write_user_jvm_args(ram_mb, java_executable, cds=False)
 
                 neoforge_path = os.path.join(self.server_folder, "libraries", "net", "neoforged", "neoforge")
                 args_file_path = None
@@ -2802,25 +3088,20 @@ max-world-size=29999984
                                 break
 
                 if args_file_path:
-                    try:
-                        with open(args_file_path, 'r', encoding='utf-8') as f:
-                            args_content = f.read()
-                        if 'nogui' not in args_content.lower():
-                            with open(args_file_path, 'a', encoding='utf-8') as f:
-                                f.write('\nnogui\n')
-                    except Exception:
-                        pass
-                    command = [java_executable, f"@{user_jvm_args_path}", f"@{args_file_path}"]
+                    command = self._args_file_command(java_executable, user_jvm_args_path, args_file_path)
                 else:
                     # Fallback to scripts
                     run_bat = os.path.join(self.server_folder, "run.bat")
                     run_sh = os.path.join(self.server_folder, "run.sh")
                     if os.name == 'nt' and os.path.exists(run_bat):
-                        # Patch the batch script to use correct Java
-                        self._patch_serverpack_bat(run_bat, java_executable, log_callback)
-                        command = ["cmd", "/c", run_bat]
+                        command = self._direct_script_command(run_bat, ram_mb, java_executable, log_callback, cds=False)
+                        if command is None:
+                            # Patch the batch script to use correct Java
+                            self._patch_serverpack_bat(run_bat, java_executable, log_callback)
+                            command = ["cmd", "/c", run_bat]
                     elif os.path.exists(run_sh):
-                        command = ["bash", run_sh]
+                        command = (self._direct_script_command(run_sh, ram_mb, java_executable, log_callback, cds=False)
+                                   or ["bash", run_sh])
                     else:
                         if log_callback:
                             log_callback("Error: No NeoForge server files found\n")
@@ -2832,13 +3113,13 @@ max-world-size=29999984
                 quilt_jar_path = os.path.join(self.server_folder, quilt_jar)
 
                 if os.path.exists(quilt_jar_path):
-                    command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", quilt_jar, "nogui"]
+                    command = [java_executable, *jvm_args, "-jar", quilt_jar, "nogui"]
                 else:
                     import glob
                     quilt_jars = glob.glob(os.path.join(self.server_folder, "quilt-server-*.jar"))
                     if quilt_jars:
                         quilt_jar = os.path.basename(quilt_jars[0])
-                        command = [java_executable, ram_min, ram_max, "-Djava.awt.headless=true", "-jar", quilt_jar, "nogui"]
+                        command = [java_executable, *jvm_args, "-jar", quilt_jar, "nogui"]
                     else:
                         start_bat = os.path.join(self.server_folder, "start.bat")
                         start_sh = os.path.join(self.server_folder, "start.sh")
@@ -2856,6 +3137,8 @@ max-world-size=29999984
             else:
                 return
 
+            self._prepare_script_launch(command, ram_mb, java_executable, log_callback, cds=False)
+
             # Configurar flags para Windows
             creation_flags = 0
             env = os.environ.copy()
@@ -2874,61 +3157,23 @@ max-world-size=29999984
                 env['JAVA'] = java_executable
                 env['PATH'] = java_bin_dir + os.pathsep + env.get('PATH', '')
 
-            process = subprocess.Popen(
-                command,
-                cwd=self.server_folder,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                creationflags=creation_flags,
-                env=env
-            )
-
-            start_time = time.time()
-            file_found = False
-
-            while True:
-                if process.poll() is not None:
-                    break
-
-                if check_for and not file_found:
-                    check_path = os.path.join(self.server_folder, check_for)
-                    if os.path.exists(check_path):
-                        # Wait for file to have content (not just exist)
-                        try:
-                            file_size = os.path.getsize(check_path)
-                            if file_size > 10:  # At least 10 bytes to ensure it's written
-                                file_found = True
-                                # Wait longer for the file to be completely written
-                                # and for server to finish its shutdown sequence
-                                time.sleep(3)
-                                # Check if process already exited naturally
-                                if process.poll() is None:
-                                    process.terminate()
-                                    try:
-                                        process.wait(timeout=10)
-                                    except subprocess.TimeoutExpired:
-                                        process.kill()
-                                break
-                        except OSError:
-                            pass  # File might be locked, retry next iteration
-
-                if time.time() - start_time > timeout:
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                    break
-
-                if process.stdout:
-                    line = process.stdout.readline()
-                    if line and log_callback:
-                        log_callback(line)
-
-                time.sleep(0.1)
+            # Output and exit are watched on the supervisor loop; this thread just waits
+            console = ConsoleBuffer(log_callback).start() if log_callback else None
+            try:
+                self._supervisor.run_until(
+                    command,
+                    cwd=self.server_folder,
+                    env=env,
+                    creationflags=creation_flags,
+                    on_line=console.push if console else None,
+                    timeout=timeout,
+                    until=(lambda: self._generated_file_ready(check_for)) if check_for else None,
+                    # Let the file be written completely and the server finish its startup step
+                    grace=3.0
+                )
+            finally:
+                if console:
+                    console.close()
 
         except FileNotFoundError as e:
             if log_callback:
@@ -0,0 +1,311 @@
+"""Several servers on one host: port allocation, shared lifecycle and status"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from ...utils import system_utils
+from .server_manager import ServerManager
+from .status import ServerStatus
+
+
+class ServerInstance:
+    """One server managed by a ServerPool"""
+
+    __slots__ = ("name", "manager", "ram_mb", "ports", "state", "started_at", "stopped_at")
+
+    # Lifecycle states
+    STOPPED = "stopped"
+    STARTING = "starting"
+    READY = "ready"
+    STOPPING = "stopping"
+    CRASHED = "crashed"
+
+    def __init__(self, name: str, manager: ServerManager, ram_mb: int, ports: Dict[str, int]):
+        self.name = name
+        self.manager = manager
+        self.ram_mb = ram_mb
+        self.ports = ports  # server.properties key -> port
+        self.state = self.STOPPED
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    @property
+    def folder(self) -> str:
+        return self.manager.server_folder
+
+    @property
+    def status(self) -> Optional[ServerStatus]:
+        return self.manager.last_status
+
+    def to_dict(self) -> Dict:
+        status = self.status
+        return {
+            "name": self.name,
+            "folder": self.folder,
+            "state": self.state,
+            "ports": dict(self.ports),
+            "ram_mb": self.ram_mb,
+            "startup_seconds": self.manager.startup_seconds,
+            "players_online": status.players_online if status and self.state == self.READY else 0,
+            "latency_ms": status.latency_ms if status and self.state == self.READY else None,
+            "version": status.version if status else "",
+        }
+
+    def __repr__(self) -> str:
+        return f"ServerInstance({self.name!r} {self.state} :{self.ports.get('server-port')})"
+
+
+class ServerPool:
+    """
+    Runs many Minecraft servers side by side
+
+    Every instance gets its own server-port, rcon.port and query.port (the
+    latter only used if enable-query is on), allocated from the base ports
+    upward so they don't collide with each other or with anything already
+    listening on the host, and written to its server.properties before each
+    start.
+
+    Bulk starts go through a concurrency limit: an instance holds its
+    startup slot until it is ready (or stops), so only a few servers load
+    worlds and mods from disk at the same time.
+    """
+
+    BASE_PORTS = {"server-port": 25565, "rcon.port": 25575, "query.port": 25585}
+    UDP_PORTS = {"query.port"}
+    DEFAULT_MAX_STARTING = 2
+    DEFAULT_START_TIMEOUT = 600.0
+
+    def __init__(self, max_starting: int = DEFAULT_MAX_STARTING):
+        self.instances: Dict[str, ServerInstance] = {}
+        self.max_starting = max_starting
+        self._lock = threading.RLock()
+
+    # ==================== INSTANCES ====================
+
+    def _allocate_ports(self, manager: ServerManager, exclude: str = "") -> Dict[str, int]:
+        """Picks ports for an instance, preferring the ones already in its server.properties"""
+        taken = {
+            port
+            for name, instance in self.instances.items() if name != exclude
+            for port in instance.ports.values()
+        }
+        ports = {}
+        for key, base in self.BASE_PORTS.items():
+            udp = key in self.UDP_PORTS
+            try:
+                configured = int(manager.get_property(key) or 0)
+            except ValueError:
+                configured = 0
+            if configured and configured not in taken and system_utils.is_port_available(configured, udp):
+                port = configured
+            else:
+                port = system_utils.find_free_port(base, taken, udp)
+            if port is None:
+                raise RuntimeError(f"No free port for {key} from {base}")
+            ports[key] = port
+            taken.add(port)
+        return ports
+
+    def add(
+        self,
+        name: str,
+        server_folder: str,
+        ram_mb: int = 2048,
+        java_executable: str = "java"
+    ) -> ServerInstance:
+        """
+        Registers a server folder with the pool and assigns its ports
+
+        Args:
+            name: Unique instance name
+            server_folder: Installed server folder
+            ram_mb: RAM to assign on start
+            java_executable: Java to run the server with
+
+        Returns:
+            The new ServerInstance
+        """
+        with self._lock:
+            if name in self.instances:
+                raise ValueError(f"Server instance already exists: {name}")
+            manager = ServerManager(server_folder, java_executable)
+            instance = ServerInstance(name, manager, ram_mb, self._allocate_ports(manager))
+            self.instances[name] = instance
+            return instance
+
+    def remove(self, name: str) -> bool:
+        """Removes a stopped instance from the pool"""
+        with self._lock:
+            instance = self.instances.get(name)
+            if not instance or instance.manager.is_server_running():
+                return False
+            del self.instances[name]
+            return True
+
+    def get(self, name: str) -> Optional[ServerInstance]:
+        return self.instances.get(name)
+
+    # ==================== LIFECYCLE ====================
+
+    def _prepare(self, instance: ServerInstance, log_callback: Optional[Callable[[str], None]]) -> bool:
+        """Re-checks the instance's ports and writes them to server.properties"""
+        manager = instance.manager
+        with self._lock:
+            # A port may have been taken by another program since it was assigned
+            if any(
+                not system_utils.is_port_available(port, key in self.UDP_PORTS)
+                for key, port in instance.ports.items()
+            ):
+                instance.ports = self._allocate_ports(manager, exclude=instance.name)
+
+        if not manager.ensure_server_properties(log_callback):
+            return False
+        for key, port in instance.ports.items():
+            if manager.get_property(key) != str(port) and not manager.update_property(key, str(port)):
+                return False
+        manager.enable_rcon(log_callback)
+        return True
+
+    def start(self, name: str, log_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Starts one instance in the background (returns once the process is launched)
+
+        Returns:
+            True if the server process started
+        """
+        instance = self.instances.get(name)
+        if not instance:
+            return False
+        manager = instance.manager
+        if manager.is_server_running():
+            return True
+
+        try:
+            if not self._prepare(instance, log_callback):
+                return False
+        except RuntimeError as e:
+            if log_callback:
+                log_callback(f"✗ {e}\n")
+            return False
+
+        def on_ready():
+            instance.state = ServerInstance.READY
+
+        def on_stopped():
+            server_log = manager.server_log
+            crashed = instance.state == ServerInstance.STARTING or bool(server_log and server_log.crash)
+            instance.state = ServerInstance.CRASHED if crashed else ServerInstance.STOPPED
+            instance.stopped_at = time.time()
+
+        instance.state = ServerInstance.STARTING
+        instance.started_at, instance.stopped_at = time.time(), None
+
+        server_type = manager.detect_server_type()
+        if server_type in ("forge", "fabric", "neoforge", "quilt"):
+            started = manager.start_modded_server(
+                server_type=server_type,
+                ram_mb=instance.ram_mb,
+                java_executable=manager.java_executable,
+                log_callback=log_callback,
+                detached=True,
+                on_stopped=on_stopped,
+                on_ready=on_ready
+            )
+        else:
+            started = manager.start_server(
+                ram_mb=instance.ram_mb,
+                log_callback=log_callback,
+                detached=True,
+                on_stopped=on_stopped,
+                on_ready=on_ready
+            )
+        if not started:
+            instance.state = ServerInstance.STOPPED
+        return started
+
+    def stop(self, name: str) -> bool:
+        instance = self.instances.get(name)
+        if not instance or not instance.manager.is_server_running():
+            return False
+        instance.state = ServerInstance.STOPPING
+        stopped = instance.manager.stop_server()
+        instance.state = ServerInstance.STOPPED
+        instance.stopped_at = time.time()
+        return stopped
+
+    def start_all(
+        self,
+        names: Optional[List[str]] = None,
+        max_starting: Optional[int] = None,
+        timeout: float = DEFAULT_START_TIMEOUT,
+        log_callback: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, bool]:
+        """
+        Starts several instances, at most max_starting booting at a time
+
+        Blocks until every instance is ready, has stopped or timed out.
+
+        Args:
+            names: Instances to start (default: all)
+            max_starting: Startup concurrency limit (default: self.max_starting)
+            timeout: Seconds to wait for each instance to become ready
+            log_callback: Receives (instance name, output)
+
+        Returns:
+            Dict of instance name -> True if it became ready
+        """
+        names = names if names is not None else list(self.instances)
+
+        def start_one(name: str) -> bool:
+            callback = (lambda text, name=name: log_callback(name, text)) if log_callback else None
+            if not self.start(name, callback):
+                return False
+            # Keep the startup slot until the server has finished loading
+            return self.instances[name].manager.wait_until_ready(timeout)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_starting or self.max_starting)) as executor:
+            results = dict(zip(names, executor.map(start_one, names)))
+        return results
+
+    def stop_all(self, names: Optional[List[str]] = None, max_stopping: int = 4) -> Dict[str, bool]:
+        """Stops running instances in parallel (each stop waits for the world save)"""
+        names = names if names is not None else [
+            name for name, instance in self.instances.items() if instance.manager.is_server_running()
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, max_stopping)) as executor:
+            return dict(zip(names, executor.map(self.stop, names)))
+
+    # ==================== STATUS ====================
+
+    def refresh(self, timeout: float = 2.0) -> Dict[str, Optional[ServerStatus]]:
+        """Pings every ready instance in parallel (updates their last status)"""
+        ready = [i for i in self.instances.values() if i.state == ServerInstance.READY and i.manager.is_server_running()]
+        if not ready:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(16, len(ready))) as executor:
+            statuses = executor.map(lambda i: i.manager.ping(timeout), ready)
+            return {instance.name: status for instance, status in zip(ready, statuses)}
+
+    def status(self) -> Dict:
+        """
+        Aggregate pool status
+
+        Returns:
+            Dict with per-state counts, total players and per-instance details
+        """
+        instances = [instance.to_dict() for instance in self.instances.values()]
+        states = {}
+        for info in instances:
+            states[info["state"]] = states.get(info["state"], 0) + 1
+        return {
+            "total": len(instances),
+            "states": states,
+            "players_online": sum(info["players_online"] for info in instances),
+            "ram_mb": sum(
+                info["ram_mb"] for info in instances
+                if info["state"] in (ServerInstance.STARTING, ServerInstance.READY)
+            ),
+            "instances": instances,
+        }
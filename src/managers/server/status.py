@@ -0,0 +1,195 @@
+"""Server List Ping (SLP): protocol-level status and readiness probe"""
+
+import json
+import socket
+import asyncio
+import struct
+import time
+from typing import Dict, List, Optional
+
+
+class ServerStatus:
+    """Reply to a Server List Ping"""
+
+    __slots__ = ("latency_ms", "version", "protocol", "players_online", "players_max", "players", "motd")
+
+    def __init__(
+        self,
+        latency_ms: float,
+        version: str = "",
+        protocol: int = -1,
+        players_online: int = 0,
+        players_max: int = 0,
+        players: Optional[List[str]] = None,
+        motd: str = ""
+    ):
+        self.latency_ms = latency_ms
+        self.version = version
+        self.protocol = protocol
+        self.players_online = players_online
+        self.players_max = players_max
+        self.players = players or []  # Sample of online player names (servers send at most 12)
+        self.motd = motd
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        True if the reply carries the server's version
+
+        Servers before 1.19.4 already answer while the world is loading, with
+        a status whose version is still unset; only a complete reply means
+        the server has finished starting.
+        """
+        return self.protocol >= 0 and bool(self.version)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"ServerStatus({self.version!r} {self.players_online}/{self.players_max} "
+                f"players, {self.latency_ms:.1f} ms)")
+
+
+def _varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed by server")
+        data += chunk
+    return data
+
+
+def _read_varint(sock: socket.socket) -> int:
+    value = 0
+    for shift in range(0, 35, 7):
+        byte = _read_exact(sock, 1)[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value - (1 << 32) if value & 0x80000000 else value
+    raise ValueError("VarInt too long")
+
+
+def _packet(packet_id: int, payload: bytes = b"") -> bytes:
+    data = _varint(packet_id) + payload
+    return _varint(len(data)) + data
+
+
+def _text(component) -> str:
+    """Flattens a chat component (MOTD) to plain text"""
+    if isinstance(component, str):
+        return component
+    if isinstance(component, dict):
+        return _text(component.get("text", "")) + "".join(_text(c) for c in component.get("extra", []))
+    if isinstance(component, list):
+        return "".join(_text(c) for c in component)
+    return ""
+
+
+def _handshake(host: str, port: int) -> bytes:
+    address = host.encode("utf-8")
+    handshake = (
+        _varint(-1)  # Protocol version: -1 = "just asking for status"
+        + _varint(len(address)) + address
+        + struct.pack(">H", port)
+        + _varint(1)  # Next state: status
+    )
+    return _packet(0x00, handshake) + _packet(0x00)
+
+
+def _status_from_json(data: Dict, latency_ms: float) -> ServerStatus:
+    version = data.get("version") or {}
+    players = data.get("players") or {}
+    return ServerStatus(
+        latency_ms=latency_ms,
+        version=version.get("name", ""),
+        protocol=version.get("protocol", -1),
+        players_online=players.get("online", 0),
+        players_max=players.get("max", 0),
+        players=[p.get("name", "") for p in players.get("sample") or [] if isinstance(p, dict)],
+        motd=_text(data.get("description", "")),
+    )
+
+
+def ping_server(host: str = "127.0.0.1", port: int = 25565, timeout: float = 2.0) -> Optional[ServerStatus]:
+    """
+    Sends a Server List Ping (Minecraft 1.7+) and returns the server's status
+
+    Since 1.19.4 a server only answers once it has finished loading. Older
+    servers answer during world loading too, with an empty status, so check
+    ServerStatus.is_complete before treating a reply as "players can join".
+
+    Args:
+        host: Server address
+        port: server-port
+        timeout: Seconds to wait for the whole exchange
+
+    Returns:
+        ServerStatus, or None if the server didn't answer
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.settimeout(timeout)
+            sock.sendall(_handshake(host, port))
+
+            _read_varint(sock)  # Packet length
+            if _read_varint(sock) != 0x00:
+                return None
+            data = json.loads(_read_exact(sock, _read_varint(sock)).decode("utf-8"))
+
+            # Latency from the ping/pong round trip
+            started = time.perf_counter()
+            sock.sendall(_packet(0x01, struct.pack(">q", int(started * 1000))))
+            _read_exact(sock, _read_varint(sock))
+            latency_ms = (time.perf_counter() - started) * 1000
+    except (OSError, ValueError, ConnectionError, struct.error):
+        return None
+
+    return _status_from_json(data, latency_ms)
+
+
+async def _read_varint_async(reader: asyncio.StreamReader) -> int:
+    value = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value - (1 << 32) if value & 0x80000000 else value
+    raise ValueError("VarInt too long")
+
+
+async def ping_server_async(host: str = "127.0.0.1", port: int = 25565, timeout: float = 2.0) -> Optional[ServerStatus]:
+    """ping_server() for asyncio code (no thread blocked while waiting)"""
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(_handshake(host, port))
+            await _read_varint_async(reader)  # Packet length
+            if await _read_varint_async(reader) != 0x00:
+                return None
+            data = json.loads((await reader.readexactly(await _read_varint_async(reader))).decode("utf-8"))
+
+            started = time.perf_counter()
+            writer.write(_packet(0x01, struct.pack(">q", int(started * 1000))))
+            await reader.readexactly(await _read_varint_async(reader))
+            return _status_from_json(data, (time.perf_counter() - started) * 1000)
+        finally:
+            writer.close()
+
+    try:
+        return await asyncio.wait_for(exchange(), timeout)
+    except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError, struct.error):
+        return None
@@ -0,0 +1,274 @@
+"""asyncio process supervisor: one event loop for every server process PyCraft runs"""
+
+import os
+import asyncio
+import locale
+import subprocess
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class SupervisedProcess:
+    """
+    Popen-compatible handle for a process running on the supervisor loop
+
+    Exposes what ServerManager uses of subprocess.Popen (pid, poll(), wait(),
+    terminate(), kill(), stdin.write()/flush()) so callers on other threads
+    don't need to know about asyncio. Output is delivered by the supervisor,
+    so there is no stdout attribute to read.
+    """
+
+    def __init__(self, supervisor: "ProcessSupervisor", process: asyncio.subprocess.Process, args):
+        self._supervisor = supervisor
+        self._process = process
+        self.args = args
+        self.pid = process.pid
+        self.returncode: Optional[int] = None
+        self.stdin = _StdinWriter(self)
+        self.stdout = None
+        self._exited = threading.Event()
+        # Resolved on the loop when the process exits (for async callers)
+        self.exit_future: "asyncio.Future[int]" = supervisor.loop.create_future()
+
+    def _set_exited(self, returncode: int):
+        self.returncode = returncode
+        self._exited.set()
+        if not self.exit_future.done():
+            self.exit_future.set_result(returncode)
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def _signal(self, method: str):
+        def send():
+            if self.returncode is None:
+                try:
+                    getattr(self._process, method)()
+                except ProcessLookupError:
+                    pass
+        self._supervisor.loop.call_soon_threadsafe(send)
+
+    def terminate(self):
+        self._signal("terminate")
+
+    def kill(self):
+        self._signal("kill")
+
+
+class _StdinWriter:
+    """Thread-safe text writer for a supervised process's stdin"""
+
+    def __init__(self, process: SupervisedProcess):
+        self._process = process
+
+    def write(self, text: str) -> int:
+        process = self._process
+        stdin = process._process.stdin
+        if process.returncode is not None or stdin is None or stdin.is_closing():
+            raise BrokenPipeError("Process stdin is closed")
+        data = text.encode(process._supervisor.encoding, errors="replace")
+        process._supervisor.loop.call_soon_threadsafe(stdin.write, data)
+        return len(text)
+
+    def flush(self):
+        # Writes are handed to the loop's transport, which sends them right away
+        pass
+
+
+class ProcessSupervisor:
+    """
+    Runs and watches server processes on a single asyncio event loop
+
+    The loop lives on one daemon thread shared by all ServerManagers: each
+    process costs an async stdout reader and an exit future instead of
+    reader threads and sleep/poll loops, so idle servers use no CPU and
+    exits are seen as soon as the OS reports them.
+
+    Blocking entry points (spawn(), run_until()) are meant for worker
+    threads; coroutines can also be scheduled directly with submit().
+    """
+
+    _shared: Optional["ProcessSupervisor"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.encoding = locale.getpreferredencoding(False) or "utf-8"
+        self._thread = threading.Thread(target=self._run_loop, name="ProcessSupervisor", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def shared(cls) -> "ProcessSupervisor":
+        """The process-wide supervisor (created on first use)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Awaitable):
+        """Schedules a coroutine on the supervisor loop; returns a concurrent Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    # ==================== PROCESSES ====================
+
+    async def _create(
+        self,
+        command: List[str],
+        cwd: str,
+        env: Optional[Dict[str, str]],
+        shell: bool,
+        creationflags: int,
+        with_stdin: bool
+    ) -> asyncio.subprocess.Process:
+        kwargs = dict(
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE if with_stdin else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1024 * 1024,  # Long stack-trace lines must not break the reader
+        )
+        if os.name == 'nt':
+            kwargs["creationflags"] = creationflags
+        if shell:
+            return await asyncio.create_subprocess_shell(subprocess.list2cmdline(command), **kwargs)
+        return await asyncio.create_subprocess_exec(*command, **kwargs)
+
+    async def _pump(self, process: asyncio.subprocess.Process, on_line: Optional[Callable[[str], None]]):
+        """Reads stdout line by line until EOF"""
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                return
+            if on_line:
+                try:
+                    on_line(line.decode(self.encoding, errors="replace").replace("\r\n", "\n"))
+                except Exception as e:
+                    print(f"Error handling server output: {e}")
+
+    async def _supervise(
+        self,
+        handle: SupervisedProcess,
+        on_line: Optional[Callable[[str], None]],
+        on_exit: Optional[Callable[[int], None]]
+    ):
+        process = handle._process
+        try:
+            await self._pump(process, on_line)
+        finally:
+            returncode = await process.wait()
+            handle._set_exited(returncode)
+            if on_exit:
+                try:
+                    on_exit(returncode)
+                except Exception as e:
+                    print(f"Error in server exit callback: {e}")
+
+    async def _spawn(self, command, cwd, env, shell, creationflags, on_line, on_exit, with_stdin=True) -> SupervisedProcess:
+        process = await self._create(command, cwd, env, shell, creationflags, with_stdin)
+        handle = SupervisedProcess(self, process, command)
+        self.loop.create_task(self._supervise(handle, on_line, on_exit))
+        return handle
+
+    def spawn(
+        self,
+        command: List[str],
+        cwd: str,
+        env: Optional[Dict[str, str]] = None,
+        shell: bool = False,
+        creationflags: int = 0,
+        on_line: Optional[Callable[[str], None]] = None,
+        on_exit: Optional[Callable[[int], None]] = None
+    ) -> SupervisedProcess:
+        """
+        Starts a long-running process (a detached server)
+
+        Args:
+            command: Command line
+            cwd: Working directory
+            env: Environment (None = inherit)
+            shell: Run through the shell (Windows .bat scripts)
+            creationflags: Windows process creation flags
+            on_line: Called on the supervisor thread for every output line
+            on_exit: Called on the supervisor thread with the exit code
+
+        Returns:
+            Popen-compatible handle
+
+        Raises:
+            FileNotFoundError/PermissionError: As subprocess.Popen would
+        """
+        future = self.submit(self._spawn(command, cwd, env, shell, creationflags, on_line, on_exit))
+        return future.result()
+
+    async def _run_until(
+        self,
+        command: List[str],
+        cwd: str,
+        env: Optional[Dict[str, str]],
+        creationflags: int,
+        on_line: Optional[Callable[[str], None]],
+        timeout: float,
+        until: Optional[Callable[[], bool]],
+        grace: float
+    ) -> Optional[int]:
+        finished = asyncio.Event()
+
+        def watch(line: str):
+            if on_line:
+                on_line(line)
+            # Completion checks follow the server's output instead of a timer
+            if until and not finished.is_set() and until():
+                finished.set()
+
+        handle = await self._spawn(command, cwd, env, False, creationflags, watch, None, with_stdin=False)
+        exit_waiter = asyncio.ensure_future(asyncio.shield(handle.exit_future))
+        done_waiter = asyncio.ensure_future(finished.wait())
+        await asyncio.wait({exit_waiter, done_waiter}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        done_waiter.cancel()
+
+        if handle.returncode is None:
+            if finished.is_set() and grace:
+                # Let the server finish writing what it was writing before stopping it
+                await asyncio.wait({exit_waiter}, timeout=grace)
+            for method, wait in (("terminate", 10.0), ("kill", 5.0)):
+                if handle.returncode is not None:
+                    break
+                handle._signal(method)
+                await asyncio.wait({exit_waiter}, timeout=wait)
+        exit_waiter.cancel()
+        return handle.returncode
+
+    def run_until(
+        self,
+        command: List[str],
+        cwd: str,
+        env: Optional[Dict[str, str]] = None,
+        creationflags: int = 0,
+        on_line: Optional[Callable[[str], None]] = None,
+        timeout: float = 30.0,
+        until: Optional[Callable[[], bool]] = None,
+        grace: float = 0.0
+    ) -> Optional[int]:
+        """
+        Runs a process until it exits, until() is true or timeout expires
+
+        until() is checked after each output line (so file checks run when
+        the server reports progress, not on a timer). When it returns True or
+        the timeout expires, the process is given `grace` seconds and then
+        terminated (killed if it doesn't exit).
+
+        Returns:
+            Exit code (None if it couldn't be stopped)
+        """
+        future = self.submit(self._run_until(command, cwd, env, creationflags, on_line, timeout, until, grace))
+        return future.result()
@@ -4,7 +4,7 @@ System utilities for validation and verification
 import os
 import time
 import socket
-from typing import Optional, Callable, Tuple
+from typing import Optional, Callable, Set, Tuple
 
 try:
     import psutil
@@ -196,15 +196,72 @@ def is_port_in_use(port: int) -> bool:
         return False
 
 
-def check_minecraft_port(log_callback: Optional[Callable[[str], None]] = None) -> None:
+def is_port_available(port: int, udp: bool = False) -> bool:
     """
-    Checks if port 25565 is occupied and warns
+    Checks if a port can be bound on all interfaces
+
+    Stricter than is_port_in_use: also catches ports held by processes that
+    don't accept connections (and UDP ports, e.g. query.port). Binds the way
+    the Java server does: with SO_REUSEADDR on Unix, so connections left in
+    TIME_WAIT by a server that just stopped don't count as "in use", and with
+    SO_EXCLUSIVEADDRUSE on Windows, where SO_REUSEADDR would let the probe
+    bind over a port another process is listening on.
+
+    Args:
+        port: Port number
+        udp: Check the UDP port instead of TCP
+
+    Returns:
+        True if a server could bind the port
+    """
+    kind = socket.SOCK_DGRAM if udp else socket.SOCK_STREAM
+    try:
+        with socket.socket(socket.AF_INET, kind) as s:
+            if os.name == 'nt':
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(('0.0.0.0', port))
+        return not (not udp and is_port_in_use(port))
+    except OSError:
+        return False
+
+
+def find_free_port(
+    start: int,
+    exclude: Optional[Set[int]] = None,
+    udp: bool = False,
+    limit: int = 1000
+) -> Optional[int]:
+    """
+    Finds the first bindable port from start upward
+
+    Args:
+        start: First port to try
+        exclude: Ports to skip (e.g. already assigned to other servers)
+        udp: Look for a free UDP port instead of TCP
+        limit: Number of ports to try
+
+    Returns:
+        Port number, or None if none is free in the range
+    """
+    exclude = exclude or set()
+    for port in range(start, min(start + limit, 65536)):
+        if port not in exclude and is_port_available(port, udp):
+            return port
+    return None
+
+
+def check_minecraft_port(log_callback: Optional[Callable[[str], None]] = None, port: int = 25565) -> None:
+    """
+    Checks if the server port is occupied and warns
 
     Args:
         log_callback: Callback function to report messages
+        port: Port to check (server-port)
     """
-    if is_port_in_use(25565):
-        msg = ("\n⚠️ WARNING: Port 25565 is already in use!\n"
+    if is_port_in_use(port):
+        msg = (f"\n⚠️ WARNING: Port {port} is already in use!\n"
                "  Possible causes:\n"
                "  • Another Minecraft server is running\n"
                "  • Another program is using the port\n"